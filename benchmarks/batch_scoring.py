@@ -0,0 +1,49 @@
+"""
+Batch Scoring Benchmark
+
+Re-scores N archived answer sheets of Q questions, once with Quiz.calculate_score()
+per sheet and once with Quiz.score_batch() on every available backend.
+
+Run from the folder that contains the App package:
+    python -m App.benchmarks.batch_scoring --sheets 100000 --questions 20
+"""
+
+import argparse
+import random
+import time
+
+from ..logic.models import Question
+from ..logic.quiz import Quiz
+from ..logic.scoring import np
+
+
+def main(argv=None):
+    """Command-line entry point: print re-scoring time per approach."""
+    parser = argparse.ArgumentParser(description="Benchmark batch re-scoring of answer sheets.")
+    parser.add_argument("--sheets", type=int, default=100_000)
+    parser.add_argument("--questions", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    questions = [Question(id=f"q{i}", text="Q?", options=["A", "B", "C", "D"], correct_index=rng.randrange(4))
+                 for i in range(args.questions)]
+    sheets = [[rng.choice((None, 0, 1, 2, 3)) for _ in questions] for _ in range(args.sheets)]
+
+    start = time.perf_counter()
+    quiz = Quiz(questions)
+    expected = []
+    for sheet in sheets:
+        quiz.user_answers = sheet
+        expected.append(quiz.calculate_score())
+    print(f"{'calculate_score':>16}: {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    for backend in ("array", "numpy") if np is not None else ("array",):
+        start = time.perf_counter()
+        batch = Quiz.score_batch(questions, sheets, backend=backend)
+        elapsed = time.perf_counter() - start
+        assert list(batch.scores) == expected
+        print(f"{'score_batch ' + backend:>16}: {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
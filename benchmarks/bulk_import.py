@@ -0,0 +1,55 @@
+"""
+Bulk Import Scaling Benchmark
+
+Times data.bulk_import on a synthetic bank with 1, 2, 4, ... worker processes
+(up to the number of CPUs) and prints the speed-up over a single worker.
+About 10% of the generated rows are invalid, so the rejection report is
+exercised too.
+
+Run from the folder that contains the App package:
+    python -m App.benchmarks.bulk_import --rows 2000000
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+
+from ..data.bulk_import import bulk_import
+
+
+def write_bank(path: str, rows: int):
+    """Write a synthetic questions CSV where every tenth row is invalid."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "text", "choices", "correct_index"])
+        for i in range(rows):
+            correct = 9 if i % 10 == 0 else i % 4
+            writer.writerow([f"q{i:08d}", f"Synthetic question {i}, \"quoted\"?", "A||B||C||D", correct])
+
+
+def main(argv=None):
+    """Command-line entry point: print import time per worker count."""
+    parser = argparse.ArgumentParser(description="Benchmark parallel bulk import.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "bank.csv")
+        write_bank(source, args.rows)
+        print(f"{args.rows} rows, {os.path.getsize(source) / 2**20:.0f} MiB")
+
+        baseline = None
+        workers = 1
+        while workers <= args.max_workers:
+            s = bulk_import(source, os.path.join(tmp, "clean.csv"), os.path.join(tmp, "rejects.csv"),
+                            workers=workers)
+            baseline = baseline or s.seconds
+            print(f"{workers:>3} workers: {s.seconds:7.2f}s  {s.rows / s.seconds:>12,.0f} rows/s  "
+                  f"speed-up {baseline / s.seconds:4.1f}x  ({s.rejected} rejected)")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
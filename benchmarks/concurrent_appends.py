@@ -0,0 +1,107 @@
+"""
+Concurrent Appends Benchmark
+
+Measures results-file append throughput as the number of writer processes
+grows, the way several kiosk App instances share one results.csv. Every writer
+uses CSVRepository with lock_writes=True and saves results one at a time via
+append_result(), just like the App does after each quiz.
+
+After each run the file is read back to check that no rows were lost or
+corrupted and that there is exactly one header row.
+
+Run from the folder that contains the App package:
+    python -m App.benchmarks.concurrent_appends --max-writers 8 --appends 2000
+"""
+
+import argparse
+import csv
+import multiprocessing
+import os
+import tempfile
+import time
+
+from ..data.repository import CSVRepository, RESULT_FIELDS
+from ..logic.models import Result
+
+
+def _writer(results_path: str, writer_id: int, appends: int, start_event):
+    """Append results from one process once every writer is ready."""
+    repo = CSVRepository("", results_path, lock_writes=True)
+    start_event.wait()
+    for i in range(appends):
+        repo.append_result(
+            Result(
+                user_name=f"writer{writer_id}",
+                score=i % 10,
+                total_questions=10,
+                time_taken=float(i),
+                timestamp="2026-01-01T00:00:00Z",
+            )
+        )
+
+
+def _check_file(results_path: str, expected_rows: int) -> bool:
+    """Return True if the file has one header and exactly expected_rows valid rows."""
+    with open(results_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    header, data = rows[0], rows[1:]
+    return (
+        header == RESULT_FIELDS
+        and len(data) == expected_rows
+        and all(len(row) == len(RESULT_FIELDS) and row[0].startswith("writer") for row in data)
+    )
+
+
+def run(writers: int, appends: int) -> dict:
+    """
+    Time `writers` processes each appending `appends` results to a fresh file.
+
+    Args:
+        writers (int): Number of concurrent writer processes
+        appends (int): Results appended by each process
+
+    Returns:
+        dict: writers, total appends, elapsed seconds, appends/sec and whether the
+              file was intact afterwards
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        results_path = os.path.join(tmp, "results.csv")
+        start_event = multiprocessing.Event()
+        procs = [
+            multiprocessing.Process(target=_writer, args=(results_path, w, appends, start_event))
+            for w in range(writers)
+        ]
+        for p in procs:
+            p.start()
+
+        start = time.perf_counter()
+        start_event.set()
+        for p in procs:
+            p.join()
+        elapsed = time.perf_counter() - start
+
+        total = writers * appends
+        return {
+            "writers": writers,
+            "appends": total,
+            "seconds": elapsed,
+            "appends_per_sec": total / elapsed if elapsed else float("inf"),
+            "intact": _check_file(results_path, total),
+        }
+
+
+def main(argv=None):
+    """Command-line entry point: print a throughput table for 1..N writers."""
+    parser = argparse.ArgumentParser(description="Benchmark concurrent result appends.")
+    parser.add_argument("--max-writers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--appends", type=int, default=1000, help="appends per writer process")
+    args = parser.parse_args(argv)
+
+    print(f"{'writers':>7} {'appends':>9} {'seconds':>9} {'appends/sec':>12} {'intact':>7}")
+    for writers in range(1, args.max_writers + 1):
+        r = run(writers, args.appends)
+        print(f"{r['writers']:>7} {r['appends']:>9} {r['seconds']:>9.3f} {r['appends_per_sec']:>12.0f} {str(r['intact']):>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Import Time Profile
+
+Measures what `import App.main` costs before the first window can be drawn, using
+Python's -X importtime flag in a fresh interpreter. Only the welcome screen and
+tkinter should show up here; the other screens, messagebox, the quiz logic and
+the data layer are imported lazily by main.App when they are first needed.
+
+Run from the folder that contains the App package:
+    python -m App.benchmarks.import_profile --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+def profile_imports(module: str, cwd: str | None = None) -> dict[str, int]:
+    """
+    Import a module in a fresh interpreter and return the cumulative import times.
+
+    Args:
+        module (str): Dotted module name to import, e.g. "App.main"
+        cwd (str | None): Directory to run the interpreter in (the folder that
+                          contains the package); None uses the current directory
+
+    Returns:
+        dict[str, int]: Cumulative import time in microseconds per imported module
+
+    Raises:
+        subprocess.CalledProcessError: If the import fails
+    """
+    env = dict(os.environ)
+    # Make sure the package is importable from cwd regardless of how we were started
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (cwd or os.getcwd(), env.get("PYTHONPATH")) if p)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True,
+    )
+
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <indented name>"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # the header line
+        times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+def main(argv=None):
+    """Command-line entry point: print the slowest imports of App.main."""
+    parser = argparse.ArgumentParser(description="Profile the imports done before the first window.")
+    parser.add_argument("--module", default="App.main")
+    parser.add_argument("--top", type=int, default=15, help="number of modules to list")
+    args = parser.parse_args(argv)
+
+    times = profile_imports(args.module)
+    print(f"import {args.module}: {times.get(args.module, 0) / 1000:.1f} ms cumulative, "
+          f"{len(times)} modules")
+    for name, us in sorted(times.items(), key=lambda kv: kv[1], reverse=True)[:args.top]:
+        print(f"{us / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Model Memory Benchmark
+
+Compares the memory used to hold N questions and N results as today's
+dataclasses (Question/Result), as slotted dataclasses (SlottedQuestion/
+SlottedResult), and as columnar QuestionBank/ResultTable. Memory is measured
+with tracemalloc while the records are built, so it covers every object that
+stays alive (instances, option lists, strings and arrays).
+
+Run from the folder that contains the App package:
+    python -m App.benchmarks.memory --count 500000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from ..logic.columnar import QuestionBank, ResultTable
+from ..logic.models import Question, Result, SlottedQuestion, SlottedResult
+
+# A small set of user names, as in a real results file where people retake quizzes
+USERS = [f"user{i}" for i in range(500)]
+
+
+def make_questions(n: int, slotted: bool = False):
+    """Yield n synthetic four-option questions (fresh strings, like parsed CSV rows)."""
+    for i in range(n):
+        options = [f"Option {c} for {i % 1000}" for c in "ABCD"]
+        if slotted:
+            yield SlottedQuestion(f"q{i:07d}", f"Synthetic question {i}?", tuple(options), i % 4)
+        else:
+            yield Question(f"q{i:07d}", f"Synthetic question {i}?", options, i % 4)
+
+
+def make_results(n: int, slotted: bool = False):
+    """Yield n synthetic results spread over USERS."""
+    cls = SlottedResult if slotted else Result
+    for i in range(n):
+        ts = f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}T12:{i % 60:02d}:{(i // 60) % 60:02d}Z"
+        # "".join makes a new string per row, as csv parsing would
+        yield cls("".join(USERS[i % len(USERS)]), i % 21, 20, float(i % 600), ts)
+
+
+def measure(build) -> tuple[int, object]:
+    """
+    Return the bytes still allocated after build() and the value it returned.
+    """
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, value
+
+
+def main(argv=None):
+    """Command-line entry point: print memory per representation."""
+    parser = argparse.ArgumentParser(description="Compare memory used by question/result representations.")
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args(argv)
+    n = args.count
+
+    cases = [
+        ("Question list", lambda: list(make_questions(n))),
+        ("SlottedQuestion list", lambda: list(make_questions(n, slotted=True))),
+        ("QuestionBank", lambda: QuestionBank.from_questions(make_questions(n))),
+        ("Result list", lambda: list(make_results(n))),
+        ("SlottedResult list", lambda: list(make_results(n, slotted=True))),
+        ("ResultTable", lambda: ResultTable.from_results(make_results(n))),
+    ]
+    print(f"{n} records each")
+    for label, build in cases:
+        size, value = measure(build)
+        print(f"{label:>22}: {size / 2**20:8.1f} MiB  ({size / n:6.1f} bytes/record)")
+        del value
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark Baselines
+
+Saves benchmark measurements as a JSON baseline and compares later runs with
+it. Used by benchmarks.suite; kept free of package imports so it can be tested
+on its own.
+
+A measurement is a dict of metric name to number for one case, e.g.
+{"latency_s": 0.12, "throughput": 8.3e5, "peak_bytes": 41000000}. Latency and
+memory regress when they go up, throughput when it goes down.
+"""
+
+import json
+import os
+
+# Metrics where a larger value is better; every other metric is better when smaller
+HIGHER_IS_BETTER = {"throughput"}
+
+
+def save_baseline(path: str, results: dict[str, dict[str, float]], meta: dict | None = None):
+    """
+    Write measurements to a baseline file, atomically.
+
+    Args:
+        path (str): Baseline JSON file to create or overwrite
+        results (dict[str, dict[str, float]]): Measurements per case name
+        meta (dict | None): Extra information to store alongside (e.g. Python version)
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta or {}, "results": results}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def load_baseline(path: str) -> dict[str, dict[str, float]]:
+    """
+    Read the measurements saved with save_baseline().
+
+    Raises:
+        FileNotFoundError: If the baseline doesn't exist
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare(baseline: dict[str, dict[str, float]], current: dict[str, dict[str, float]],
+            threshold: float = 0.2) -> list[str]:
+    """
+    Find metrics that got worse by more than the threshold.
+
+    Cases or metrics that only exist on one side are ignored, so adding a new
+    benchmark doesn't fail against an old baseline.
+
+    Args:
+        baseline (dict[str, dict[str, float]]): Saved measurements per case
+        current (dict[str, dict[str, float]]): This run's measurements per case
+        threshold (float): Allowed relative change, e.g. 0.2 = 20% slower/larger
+
+    Returns:
+        list[str]: One readable line per regression; empty if there are none
+    """
+    regressions = []
+    for case, metrics in sorted(current.items()):
+        base = baseline.get(case, {})
+        for name, value in sorted(metrics.items()):
+            old = base.get(name)
+            if not old:
+                continue
+            change = (value - old) / old
+            worse = -change if name in HIGHER_IS_BETTER else change
+            if worse > threshold:
+                regressions.append(f"{case} {name}: {old:.6g} -> {value:.6g} ({change:+.1%})")
+    return regressions
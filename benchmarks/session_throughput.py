@@ -0,0 +1,78 @@
+"""
+Session Throughput Benchmark
+
+Runs complete quiz sessions end to end (load questions, answer every question,
+finish, save the result) with the headless front-end, so it works on CI
+machines without a display. Every session goes through the real CSVRepository
+against temporary CSV files.
+
+Run from the folder that contains the App package:
+    python -m App.benchmarks.session_throughput --sessions 2000 --questions 20
+"""
+
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+
+from ..data.repository import CSVRepository
+from ..logic.session import HeadlessFrontEnd, QuizSession, run_scripted_session
+
+
+def write_questions(path: str, count: int):
+    """Write a synthetic questions CSV with count four-option questions."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "text", "choices", "correct_index"])
+        for i in range(count):
+            writer.writerow([f"q{i:06d}", f"Synthetic question {i}?", "A||B||C||D", i % 4])
+
+
+def run(sessions: int, questions: int, seed: int = 0) -> dict:
+    """
+    Time `sessions` headless sessions over a bank of `questions` questions.
+
+    Args:
+        sessions (int): Number of complete sessions to run
+        questions (int): Number of questions in each quiz
+        seed (int): Seed for the random answers
+
+    Returns:
+        dict: sessions, elapsed seconds, sessions/sec and answers/sec
+    """
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        questions_path = os.path.join(tmp, "questions.csv")
+        write_questions(questions_path, questions)
+        repo = CSVRepository(questions_path, os.path.join(tmp, "results.csv"))
+
+        start = time.perf_counter()
+        for i in range(sessions):
+            session = QuizSession(repo, HeadlessFrontEnd())
+            run_scripted_session(session, f"user{i}", lambda q: rng.randrange(len(q.options)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "sessions": sessions,
+        "seconds": elapsed,
+        "sessions_per_sec": sessions / elapsed if elapsed else float("inf"),
+        "answers_per_sec": sessions * questions / elapsed if elapsed else float("inf"),
+    }
+
+
+def main(argv=None):
+    """Command-line entry point: print session throughput."""
+    parser = argparse.ArgumentParser(description="Benchmark end-to-end headless quiz sessions.")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--questions", type=int, default=20, help="questions per quiz")
+    args = parser.parse_args(argv)
+
+    r = run(args.sessions, args.questions)
+    print(f"{r['sessions']} sessions in {r['seconds']:.3f}s: "
+          f"{r['sessions_per_sec']:.0f} sessions/sec, {r['answers_per_sec']:.0f} answers/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Startup Preloading Benchmark
+
+Compares startup-to-first-question time with and without loading the question
+bank in the background at startup, the way App.__init__ does. The user's time
+on the welcome screen (typing their name) is simulated with a sleep; with
+preloading, the bank is parsed during that time instead of after "Start Quiz".
+
+Each run starts with an empty question cache, so both modes do a cold load.
+The GUI is replaced by the headless front-end so this runs without a display.
+
+Run from the folder that contains the App package:
+    python -m App.benchmarks.startup --questions 100000 --think 1.0
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ..data.repository import CSVRepository, clear_question_cache
+from ..logic.session import HeadlessFrontEnd, QuizSession
+from .session_throughput import write_questions
+
+
+def time_to_first_question(repo, think: float, preload: bool) -> tuple[float, float]:
+    """
+    Simulate one App startup and return how long things took.
+
+    Args:
+        repo: Repository to load questions from
+        think (float): Seconds the user spends on the welcome screen
+        preload (bool): Load questions in the background at startup
+
+    Returns:
+        tuple[float, float]: (startup to first question, "Start Quiz" click to first question)
+    """
+    clear_question_cache()
+    started = time.perf_counter()
+    pool = ThreadPoolExecutor(max_workers=1)
+    future = pool.submit(repo.load_questions) if preload else None
+
+    time.sleep(think)
+    clicked = time.perf_counter()
+    session = QuizSession(repo, HeadlessFrontEnd())
+    session.start("benchmark", questions=future.result() if future else None)
+    shown = time.perf_counter()
+    pool.shutdown()
+    return shown - started, shown - clicked
+
+
+def main(argv=None):
+    """Command-line entry point: print timings with and without preloading."""
+    parser = argparse.ArgumentParser(description="Benchmark question preloading at startup.")
+    parser.add_argument("--questions", type=int, default=100_000, help="size of the synthetic bank")
+    parser.add_argument("--think", type=float, default=1.0, help="seconds spent typing a name")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        questions_path = os.path.join(tmp, "questions.csv")
+        write_questions(questions_path, args.questions)
+        repo = CSVRepository(questions_path, os.path.join(tmp, "results.csv"))
+
+        print(f"{args.questions} questions, {args.think:.1f}s on the welcome screen")
+        for preload in (False, True):
+            runs = [time_to_first_question(repo, args.think, preload) for _ in range(args.repeat)]
+            total = min(r[0] for r in runs)
+            after_click = min(r[1] for r in runs)
+            label = "with preload" if preload else "no preload"
+            print(f"{label:>13}: startup->first question {total * 1000:8.1f} ms, "
+                  f"click->first question {after_click * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
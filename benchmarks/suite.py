@@ -0,0 +1,240 @@
+"""
+Benchmark Suite
+
+Measures the main performance paths against synthetic data files of several
+sizes, and compares the numbers with a saved baseline:
+
+    load_questions   cold load (empty question cache) of an N-question CSV
+    load_results     full load of an N-row results CSV
+    append_result    one append to an N-row results file (running stats warm)
+    calculate_score  scoring a quiz of N answered questions
+    session          a complete 20-question headless session over an N-question
+                     bank, saving to an N-row results file
+
+For every case it reports latency (best of --repeat samples; fast cases are
+looped so each sample lasts at least MIN_SAMPLE_S, like timeit, which keeps
+small cases from flagging noise as regressions), throughput (rows, appends or
+sessions per second) and peak traced memory (from a separate run under
+tracemalloc, so tracing doesn't slow the timed runs).
+
+Generated files are kept in --data-dir and reused by later runs.
+
+Run from the folder that contains the App package:
+    python -m App.benchmarks.suite --sizes 1k,100k,1M --save-baseline baseline.json
+    python -m App.benchmarks.suite --sizes 1k,100k,1M --baseline baseline.json --threshold 0.2
+
+With --baseline the exit status is 1 if any metric regressed beyond --threshold.
+"""
+
+import argparse
+import csv
+import gc
+import math
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from ..data.repository import RESULT_FIELDS, CSVRepository, clear_question_cache
+from ..logic.models import Result
+from ..logic.quiz import Quiz
+from ..logic.session import HeadlessFrontEnd, QuizSession
+from .regression import compare, load_baseline, save_baseline
+from .session_throughput import write_questions
+
+# Number of appends timed per append_result measurement
+APPENDS = 200
+# Questions per quiz in the session case
+SESSION_QUESTIONS = 20
+# Fast cases are repeated within one sample until it lasts at least this long
+MIN_SAMPLE_S = 0.05
+
+
+def parse_size(text: str) -> int:
+    """Parse "1k", "100k", "1M" or a plain number."""
+    text = text.strip()
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1:].lower(), 1)
+    return int(float(text[:-1] if scale > 1 else text) * scale)
+
+
+def write_results(path: str, count: int):
+    """Write a synthetic results CSV with count rows."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(RESULT_FIELDS)
+        for i in range(count):
+            writer.writerow([f"user{i % 5000}", i % 21, 20, float(i % 900), f"2024-01-{1 + i % 28:02d}T12:00:00Z"])
+
+
+def dataset(data_dir: str, size: int) -> tuple[str, str]:
+    """Return (questions path, results path) for a size, generating them if missing."""
+    questions_path = os.path.join(data_dir, f"questions_{size}.csv")
+    results_path = os.path.join(data_dir, f"results_{size}.csv")
+    if not os.path.exists(questions_path):
+        write_questions(questions_path, size)
+    if not os.path.exists(results_path):
+        write_results(results_path, size)
+    return questions_path, results_path
+
+
+def measure(run, setup=None, repeat: int = 5) -> tuple[float, int]:
+    """
+    Time run() and find its peak memory.
+
+    Args:
+        run (function): The code being measured; called as run(state)
+        setup (function | None): Called before every sample, untimed; its return
+                                 value is run's state for that sample
+        repeat (int): Number of timed samples
+
+    Returns:
+        tuple[float, int]: (best seconds per run, peak traced bytes of one extra run)
+    """
+    # One untimed run also warms caches and tells us how many runs fill a sample
+    state = setup() if setup else None
+    start = time.perf_counter()
+    run(state)
+    first = time.perf_counter() - start
+    number = max(1, math.ceil(MIN_SAMPLE_S / first)) if first > 0 else 1000
+
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        # Like timeit: a collection triggered by earlier garbage shouldn't land in this sample
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                run(state)
+            times.append((time.perf_counter() - start) / number)
+        finally:
+            gc.enable()
+
+    state = setup() if setup else None
+    tracemalloc.start()
+    run(state)
+    _size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def bench_size(size: int, data_dir: str, work_dir: str, repeat: int) -> dict[str, dict[str, float]]:
+    """
+    Run every case for one data size.
+
+    Returns:
+        dict[str, dict[str, float]]: Measurements per case name, e.g. "load_questions/100k"
+    """
+    questions_path, results_path = dataset(data_dir, size)
+    label = f"{size // 1_000_000}M" if size % 1_000_000 == 0 else f"{size // 1000}k" if size % 1000 == 0 else str(size)
+    out = {}
+
+    def record(case: str, seconds: float, peak: int, ops: int):
+        out[f"{case}/{label}"] = {"latency_s": seconds, "throughput": ops / seconds if seconds else 0.0,
+                                  "peak_bytes": peak}
+
+    repo = CSVRepository(questions_path, results_path)
+
+    def cold_load(_):
+        # Cold load every time: the process-wide cache would otherwise make it free
+        clear_question_cache()
+        repo.load_questions()
+
+    seconds, peak = measure(cold_load, repeat=repeat)
+    record("load_questions", seconds, peak, size)
+
+    seconds, peak = measure(lambda _: repo.load_results(), repeat=repeat)
+    record("load_results", seconds, peak, size)
+
+    def fresh_results_repo():
+        # A private copy so appends don't grow the shared file between samples
+        path = os.path.join(work_dir, "results.csv")
+        shutil.copyfile(results_path, path)
+        copy = CSVRepository(questions_path, path)
+        for stale in (copy.stats_path, copy.answers_path, copy.question_stats_path):
+            if os.path.exists(stale):
+                os.remove(stale)
+        copy.result_stats()  # build the running statistics once, untimed
+        return copy
+
+    sample = Result("bench", 15, 20, 123.4, "2024-02-01T00:00:00Z")
+
+    def append_many(copy):
+        for _ in range(APPENDS):
+            copy.append_result(sample)
+
+    seconds, peak = measure(append_many, setup=fresh_results_repo, repeat=repeat)
+    record("append_result", seconds / APPENDS, peak, 1)
+
+    bank = repo.load_questions()
+    quiz = Quiz(bank)
+    rng = random.Random(0)
+    quiz.user_answers = [rng.randrange(4) for _ in bank]
+    seconds, peak = measure(lambda _: quiz.calculate_score(), repeat=repeat)
+    record("calculate_score", seconds, peak, size)
+
+    def one_session(copy):
+        questions = rng.sample(bank, min(SESSION_QUESTIONS, len(bank)))
+        session = QuizSession(copy, HeadlessFrontEnd())
+        session.start("bench", questions=questions)
+        while not session.finished:
+            session.submit(rng.randrange(4))
+            session.next()
+
+    seconds, peak = measure(one_session, setup=fresh_results_repo, repeat=repeat)
+    record("session", seconds, peak, 1)
+    return out
+
+
+def print_table(results: dict[str, dict[str, float]]):
+    """Print one line per case."""
+    print(f"{'case':<24} {'latency':>12} {'throughput/s':>14} {'peak MiB':>10}")
+    for case, m in results.items():
+        print(f"{case:<24} {m['latency_s'] * 1000:>9.3f} ms {m['throughput']:>14,.0f} {m['peak_bytes'] / 2**20:>10.1f}")
+
+
+def main(argv=None) -> int:
+    """Command-line entry point. Returns the process exit status."""
+    parser = argparse.ArgumentParser(description="Benchmark repository, quiz logic and session paths.")
+    parser.add_argument("--sizes", default="1k,100k,1M", help="comma-separated data sizes (default 1k,100k,1M)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed samples per case")
+    parser.add_argument("--data-dir", help="where to keep generated CSVs (default: a temporary folder)")
+    parser.add_argument("--save-baseline", metavar="PATH", help="save this run as the baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against this baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed regression, e.g. 0.2 = 20%%")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or tmp
+        os.makedirs(data_dir, exist_ok=True)
+        work_dir = os.path.join(tmp, "work")
+        os.makedirs(work_dir)
+        for size in sizes:
+            results.update(bench_size(size, data_dir, work_dir, args.repeat))
+    print_table(results)
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results,
+                      meta={"python": sys.version.split()[0], "platform": platform.platform()})
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        regressions = compare(load_baseline(args.baseline), results, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print("  " + line)
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
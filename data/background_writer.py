@@ -0,0 +1,124 @@
+"""
+Background Writer Module
+
+Moves result persistence off the GUI thread. Results are queued and written by
+a worker thread, failed writes are retried with exponential backoff, and
+completion callbacks are handed back to the GUI thread so they can safely touch
+Tkinter widgets.
+"""
+
+import queue
+import threading
+import time
+
+
+class BackgroundWriter:
+    """
+    Writes items on a worker thread and reports back on the caller's thread.
+
+    Tkinter widgets may only be used from the main thread, so completion
+    callbacks are never run on the worker. They are queued instead and run by
+    dispatch_completions(), which the App calls periodically via after().
+
+    Attributes:
+        write (function): Called on the worker thread with each item, e.g. repo.append_result
+        retries (int): Number of extra attempts after a failed write
+        backoff (float): Delay in seconds before the first retry; doubles each retry
+    """
+
+    def __init__(self, write, retries: int = 3, backoff: float = 0.5):
+        """
+        Start the worker thread.
+
+        Args:
+            write (function): Function that persists one item; raising means failure
+            retries (int): Number of extra attempts after a failed write
+            backoff (float): Delay before the first retry in seconds, doubled each time
+        """
+        self.write = write
+        self.retries = retries
+        self.backoff = backoff
+
+        self._jobs: queue.Queue = queue.Queue()
+        self._completions: queue.Queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="result-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, item, on_done=None, write=None):
+        """
+        Queue an item to be written.
+
+        Args:
+            item: The item to pass to write()
+            on_done (function | None): Called as on_done(error) from
+                                       dispatch_completions(), with error None on success
+                                       or the last exception after all retries failed
+            write (function | None): Writes this item instead of self.write, e.g.
+                                     repo.append_answers next to repo.append_result;
+                                     items are still written in submission order
+
+        Raises:
+            RuntimeError: If the writer has been closed
+        """
+        if self._closed:
+            raise RuntimeError("BackgroundWriter is closed")
+        self._jobs.put((item, on_done, write or self.write))
+
+    def dispatch_completions(self) -> int:
+        """
+        Run the completion callbacks of finished writes on the calling thread.
+
+        Returns:
+            int: Number of callbacks run
+        """
+        count = 0
+        while True:
+            try:
+                callback, error = self._completions.get_nowait()
+            except queue.Empty:
+                return count
+            callback(error)
+            count += 1
+
+    def flush(self):
+        """
+        Block until every queued item has been written (or has failed for good),
+        then run the pending completion callbacks.
+        """
+        self._jobs.join()
+        self.dispatch_completions()
+
+    def close(self):
+        """
+        Flush everything that is queued and stop the worker thread.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.flush()
+        # None tells the worker to stop
+        self._jobs.put(None)
+        self._thread.join()
+
+    def _run(self):
+        """Worker loop: write each queued item, retrying with backoff."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                self._jobs.task_done()
+                return
+            item, on_done, write = job
+            error = None
+            for attempt in range(self.retries + 1):
+                try:
+                    write(item)
+                    error = None
+                    break
+                except Exception as ex:
+                    error = ex
+                    if attempt < self.retries:
+                        time.sleep(self.backoff * (2 ** attempt))
+            if on_done is not None:
+                self._completions.put((on_done, error))
+            self._jobs.task_done()
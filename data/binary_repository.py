@@ -0,0 +1,493 @@
+"""
+Binary Results Repository Module
+
+This module provides an alternative results backend for the quiz application.
+Questions are still read from CSV, but results are stored as fixed-width binary
+records in an append-only file that is memory-mapped for reading. A binary
+sidecar index (record numbers sorted by timestamp and by user_name) lets range
+and per-user queries binary-search straight to the matching records instead of
+scanning the whole history.
+"""
+
+import bisect
+import contextlib
+import mmap
+import os
+import struct
+from array import array
+
+from ..logic import metrics
+from ..logic.models import Result
+from .locking import file_lock
+from .repository import CSVRepository, _MIN_ROWS_BETWEEN_SAVES, _file_identity
+
+
+# File header: 4-byte magic, 1-byte format version, 3 bytes padding
+MAGIC = b"QZRB"
+VERSION = 1
+HEADER = struct.Struct("<4sB3x")
+
+# One record per result: user_name, score, total_questions, time_taken, timestamp.
+# Strings are UTF-8, NUL-padded to a fixed width so record N always starts at
+# HEADER.size + N * RECORD.size.
+NAME_WIDTH = 64
+TIMESTAMP_WIDTH = 32
+RECORD = struct.Struct(f"<{NAME_WIDTH}siid{TIMESTAMP_WIDTH}s")
+
+# Byte offsets of the two indexed fields inside a record
+_NAME_FIELD = struct.Struct(f"<{NAME_WIDTH}s")
+_TIMESTAMP_FIELD = struct.Struct(f"<{TIMESTAMP_WIDTH}s")
+_TIMESTAMP_OFFSET = RECORD.size - TIMESTAMP_WIDTH
+
+# append_results() hands records to the OS in chunks of whole records
+_WRITE_BATCH_BYTES = 512 * RECORD.size
+
+# Sidecar index file: a header, then the record numbers sorted by timestamp, then
+# the record numbers sorted by user name (each an array of INDEX_TYPECODE). The
+# keys themselves are not stored; they are read from the mapped records. The
+# header holds the number of records covered and their _file_identity():
+# magic, version, count, st_dev, st_ino, SHA-1 digest.
+INDEX_MAGIC = b"QZRX"
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<4sB3xQQQ20s")
+INDEX_TYPECODE = "I"
+
+
+def _encode(text: str, width: int) -> bytes:
+    """
+    Encode text as UTF-8 and truncate it to at most width bytes.
+
+    Truncation never splits a multi-byte character, so the stored value always
+    decodes cleanly.
+
+    Args:
+        text (str): The text to encode
+        width (int): Maximum number of bytes
+
+    Returns:
+        bytes: The encoded (possibly truncated) text
+    """
+    data = (text or "").encode("utf-8")
+    if len(data) <= width:
+        return data
+    return data[:width].decode("utf-8", errors="ignore").encode("utf-8")
+
+
+def _decode(raw: bytes) -> str:
+    """Decode a NUL-padded fixed-width field back into a string."""
+    return raw.rstrip(b"\x00").decode("utf-8", errors="replace")
+
+
+class BinaryRepository(CSVRepository):
+    """
+    Stores quiz results in a fixed-width, memory-mapped, append-only file.
+
+    This class has the same append_result()/load_results() surface as
+    CSVRepository (and inherits load_questions() from it), so the App can use
+    either backend. On top of that it offers indexed queries:
+    - results_for_user(): all attempts by one user
+    - results_between(): all attempts within a timestamp range
+
+    The sidecar index lives next to the results file (results_path + ".idx").
+    It records how many records it covers, so after new appends only the new
+    records are indexed (sorted as one batch and merged in), and a missing or
+    stale sidecar is simply rebuilt. Like the statistics sidecar, it is only
+    rewritten once enough new records have piled up.
+
+    User names longer than NAME_WIDTH bytes and timestamps longer than
+    TIMESTAMP_WIDTH bytes are truncated when stored.
+
+    Attributes:
+        index_path (str): File path to the sidecar index
+    """
+
+    def __init__(self, questions_path: str, results_path: str, field_sep: str = "||", lock_writes: bool = False,
+                 dedupe: str | None = None):
+        """
+        Initialize the binary repository with file paths.
+
+        Args:
+            questions_path (str): Path to the CSV file containing quiz questions
+            results_path (str): Path to the binary results file
+            field_sep (str): Separator used to split multiple answer choices
+            lock_writes (bool): Coordinate appends with other processes using an
+                              advisory file lock
+            dedupe (str | None): Duplicate policy applied while loading questions
+        """
+        super().__init__(questions_path, results_path, field_sep, lock_writes, dedupe)
+        self.index_path = results_path + ".idx"
+
+        # In-memory copy of the sidecar index, loaded lazily on first query:
+        # record numbers sorted by timestamp and by user name (ties in save order)
+        self._indexed = 0
+        self._by_time = array(INDEX_TYPECODE)
+        self._by_name = array(INDEX_TYPECODE)
+        # _file_identity() of the records the index covers, and the number of
+        # records indexed since the sidecar was last written
+        self._index_file: dict | None = None
+        self._index_unsaved = 0
+        self._index_loaded = False
+
+    # --- Writing ---
+    @metrics.timed("repo.append_result")
+    def append_result(self, r: Result):
+        """
+        Append a quiz result as one fixed-width record.
+
+        Creates the file (with its header) if it doesn't exist yet.
+
+        Args:
+            r (Result): The Result object to save
+        """
+        self.append_results([r])
+
+    def append_results(self, results) -> int:
+        """
+        Append many quiz results with a single open.
+
+        Records are packed in memory first, so with lock_writes the lock is only
+        held for the write itself.
+
+        Args:
+            results (Iterable[Result]): The results to save, in order
+
+        Returns:
+            int: Number of results written
+        """
+        batch = bytearray()
+        count = 0
+        for r in results:
+            batch += RECORD.pack(
+                _encode(r.user_name, NAME_WIDTH),
+                int(r.score),
+                int(r.total_questions),
+                float(r.time_taken),
+                _encode(r.timestamp, TIMESTAMP_WIDTH),
+            )
+            count += 1
+
+        with (file_lock(self.results_path) if self.lock_writes else contextlib.nullcontext()):
+            with open(self.results_path, "ab") as f:
+                # A new file gets its header before the first record
+                if f.tell() == 0:
+                    f.write(HEADER.pack(MAGIC, VERSION))
+                # Write in chunks so very large imports don't issue one huge write
+                view = memoryview(batch)
+                for start in range(0, len(view), _WRITE_BATCH_BYTES):
+                    f.write(view[start:start + _WRITE_BATCH_BYTES])
+        self._refresh_stats()
+        return count
+
+    # --- Reading ---
+    def count_results(self) -> int:
+        """
+        Return the number of stored results without reading any of them.
+
+        Returns:
+            int: Number of complete records in the results file
+        """
+        try:
+            size = os.path.getsize(self.results_path)
+        except FileNotFoundError:
+            return 0
+        return max(0, (size - HEADER.size) // RECORD.size)
+
+    @metrics.timed("repo.load_results")
+    def load_results(self):
+        """
+        Load all saved quiz results from the binary file.
+
+        Returns:
+            list[Result]: List of Result objects in the order they were saved.
+                         Empty list if the file doesn't exist.
+        """
+        return list(self.iter_results())
+
+    def iter_results(self, offset: int = 0, limit: int | None = None):
+        """
+        Lazily yield saved quiz results, one page at a time.
+
+        Records are fixed-width, so jumping to offset costs nothing: only the
+        records inside the window are read from the mapped file.
+
+        Args:
+            offset (int): Number of records to skip
+            limit (int | None): Maximum number of records to yield, or None for all
+
+        Yields:
+            Result: Each result in the window, in the order they were saved
+        """
+        with self._open_map() as mm:
+            if mm is None:
+                return
+            count = (len(mm) - HEADER.size) // RECORD.size
+            stop = count if limit is None else min(count, offset + limit)
+            for i in range(max(0, offset), stop):
+                yield self._read(mm, i)
+
+    def _refresh_stats(self):
+        """
+        Fold any records not yet covered by the running statistics into them.
+
+        For this backend the saved offset is a record count rather than a byte
+        offset, and only the records after it are read.
+        """
+        count = self._check_stats_file()
+        if count == self._stats_offset:
+            return
+
+        start = self._stats_offset
+        for r in self.iter_results(offset=start, limit=count - start):
+            self._stats.add(r)
+            self._stats_offset += 1
+        self._stats_folded(self._stats_offset - start)
+
+    def _stats_covered_bytes(self) -> int:
+        """Number of bytes at the start of the results file the statistics cover."""
+        return HEADER.size + self._stats_offset * RECORD.size
+
+    def _results_size(self) -> int:
+        """Number of complete records in the results file."""
+        return self.count_results()
+
+    def results_for_user(self, user_name: str):
+        """
+        Load every result saved under one user name.
+
+        Args:
+            user_name (str): The exact user name to look up
+
+        Returns:
+            list[Result]: The user's results in the order they were saved
+        """
+        with self._open_map() as mm:
+            if mm is None:
+                return []
+            self._refresh_index(mm)
+            # Names are matched the way they are stored (possibly truncated)
+            name = _encode(user_name, NAME_WIDTH)
+            key = _name_key(mm)
+            lo = bisect.bisect_left(self._by_name, name, key=key)
+            hi = bisect.bisect_right(self._by_name, name, lo=lo, key=key)
+            return [self._read(mm, i) for i in self._by_name[lo:hi]]
+
+    def results_between(self, start: str | None = None, end: str | None = None):
+        """
+        Load the results whose timestamp falls within [start, end].
+
+        Timestamps are ISO 8601 strings, so they are compared as text.
+
+        Args:
+            start (str | None): Inclusive lower bound, or None for no lower bound
+            end (str | None): Inclusive upper bound, or None for no upper bound
+
+        Returns:
+            list[Result]: Matching results ordered by timestamp
+        """
+        with self._open_map() as mm:
+            if mm is None:
+                return []
+            self._refresh_index(mm)
+            # UTF-8 bytes sort in the same order as the strings they encode
+            key = _timestamp_key(mm)
+            lo = 0 if start is None else bisect.bisect_left(self._by_time, start.encode("utf-8"), key=key)
+            hi = (len(self._by_time) if end is None
+                  else bisect.bisect_right(self._by_time, end.encode("utf-8"), lo=lo, key=key))
+            return [self._read(mm, i) for i in self._by_time[lo:hi]]
+
+    # --- Internal helpers ---
+    def _open_map(self):
+        """
+        Memory-map the results file for reading.
+
+        Returns:
+            _MappedFile: Context manager yielding an mmap, or None if the file is
+                        missing, empty or not a results file
+        """
+        return _MappedFile(self.results_path)
+
+    @staticmethod
+    def _read(mm, i: int) -> Result:
+        """Unpack record number i from the mapped file into a Result."""
+        name, score, total, time_taken, ts = RECORD.unpack_from(mm, HEADER.size + i * RECORD.size)
+        return Result(
+            user_name=_decode(name) or None,
+            score=score,
+            total_questions=total,
+            time_taken=time_taken,
+            timestamp=_decode(ts),
+        )
+
+    def _load_index(self):
+        """Load the sidecar index from disk, or start an empty one."""
+        self._index_loaded = True
+        self._index_unsaved = 0
+        try:
+            with open(self.index_path, "rb") as f:
+                magic, version, count, dev, ino, digest = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+                if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                    # e.g. the JSON index earlier versions wrote; it is rebuilt
+                    raise ValueError("not a results index")
+                by_time, by_name = array(INDEX_TYPECODE), array(INDEX_TYPECODE)
+                by_time.fromfile(f, count)
+                by_name.fromfile(f, count)
+        except (OSError, ValueError, EOFError, struct.error):
+            self._reset_index()
+            return
+        self._indexed = count
+        self._by_time, self._by_name = by_time, by_name
+        self._index_file = {"dev": dev, "ino": ino, "hash": digest.hex()}
+
+    def _reset_index(self):
+        """Forget everything indexed so far."""
+        self._indexed = 0
+        self._by_time = array(INDEX_TYPECODE)
+        self._by_name = array(INDEX_TYPECODE)
+        self._index_file = None
+
+    def _refresh_index(self, mm):
+        """
+        Bring the index up to date with the records in the mapped file.
+
+        Only records appended since the last refresh are read: they are sorted
+        as one batch and merged into each ordering. If the file no longer starts
+        with the records the index covers (it was truncated, replaced or
+        rewritten; see _file_identity), the index is rebuilt from scratch.
+
+        A full build is saved straight away. After that the sidecar, which costs
+        O(records) to write, is only rewritten once the records indexed since
+        the last write reach a fraction of the total, so queries after single
+        appends stay cheap; a process that stops before then leaves a few more
+        records for the next one to index.
+        """
+        if not self._index_loaded:
+            self._load_index()
+
+        count = (len(mm) - HEADER.size) // RECORD.size
+        if self._indexed and (
+            count < self._indexed
+            or _file_identity(self.results_path, HEADER.size + self._indexed * RECORD.size) != self._index_file
+        ):
+            self._reset_index()
+        if count == self._indexed:
+            return
+
+        full_build = self._indexed == 0
+        # Unpack the new records in one pass rather than once per comparison
+        new = RECORD.iter_unpack(mm[HEADER.size + self._indexed * RECORD.size:HEADER.size + count * RECORD.size])
+        names, times = [], []
+        for name, _, _, _, ts in new:
+            names.append(name.rstrip(b"\x00"))
+            times.append(ts.rstrip(b"\x00"))
+        self._by_time = _merge(self._by_time, self._indexed, times, _timestamp_key(mm))
+        self._by_name = _merge(self._by_name, self._indexed, names, _name_key(mm))
+        self._index_unsaved += count - self._indexed
+        self._indexed = count
+        self._index_file = _file_identity(self.results_path, HEADER.size + count * RECORD.size)
+        if full_build or self._index_unsaved >= max(_MIN_ROWS_BETWEEN_SAVES, count // 64):
+            self._save_index()
+
+    def _save_index(self):
+        """Write the in-memory index to the sidecar file atomically, ignoring failures."""
+        identity = self._index_file
+        if identity is None:
+            return
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, self._indexed,
+                                          identity["dev"], identity["ino"], bytes.fromhex(identity["hash"])))
+                self._by_time.tofile(f)
+                self._by_name.tofile(f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # The index is only a cache of the results file; it is rebuilt if missing
+            return
+        self._index_unsaved = 0
+
+
+def _timestamp_key(mm):
+    """Sort key reading record i's timestamp (UTF-8 bytes) from the mapped file."""
+    def key(i: int) -> bytes:
+        return _TIMESTAMP_FIELD.unpack_from(mm, HEADER.size + i * RECORD.size + _TIMESTAMP_OFFSET)[0].rstrip(b"\x00")
+    return key
+
+
+def _name_key(mm):
+    """Sort key reading record i's user name (UTF-8 bytes) from the mapped file."""
+    def key(i: int) -> bytes:
+        return _NAME_FIELD.unpack_from(mm, HEADER.size + i * RECORD.size)[0].rstrip(b"\x00")
+    return key
+
+
+def _merge(ordered: array, first: int, new_keys: list[bytes], key) -> array:
+    """
+    Merge new record numbers into an array of record numbers sorted by key.
+
+    The new records are sorted once, then each is placed with a binary search
+    and the runs of existing records between them are copied as whole slices,
+    so the cost is O(k log k + k log n) comparisons plus one O(n) copy, not a
+    list.insert() per record. Records with equal keys stay in record order.
+
+    Args:
+        ordered (array): Record numbers sorted by key
+        first (int): Record number of the first new record (larger than any in ordered)
+        new_keys (list[bytes]): Keys of the new records first, first + 1, ...
+        key (Callable[[int], bytes]): Sort key of an existing record number
+
+    Returns:
+        array: A new array with every record number, sorted by key
+    """
+    order = sorted(range(len(new_keys)), key=new_keys.__getitem__)
+    # New records whose key is not below the last existing one (all of them for a
+    # full build, and most appends, which come in time order) go at the end in bulk
+    tail = 0
+    if ordered:
+        last = key(ordered[-1])
+        tail = bisect.bisect_left(order, last, key=new_keys.__getitem__)
+    merged = array(INDEX_TYPECODE)
+    start = 0
+    for j in order[:tail]:
+        pos = bisect.bisect_right(ordered, new_keys[j], lo=start, key=key)
+        merged.extend(ordered[start:pos])
+        merged.append(first + j)
+        start = pos
+    merged.extend(ordered[start:])
+    merged.extend(array(INDEX_TYPECODE, [first + j for j in order[tail:]]))
+    return merged
+
+
+class _MappedFile:
+    """
+    Context manager that memory-maps a results file read-only.
+
+    Yields None instead of raising when the file is missing, empty, or does not
+    start with the expected header, so callers can treat all of those as
+    "no results".
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._map = None
+
+    def __enter__(self):
+        try:
+            self._file = open(self.path, "rb")
+        except FileNotFoundError:
+            return None
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses to map an empty file
+            return None
+        if len(self._map) < HEADER.size or HEADER.unpack_from(self._map, 0) != (MAGIC, VERSION):
+            return None
+        return self._map
+
+    def __exit__(self, *exc):
+        if self._map is not None:
+            self._map.close()
+        if self._file is not None:
+            self._file.close()
+        return False
@@ -0,0 +1,263 @@
+"""
+Bulk Question Import Module
+
+Validates and imports large question bank CSVs in parallel. The file is split
+into byte ranges, each range is parsed and validated in a separate process, and
+the results are merged into:
+
+- a clean questions CSV holding every accepted row, in the original order and
+  with the original columns, which CSVRepository loads without dropping anything
+- a rejection report CSV (row, id, reason) for every row load_questions() would
+  have silently skipped
+
+Rows are accepted or rejected by data.repository.parse_question_row, the same
+rule load_questions() uses.
+
+Shard boundaries are always placed at the end of a CSV record: a newline only
+ends a record when an even number of quote characters comes before it, so
+quoted fields that contain newlines are never split. This relies on quotes only
+appearing inside quoted fields, as csv.writer and spreadsheet exports produce.
+
+Run from the folder that contains the App package:
+    python -m App.data.bulk_import team_bank.csv App/csv_files/questions.csv --report rejects.csv
+"""
+
+import argparse
+import csv
+import io
+import os
+import shutil
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from .repository import parse_question_row
+
+# Read size used while scanning for shard boundaries
+_SCAN_CHUNK = 1 << 20
+
+
+@dataclass
+class ImportSummary:
+    """
+    Outcome of bulk_import().
+
+    Attributes:
+        rows (int): Data rows read (blank lines are not rows)
+        accepted (int): Rows written to the clean bank
+        rejected (int): Rows written to the rejection report
+        reasons (Counter): Number of rejected rows per reason
+        shards (int): Number of byte ranges the file was split into
+        seconds (float): Wall-clock time of the import
+    """
+    rows: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    reasons: Counter = field(default_factory=Counter)
+    shards: int = 0
+    seconds: float = 0.0
+
+
+def bulk_import(csv_path: str, out_path: str, report_path: str | None = None, field_sep: str = "||",
+                workers: int | None = None) -> ImportSummary:
+    """
+    Validate a questions CSV in parallel and write the clean bank and rejection report.
+
+    Args:
+        csv_path (str): The questions CSV to import
+        out_path (str): Where to write the clean questions CSV (replaced atomically)
+        report_path (str | None): Where to write the rejection report, or None to skip it
+        field_sep (str): Separator used to split multiple answer choices
+        workers (int | None): Number of worker processes; None uses every CPU
+
+    Returns:
+        ImportSummary: Row counts, rejection reasons and timing
+    """
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    header, data_start = _read_header(csv_path)
+    # A few shards per worker evens out ranges that happen to be slower to parse
+    bounds = _shard_bounds(csv_path, data_start, workers * 4 if workers > 1 else 1)
+    ranges = list(zip(bounds, bounds[1:]))
+
+    out_dir = os.path.dirname(os.path.abspath(out_path))
+    summary = ImportSummary(shards=len(ranges))
+    with tempfile.TemporaryDirectory(dir=out_dir) as tmp:
+        jobs = [(csv_path, start, end, header, field_sep, os.path.join(tmp, f"part{i:05d}.csv"))
+                for i, (start, end) in enumerate(ranges)]
+        if workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                shard_results = list(pool.map(_import_shard, jobs))
+        else:
+            shard_results = [_import_shard(job) for job in jobs]
+
+        # Stitch the clean parts together in file order, as bytes (no re-decoding)
+        header_line = io.StringIO()
+        csv.writer(header_line).writerow(header)
+        tmp_out = os.path.join(tmp, "merged.csv")
+        with open(tmp_out, "wb") as out:
+            out.write(header_line.getvalue().encode("utf-8"))
+            for job in jobs:
+                with open(job[-1], "rb") as part:
+                    shutil.copyfileobj(part, out)
+        os.replace(tmp_out, out_path)
+
+    rejects = []
+    for rows, accepted, shard_rejects in shard_results:
+        # Shard-local row numbers become 1-based data row numbers in the whole file
+        rejects.extend((summary.rows + row, qid, reason) for row, qid, reason in shard_rejects)
+        summary.rows += rows
+        summary.accepted += accepted
+    summary.rejected = len(rejects)
+    summary.reasons.update(reason for _, _, reason in rejects)
+
+    if report_path:
+        with open(report_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["row", "id", "reason"])
+            writer.writerows(rejects)
+
+    summary.seconds = time.perf_counter() - started
+    return summary
+
+
+def _import_shard(job) -> tuple[int, int, list[tuple[int, str, str]]]:
+    """
+    Parse and validate one byte range (runs in a worker process).
+
+    Accepted rows are written unchanged to the job's part file.
+
+    Returns:
+        tuple: (rows read, rows accepted, [(shard-local row number, id, reason)])
+    """
+    csv_path, start, end, header, field_sep, part_path = job
+    with open(csv_path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+
+    rows = accepted = 0
+    rejects = []
+    reader = csv.DictReader(io.StringIO(text, newline=""), fieldnames=header)
+    with open(part_path, "w", newline="", encoding="utf-8") as part:
+        writer = csv.DictWriter(part, fieldnames=header, extrasaction="ignore")
+        for row in reader:
+            rows += 1
+            try:
+                parse_question_row(row, field_sep)
+            except ValueError as ex:
+                rejects.append((rows, row.get("id") or "", str(ex)))
+                continue
+            writer.writerow(row)
+            accepted += 1
+    return rows, accepted, rejects
+
+
+def _read_header(csv_path: str) -> tuple[list[str], int]:
+    """
+    Read the header record.
+
+    Returns:
+        tuple[list[str], int]: (column names, byte offset where the data rows start)
+    """
+    ends = _record_ends(csv_path, 0, [0])
+    end = ends[0]
+    with open(csv_path, "rb") as f:
+        raw = f.read(end)
+    header = next(csv.reader(io.StringIO(raw.decode("utf-8-sig"), newline="")), [])
+    return header, end
+
+
+def _shard_bounds(csv_path: str, data_start: int, shards: int) -> list[int]:
+    """
+    Split the data rows into about `shards` byte ranges that end on record boundaries.
+
+    Returns:
+        list[int]: Sorted offsets; consecutive pairs are the ranges
+    """
+    size = os.path.getsize(csv_path)
+    step = max(1, (size - data_start) // max(1, shards))
+    targets = [data_start + step * i for i in range(1, shards)]
+    bounds = [data_start] + _record_ends(csv_path, data_start, targets) + [size]
+    # Two targets inside one long record end up on the same boundary
+    return sorted(set(bounds))
+
+
+def _record_ends(csv_path: str, start: int, targets: list[int]) -> list[int]:
+    """
+    For each target offset, find the end of the first record ending after it.
+
+    The file is read once from start. Quote characters are counted in bulk up to
+    each target, and only the few newlines just after a target are inspected one
+    by one, so the scan costs about as much as reading the file (start must
+    itself be at a record boundary).
+
+    Args:
+        csv_path (str): The CSV file
+        start (int): Offset of a record boundary to scan from
+        targets (list[int]): Ascending offsets to find boundaries for
+
+    Returns:
+        list[int]: One offset per target (just past the newline, or the file size)
+    """
+    size = os.path.getsize(csv_path)
+    ends: list[int] = []
+    pos, in_quotes = start, False
+    with open(csv_path, "rb") as f:
+        f.seek(start)
+        for target in targets:
+            if ends and ends[-1] > target:
+                # Already past this target (e.g. inside one very long record)
+                ends.append(ends[-1])
+                continue
+            # An odd number of quotes so far means we're inside a quoted field
+            while pos < target:
+                chunk = f.read(min(_SCAN_CHUNK, target - pos))
+                if not chunk:
+                    break
+                in_quotes ^= chunk.count(b'"') & 1
+                pos += len(chunk)
+
+            end = None
+            while end is None:
+                chunk = f.read(_SCAN_CHUNK)
+                if not chunk:
+                    end = pos = size
+                    break
+                i = 0
+                while True:
+                    nl = chunk.find(b"\n", i)
+                    if nl < 0:
+                        in_quotes ^= chunk.count(b'"', i) & 1
+                        pos += len(chunk)
+                        break
+                    in_quotes ^= chunk.count(b'"', i, nl) & 1
+                    i = nl + 1
+                    if not in_quotes:
+                        end = pos = pos + i
+                        f.seek(pos)
+                        break
+            ends.append(end)
+    return ends
+
+
+def main(argv=None):
+    """Command-line entry point: validate and import a questions CSV."""
+    parser = argparse.ArgumentParser(description="Validate and import a large questions CSV in parallel.")
+    parser.add_argument("source", help="questions CSV to import")
+    parser.add_argument("out", help="clean questions CSV to write")
+    parser.add_argument("--report", help="rejection report CSV to write (row, id, reason)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: every CPU)")
+    parser.add_argument("--sep", default="||", help='separator between choices (default "||")')
+    args = parser.parse_args(argv)
+
+    s = bulk_import(args.source, args.out, args.report, args.sep, args.workers)
+    print(f"{s.rows} rows in {s.seconds:.2f}s across {s.shards} shards: "
+          f"{s.accepted} accepted, {s.rejected} rejected")
+    for reason, n in s.reasons.most_common():
+        print(f"  {n:>8}  {reason}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Compiled Question Bank Module
+
+This module turns a questions CSV into a pre-validated binary file and loads it
+back without parsing. Loading a compiled bank only memory-maps the file; each
+Question object is built the first time the quiz asks for it.
+
+File layout (all integers little-endian):
+    header:        magic b"QZQB", version (uint8), 3 padding bytes, count (uint32)
+    offset table:  count entries of (string offset uint64, option count uint16,
+                   correct_index uint16)
+    string table:  for each question: id, text, category, difficulty, then each
+                   option, every string stored as a uint32 byte length followed
+                   by UTF-8 bytes (version 1 banks have no category or difficulty)
+
+Compile from the command line:
+    python -m App.data.compiled_bank App/csv_files/questions.csv App/csv_files/questions.qbank
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Sequence
+
+from ..logic import metrics
+from ..logic.models import Question
+from .repository import CSVRepository
+
+
+MAGIC = b"QZQB"
+VERSION = 2
+# Strings stored before the options, per format version
+_LEADING_STRINGS = {1: 2, 2: 4}
+HEADER = struct.Struct("<4sB3xI")
+ENTRY = struct.Struct("<QHH")
+LENGTH = struct.Struct("<I")
+
+# Process-wide cache of open banks, shared by every CompiledRepository.
+# Maps the absolute path to ((mtime_ns, size), bank), like the question cache in
+# data.repository, so each file is mapped once and remapped only when it changes.
+_bank_cache: dict[str, tuple[tuple[int, int], "CompiledQuestionBank"]] = {}
+_bank_cache_stats = {"hits": 0, "misses": 0}
+_bank_cache_lock = threading.Lock()
+
+
+def bank_cache_info() -> dict:
+    """
+    Report how well the compiled bank cache is working.
+
+    Returns:
+        dict: {"hits": int, "misses": int, "entries": int}
+    """
+    with _bank_cache_lock:
+        return {**_bank_cache_stats, "entries": len(_bank_cache)}
+
+
+def clear_bank_cache():
+    """
+    Empty the cache and reset its hit/miss counters.
+
+    Banks are not closed: a quiz may still be reading one. Each mapping is
+    released when the last reference to its bank goes away.
+    """
+    with _bank_cache_lock:
+        _bank_cache.clear()
+        _bank_cache_stats["hits"] = 0
+        _bank_cache_stats["misses"] = 0
+
+
+def compile_questions(csv_path: str, out_path: str, field_sep: str = "||") -> int:
+    """
+    Compile a questions CSV into the binary bank format.
+
+    Rows are parsed and validated exactly like CSVRepository.load_questions(),
+    so the compiled bank contains the same questions in the same order. The
+    output is written to a temporary file and then moved into place, so readers
+    never see a half-written bank.
+
+    Args:
+        csv_path (str): Path to the source questions CSV
+        out_path (str): Path of the compiled bank to write
+        field_sep (str): Separator used to split multiple answer choices
+
+    Returns:
+        int: Number of questions written
+    """
+    questions = CSVRepository(csv_path, "", field_sep)._read_questions()
+
+    entries = bytearray()
+    strings = bytearray()
+    for q in questions:
+        entries += ENTRY.pack(len(strings), len(q.options), q.correct_index)
+        for text in (q.id, q.text, q.category, q.difficulty, *q.options):
+            data = text.encode("utf-8")
+            strings += LENGTH.pack(len(data))
+            strings += data
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(questions)))
+        f.write(entries)
+        f.write(strings)
+    os.replace(tmp_path, out_path)
+    return len(questions)
+
+
+class CompiledQuestionBank(Sequence):
+    """
+    Read-only, memory-mapped view of a compiled question bank.
+
+    Behaves like a list of Question objects (len(), indexing, iteration), so it
+    can be passed straight to Quiz. Opening a bank only reads its header;
+    a Question is decoded the first time its index is requested and then kept,
+    so asking again returns the same object.
+
+    The bank holds no open file, only the memory map, which is released when
+    the bank is garbage collected or closed. Can be used as a context manager
+    to close it explicitly.
+
+    Attributes:
+        path (str): File path to the compiled bank
+    """
+
+    def __init__(self, path: str):
+        """
+        Open and memory-map a compiled bank.
+
+        Args:
+            path (str): Path to a file written by compile_questions()
+
+        Raises:
+            ValueError: If the file is not a compiled question bank
+        """
+        self.path = path
+        # The map keeps its own duplicate of the file handle, so the file can be
+        # closed straight away
+        with open(path, "rb") as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"{path} is not a compiled question bank") from None
+        try:
+            magic, version, count = HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            magic = version = count = None
+        if magic != MAGIC or version not in _LEADING_STRINGS:
+            self.close()
+            raise ValueError(f"{path} is not a compiled question bank")
+
+        self._count = count
+        self._leading = _LEADING_STRINGS[version]
+        self._strings_start = HEADER.size + count * ENTRY.size
+        self._built: dict[int, Question] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("question index out of range")
+
+        q = self._built.get(index)
+        if q is None:
+            q = self._build(index)
+            self._built[index] = q
+        return q
+
+    def correct_index(self, index: int) -> int:
+        """
+        Return a question's correct_index without building the Question.
+
+        Args:
+            index (int): Position of the question in the bank
+
+        Returns:
+            int: Index of the correct option
+        """
+        return ENTRY.unpack_from(self._map, HEADER.size + index * ENTRY.size)[2]
+
+    def _build(self, index: int) -> Question:
+        """Decode question number index from the string table."""
+        offset, n_options, correct_index = ENTRY.unpack_from(self._map, HEADER.size + index * ENTRY.size)
+        pos = self._strings_start + offset
+        fields = []
+        # id, text, (category, difficulty,) then one string per option
+        for _ in range(self._leading + n_options):
+            (length,) = LENGTH.unpack_from(self._map, pos)
+            pos += LENGTH.size
+            fields.append(self._map[pos:pos + length].decode("utf-8"))
+            pos += length
+        if self._leading == 2:
+            return Question(id=fields[0], text=fields[1], options=fields[2:], correct_index=correct_index)
+        return Question(id=fields[0], text=fields[1], options=fields[4:], correct_index=correct_index,
+                        category=fields[2], difficulty=fields[3])
+
+    def close(self):
+        """Release the memory map."""
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class CompiledRepository(CSVRepository):
+    """
+    CSVRepository variant that loads questions from a compiled bank.
+
+    questions_path must point at a file written by compile_questions(). Results
+    are still read and written as CSV.
+    """
+
+    @metrics.timed("repo.load_questions")
+    def load_questions(self):
+        """
+        Open the compiled question bank.
+
+        The open bank is cached for the whole process and reused as long as the
+        file's modification time and size haven't changed, so repeated quiz
+        starts share one memory map. When the file changes, the new file is
+        mapped and the old bank is dropped from the cache but not closed, so a
+        quiz still reading it is unaffected; its mapping is released when the
+        last quiz holding it is gone. See bank_cache_info().
+
+        Returns:
+            CompiledQuestionBank | list: A lazily decoded bank, or an empty list
+                                        if the file is missing or not a bank
+        """
+        try:
+            st = os.stat(self.questions_path)
+        except FileNotFoundError:
+            return []
+
+        key = os.path.abspath(self.questions_path)
+        version = (st.st_mtime_ns, st.st_size)
+        with _bank_cache_lock:
+            cached = _bank_cache.get(key)
+            if cached is not None and cached[0] == version:
+                _bank_cache_stats["hits"] += 1
+                return cached[1]
+            _bank_cache_stats["misses"] += 1
+            if cached is not None:
+                # The file changed. Only the cache's reference is dropped: closing
+                # the old bank here would break any quiz that is still using it.
+                del _bank_cache[key]
+            try:
+                bank = CompiledQuestionBank(self.questions_path)
+            except (FileNotFoundError, ValueError):
+                return []
+            _bank_cache[key] = (version, bank)
+            return bank
+
+
+def main(argv=None):
+    """Command-line entry point: compile a questions CSV."""
+    parser = argparse.ArgumentParser(description="Compile a questions CSV into a binary question bank.")
+    parser.add_argument("csv_path", help="source questions CSV")
+    parser.add_argument("out_path", help="compiled bank to write")
+    parser.add_argument("--sep", default="||", help='separator between choices (default "||")')
+    args = parser.parse_args(argv)
+
+    count = compile_questions(args.csv_path, args.out_path, args.sep)
+    print(f"Compiled {count} questions into {args.out_path}")
+
+
+if __name__ == "__main__":
+    main()
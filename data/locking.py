@@ -0,0 +1,53 @@
+"""
+File Locking Module
+
+Advisory inter-process locks used to coordinate writers that share one results
+file (e.g. several kiosk App instances). The lock is taken on a small sidecar
+".lock" file rather than the data file itself, so it works the same way for
+append-mode files on Windows, macOS and Linux.
+"""
+
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path: str):
+    """
+    Hold an exclusive advisory lock for path while the with-block runs.
+
+    Blocks until the lock is available. Only processes that also use
+    file_lock() on the same path are coordinated; other readers and writers
+    are not stopped.
+
+    Args:
+        path (str): Path of the file being protected; the lock file is path + ".lock"
+    """
+    with open(path + ".lock", "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        else:
+            # msvcrt locks a byte range starting at the current position
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ~10 seconds; keep waiting
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
@@ -5,8 +5,107 @@ This module is for the file handling operations for the quiz application.
 It reads quiz questions from CSV and saves quiz results to CSV.
 """
 
+import contextlib
 import csv
-from ..logic.models import Question, Result
+import hashlib
+import io
+import json
+import os
+import random
+import threading
+import time
+from ..logic import metrics
+from ..logic.models import Answer, Question, Result
+from ..logic.question_index import QuestionIndex
+from ..logic.sampling import reservoir_sample
+from ..logic.stats import QuestionStats, ResultStats
+from .locking import file_lock
+
+
+# Process-wide cache of parsed question banks, shared by every CSVRepository.
+# Maps (absolute path, field_sep, dedupe policy) to ((mtime_ns, size), questions), so an
+# entry is only reused while the file on disk is unchanged, and each file keeps at most
+# one entry per policy.
+_question_cache: dict[tuple[str, str, str | None], tuple[tuple[int, int], tuple[Question, ...]]] = {}
+_question_cache_stats = {"hits": 0, "misses": 0}
+_question_cache_lock = threading.Lock()
+
+# Column order of the results CSV file
+RESULT_FIELDS = ["user_name", "score", "total_questions", "time_taken", "timestamp"]
+# Bytes hashed from the start of a data file, and from just before the end of
+# the part a sidecar covers, to recognise the file again (see _file_identity)
+_IDENTITY_HEAD = 4096
+_IDENTITY_TAIL = 256
+# A statistics sidecar is rewritten once at least this many rows (and at least
+# as many rows as it has users) were folded in since it was last written
+_MIN_ROWS_BETWEEN_SAVES = 64
+# The row index (see CSVRepository.iter_results) keeps the byte offset of every
+# this-many-th valid result
+_ROW_INDEX_STRIDE = 1024
+
+# Column order of the answers log (see CSVRepository.append_answers)
+ANSWER_FIELDS = ["user_name", "timestamp", "question_id", "selected_index", "correct", "dwell_time", "seed"]
+
+
+def question_cache_info() -> dict:
+    """
+    Report how well the question cache is working.
+    
+    Returns:
+        dict: {"hits": int, "misses": int, "entries": int}
+    """
+    with _question_cache_lock:
+        return {**_question_cache_stats, "entries": len(_question_cache)}
+
+
+def clear_question_cache():
+    """
+    Empty the question cache and reset its hit/miss counters.
+    """
+    with _question_cache_lock:
+        _question_cache.clear()
+        _question_cache_stats["hits"] = 0
+        _question_cache_stats["misses"] = 0
+
+
+def parse_question_row(row: dict, field_sep: str = "||") -> Question:
+    """
+    Turn one questions CSV row into a valid Question.
+    
+    This is the single definition of which rows load_questions() keeps; the bulk
+    importer (data.bulk_import) uses it too, so both agree on every row.
+    
+    Args:
+        row (dict): A row from csv.DictReader (missing columns may be None)
+        field_sep (str): Separator used to split multiple answer choices
+    
+    Returns:
+        Question: The parsed question
+    
+    Raises:
+        ValueError: If the row can't be parsed or fails Question.is_valid();
+                    the message says why
+    """
+    text = row.get("text")
+    if not isinstance(text, str) or not text.strip():
+        raise ValueError("empty text")
+    # Split the choices field using the separator, dropping empty choices
+    choices = row.get("choices")
+    options = [c for c in choices.split(field_sep) if c] if choices else []
+    if len(options) < 2:
+        raise ValueError("fewer than 2 choices")
+    try:
+        correct_index = int(row.get("correct_index", -1))
+    except (TypeError, ValueError):
+        raise ValueError("correct_index is not an integer") from None
+    if not 0 <= correct_index < len(options):
+        raise ValueError("correct_index out of range")
+    q = Question(id=row.get("id", ""), text=text, options=options, correct_index=correct_index,
+                 category=(row.get("category") or "").strip(), difficulty=(row.get("difficulty") or "").strip())
+    # is_valid() is the model's own rule; the checks above only explain failures
+    if not q.is_valid():
+        raise ValueError("invalid question")
+    return q
 
 
 class CSVRepository:
@@ -17,6 +116,7 @@ class CSVRepository:
     - Loading quiz questions from a CSV file
     - Saving quiz results to a CSV file
     - Loading historical quiz results
+    - Keeping an append-only log of every answer, with per-question counters
     
     The CSV format uses a custom separator (default "||") to split multiple choices
     into individual options, since CSV traditionally uses commas for separators.
@@ -25,11 +125,17 @@ class CSVRepository:
         questions_path (str): File path to the questions CSV file
         results_path (str): File path to the results CSV file
         field_sep (str): Separator used to split multiple fields 
+        lock_writes (bool): Whether result writes take an inter-process file lock
+        dedupe (str | None): Duplicate policy applied while loading questions, or None
+        stats_path (str): File path to the sidecar holding running result statistics
+        answers_path (str): File path to the append-only answers log
+        question_stats_path (str): File path to the sidecar holding per-question counters
     
 
     """
     
-    def __init__(self, questions_path: str, results_path: str, field_sep: str = "||"):
+    def __init__(self, questions_path: str, results_path: str, field_sep: str = "||", lock_writes: bool = False,
+                 dedupe: str | None = None):
         """
         Initialize the CSV repository with file paths.
         
@@ -39,11 +145,52 @@ class CSVRepository:
             field_sep (str): Separator used to split multiple answer choices.
                            Default is "||" to avoid conflicts with CSV commas.
                            Example: "Option A||Option B||Option C"
+            lock_writes (bool): Coordinate result writes with other processes using
+                              an advisory file lock. Turn this on when several App
+                              instances share one results file.
+            dedupe (str | None): Drop duplicate questions while loading, using this
+                               policy ("first-wins", "last-wins" or "reject"; see
+                               logic.question_index). None keeps every row, as before.
         """
         self.questions_path = questions_path
         self.results_path = results_path
         self.field_sep = field_sep
+        self.lock_writes = lock_writes
+        self.dedupe = dedupe
+        # (questions file version, index) built by question_index()
+        self._index: tuple[tuple[int, int] | None, QuestionIndex] | None = None
+        self.stats_path = results_path + ".stats.json"
+        
+        # Running aggregates over the results file, loaded lazily from stats_path.
+        # _stats_offset is how far into the results file the aggregates cover.
+        self._stats: ResultStats | None = None
+        self._stats_offset = 0
+        # _file_identity() of the part of the results file the aggregates cover,
+        # and the number of rows folded in since the sidecar was last written
+        self._stats_file: dict | None = None
+        self._stats_unsaved = 0
+
+        # Sparse index of the results file used by iter_results() and count_results():
+        # the byte offset of every _ROW_INDEX_STRIDE-th valid result, the number of
+        # valid results and the header, covering the file up to _rows_end. Loaded
+        # lazily from row_index_path and extended with the bytes appended since.
+        self.row_index_path = results_path + ".rows.json"
+        self._row_offsets: list[int] | None = None
+        self._rows_count = 0
+        self._rows_end = 0
+        self._rows_fields: list[str] | None = None
+        self._rows_file: dict | None = None
 
+        # Same scheme for the answers log: counters per question id, plus how far
+        # into the log they cover
+        self.answers_path = results_path + ".answers.csv"
+        self.question_stats_path = self.answers_path + ".stats.json"
+        self._question_stats: dict[str, QuestionStats] | None = None
+        self._question_stats_offset = 0
+        self._question_stats_file: dict | None = None
+        self._question_stats_unsaved = 0
+
+    @metrics.timed("repo.load_questions")
     def load_questions(self):
         """
         Load all quiz questions from the CSV file.
@@ -56,15 +203,102 @@ class CSVRepository:
             - text: The question text
             - choices: Answer options separated by field_sep (e.g., "A||B||C||D")
             - correct_index: Index of correct answer (0-indexed)
-            - category: (Optional) Topic of the question
-            - difficulty: (Optional) Difficulty level
+            - category: (Optional) Topic of the question, kept in Question.category
+            - difficulty: (Optional) Difficulty level, kept in Question.difficulty
+        
+        Parsed questions are cached for the whole process. The cache entry is
+        reused as long as the file's modification time and size haven't changed,
+        so repeated quiz starts don't re-read the CSV. See question_cache_info().
+        
+        If the repository has a dedupe policy, questions that repeat an earlier
+        id or (normalized) text are resolved by that policy in the same pass.
         
         Returns:
             list[Question]: List of valid Question objects. Empty list if file not found
                            or if no valid questions exist.
         
+        Raises:
+            DuplicateQuestionError: If the dedupe policy is "reject" and the bank
+                                    has duplicates
+        """
+        try:
+            st = os.stat(self.questions_path)
+        except FileNotFoundError:
+            # If file doesn't exist, return empty list (no questions to load)
+            return []
+        
+        key = (os.path.abspath(self.questions_path), self.field_sep, self.dedupe)
+        version = (st.st_mtime_ns, st.st_size)
+        with _question_cache_lock:
+            cached = _question_cache.get(key)
+            if cached is not None and cached[0] == version:
+                _question_cache_stats["hits"] += 1
+                # Return a new list so callers can't change the cached bank
+                return list(cached[1])
+            _question_cache_stats["misses"] += 1
+        
+        questions = self._read_questions()
+        with _question_cache_lock:
+            _question_cache[key] = (version, tuple(questions))
+        return questions
+
+    def _read_questions(self):
+        """
+        Parse and validate every question in the questions CSV, bypassing the cache.
+        
+        Returns:
+            list[Question]: List of valid Question objects, de-duplicated if the
+                           repository has a dedupe policy
+        """
+        if self.dedupe is None:
+            return list(self.iter_questions())
+        return QuestionIndex(self.iter_questions(), self.dedupe).questions
+
+    def question_index(self) -> QuestionIndex:
+        """
+        Get an index of the loaded questions for O(1) lookup by id, category
+        and difficulty (see Quiz.from_index()).
+        
+        The index is built from load_questions() on first use and rebuilt only
+        after the questions file changes. Without a dedupe policy, the first
+        question with a given id is the one returned by lookups.
+        
+        Returns:
+            QuestionIndex: The questions, indexed by id
+        """
+        try:
+            st = os.stat(self.questions_path)
+            version = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            version = None
+        if self._index is None or self._index[0] != version:
+            # Duplicates were already resolved while loading, so only ids matter here
+            self._index = (version, QuestionIndex(self.load_questions(), match_text=False))
+        return self._index[1]
+
+    def question_by_id(self, question_id: str) -> Question | None:
+        """
+        Look up one question by id.
+        
+        Args:
+            question_id (str): The question's id
+        
+        Returns:
+            Question | None: The question, or None if the bank has no such id
+        """
+        return self.question_index().get(question_id)
+
+    def iter_questions(self):
+        """
+        Stream valid questions from the CSV file one at a time.
+        
+        Rows are parsed and validated exactly like load_questions(), but nothing is
+        kept in memory after a question is yielded, so even a bank with millions of
+        rows can be scanned in constant memory. The cache is not used.
+        
+        Yields:
+            Question: Each valid question, in file order
         """
-        questions = []
         try:
             # Open the questions CSV file for reading
             with open(self.questions_path, newline="", encoding="utf-8") as f:
@@ -72,33 +306,33 @@ class CSVRepository:
                 reader = csv.DictReader(f)
                 
                 for row in reader:
-                    # Split the choices field using the separator 
-                    choices = row["choices"].split(self.field_sep) if row.get("choices") else []
-                    
                     try:
-                        # Create a Question object from the CSV row
-                        q = Question(
-                            id=row.get("id", ""),
-                            text=row.get("text", ""),
-                            options=[c for c in choices if c],  # Filter out empty strings
-                            correct_index=int(row.get("correct_index", -1)),
-                           
-                        )
-                        
-                        #  add the question if it passes validation
-                        # (has text, has options, correct_index is valid)
-                        if q.is_valid():
-                            questions.append(q)
-                    except Exception:
-                        # Skip rows that can't be parsed (malformed data)
+                        yield parse_question_row(row, self.field_sep)
+                    except ValueError:
+                        # Skip rows that can't be parsed or fail validation
                         continue
                         
         except FileNotFoundError:
-            # If file doesn't exist, return empty list (no questions to load)
-            pass
+            # If file doesn't exist, there are no questions to yield
+            return
+
+    def sample_questions(self, k: int, seed: int | None = None):
+        """
+        Pick k random questions from the bank in a single streaming pass.
         
-        return questions
+        Uses reservoir sampling, so only k questions are held in memory no matter
+        how large the CSV file is.
+        
+        Args:
+            k (int): Number of questions to pick
+            seed (int | None): Seed for a reproducible sample, or None for a random one
+        
+        Returns:
+            list[Question]: Up to k questions (fewer if the bank is smaller)
+        """
+        return reservoir_sample(self.iter_questions(), k, random.Random(seed))
 
+    @metrics.timed("repo.append_result")
     def append_result(self, r: Result):
         """
         Save a quiz result to the results CSV file.
@@ -116,29 +350,308 @@ class CSVRepository:
         
        
         """
-        # Try to create the file with headers if it doesn't exist
+        with self.result_writer() as writer:
+            writer.write(r)
+        self._refresh_stats()
+
+    def append_results(self, results) -> int:
+        """
+        Save many quiz results in one go.
+        
+        The file is opened once and rows are written in buffered batches, which is
+        much faster than calling append_result() in a loop when importing or
+        replaying historical attempts.
+        
+        Args:
+            results (Iterable[Result]): The results to save, in order
+        
+        Returns:
+            int: Number of results written
+        """
+        with self.result_writer() as writer:
+            count = writer.write_many(results)
+        self._refresh_stats()
+        return count
+
+    def result_writer(self, buffer_size: int = 500, flush_interval: float = 1.0):
+        """
+        Open a buffered writer session on the results CSV file.
+        
+        Use it as a context manager so buffered rows are flushed on exit:
+        
+            with repo.result_writer() as writer:
+                for r in results:
+                    writer.write(r)
+        
+        Args:
+            buffer_size (int): Number of buffered rows that triggers a flush
+            flush_interval (float): Seconds after which buffered rows are flushed
+        
+        Returns:
+            ResultWriter: An open writer for results_path
+        """
+        return ResultWriter(
+            self.results_path, buffer_size=buffer_size, flush_interval=flush_interval, lock=self.lock_writes
+        )
+
+    def result_stats(self) -> ResultStats:
+        """
+        Return running statistics over all saved results.
+        
+        The aggregates (count, sums and sums of squares of score and time, pass
+        count, per-user best) are kept up to date on every append, so this costs
+        O(1) instead of a full load_results(). They are checkpointed to a sidecar
+        file, together with the byte offset they cover and a fingerprint of the
+        file (see _file_identity), so a new process only reads rows added since
+        the checkpoint. Rows added by other processes are folded in on the next
+        call; if the file was truncated or replaced, the statistics are rebuilt
+        from scratch.
+        
+        Returns:
+            ResultStats: The same numbers ResultStats.from_results(load_results()) gives
+        """
+        self._refresh_stats()
+        if self._stats_offset == self._results_size():
+            return self._stats
+        # The file ends in a row without its newline: count it, like
+        # load_results() does, without folding it into the saved statistics
+        tail = self._unterminated_results(self._stats_offset, None if self._stats_offset == 0 else RESULT_FIELDS)
+        if not tail:
+            return self._stats
+        stats = ResultStats.from_dict(self._stats.to_dict())
+        for r in tail:
+            stats.add(r)
+        return stats
+
+    def _refresh_stats(self):
+        """
+        Fold any rows not yet covered by the running statistics into them.
+        
+        Only the bytes appended since the last refresh are read.
+        """
+        # Imported here because the tail module imports this one
+        from .tail import ResultsTailReader
+        
+        size = self._check_stats_file()
+        if size == self._stats_offset:
+            return
+        
+        reader = ResultsTailReader(self.results_path, offset=self._stats_offset)
+        rows = 0
+        # Streamed, so a cold build over a large file doesn't load every row at once
+        for r in reader.iter_new():
+            self._stats.add(r)
+            rows += 1
+        self._stats_offset = reader.offset
+        self._stats_folded(rows)
+
+    def _stats_covered_bytes(self) -> int:
+        """Number of bytes at the start of the results file the statistics cover."""
+        return self._stats_offset
+
+    def _results_size(self) -> int:
+        """Size of the results file in the unit of _stats_offset (0 if it's missing)."""
         try:
-            with open(self.results_path, "x", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(
-                    f, 
-                    fieldnames=["user_name", "score", "total_questions", "time_taken", "timestamp"]
-                )
-                # Write the header row
-                writer.writeheader()
-        except FileExistsError:
-            # File already exists, so skip header creation
-            pass
+            return os.path.getsize(self.results_path)
+        except FileNotFoundError:
+            return 0
+
+    def _check_stats_file(self) -> int:
+        """
+        Load the statistics if needed, and start them over if the results file
+        no longer starts with the part they cover (it was truncated, replaced or
+        rewritten).
+        
+        Returns:
+            int: The current size of the results file, in the unit of _stats_offset
+        """
+        if self._stats is None:
+            self._load_stats()
+        size = self._results_size()
+        if self._stats_offset and (
+            size < self._stats_offset
+            or _file_identity(self.results_path, self._stats_covered_bytes()) != self._stats_file
+        ):
+            self._stats = ResultStats()
+            self._stats_offset = 0
+            self._stats_file = None
+            # Make sure the stale checkpoint is replaced even if nothing is folded in
+            self._stats_unsaved = _MIN_ROWS_BETWEEN_SAVES
+            if size == 0:
+                self._save_stats()
+        return size
+
+    def _stats_folded(self, rows: int):
+        """
+        Record that rows were folded in up to _stats_offset, and checkpoint the
+        statistics when enough rows have piled up.
+        
+        Writing the sidecar costs O(users) (it holds every user's best score),
+        so it is only written once at least as many rows as there are users
+        were folded in since the last write. That keeps appends O(1) amortized;
+        a process that stops before the next checkpoint just leaves a few more
+        rows for the next one to fold in.
+        """
+        self._stats_file = _file_identity(self.results_path, self._stats_covered_bytes())
+        self._stats_unsaved += rows
+        if self._stats_unsaved >= max(_MIN_ROWS_BETWEEN_SAVES, len(self._stats.best_by_user)):
+            self._save_stats()
+
+    def _load_stats(self):
+        """Load the statistics sidecar, or start empty if it's missing or unreadable."""
+        try:
+            data = _read_sidecar(self.stats_path)
+            self._stats = ResultStats.from_dict(data["stats"])
+            self._stats_offset = int(data["offset"])
+            # Sidecars written before fingerprints were added never match, so they are rebuilt
+            self._stats_file = data.get("file")
+        except (FileNotFoundError, ValueError, KeyError, TypeError, AttributeError):
+            self._stats = ResultStats()
+            self._stats_offset = 0
+            self._stats_file = None
+        self._stats_unsaved = 0
+
+    def _save_stats(self):
+        """Write the statistics sidecar atomically."""
+        _write_sidecar(self.stats_path, {
+            "offset": self._stats_offset,
+            "file": self._stats_file,
+            "stats": self._stats.to_dict(),
+        })
+        self._stats_unsaved = 0
+
+    def append_answers(self, answers) -> int:
+        """
+        Append answers to the answers log and update the per-question counters.
+        
+        The log is append-only, like the results file, and uses the same buffered
+        writer (and file lock, if lock_writes is on).
+        
+        Args:
+            answers (Iterable[Answer]): The answers to save, e.g. Quiz.answer_log(result)
+        
+        Returns:
+            int: Number of answers written
+        """
+        with ResultWriter(self.answers_path, lock=self.lock_writes, fieldnames=ANSWER_FIELDS) as writer:
+            count = writer.write_many(answers)
+        self._refresh_question_stats()
+        return count
+
+    def iter_answers(self):
+        """
+        Lazily yield every answer in the log, oldest first.
+        
+        Yields:
+            Answer: Each answer. Malformed rows are skipped.
+        """
+        try:
+            with open(self.answers_path, newline="", encoding="utf-8") as f:
+                # Columns are read by position, like _refresh_question_stats(): new
+                # columns are only ever appended, so logs started with an older
+                # header still read back every value
+                reader = csv.DictReader(f, fieldnames=ANSWER_FIELDS)
+                next(reader, None)  # header
+                for row in reader:
+                    try:
+                        yield self._row_to_answer(row)
+                    except Exception:
+                        continue
+        except FileNotFoundError:
+            return
+
+    def question_stats(self) -> dict[str, QuestionStats]:
+        """
+        Return per-question counters over the whole answers log.
+        
+        Like result_stats(), the counters live in a sidecar file, fingerprinted
+        and checkpointed the same way, and only answers appended since the last
+        call are read, so an item-difficulty report (see
+        logic.stats.difficulty_report) never re-scans the full log. If the log
+        was truncated or replaced, the counters are rebuilt from scratch.
         
-        # Append the result as a new row
-        with open(self.results_path, "a", newline="", encoding="utf-8") as f:
-            # "a" mode appends to the file
-            writer = csv.DictWriter(
-                f,
-                fieldnames=["user_name", "score", "total_questions", "time_taken", "timestamp"]
-            )
-            # Write the result data as a single row
-            writer.writerow(r.to_dict())
+        Returns:
+            dict[str, QuestionStats]: Counters keyed by question id, the same as
+                                      question_stats_from_answers(iter_answers()) gives
+        """
+        self._refresh_question_stats()
+        return self._question_stats
 
+    def _refresh_question_stats(self):
+        """
+        Fold answers appended since the last refresh into the per-question counters.
+        """
+        if self._question_stats is None:
+            self._load_question_stats()
+        try:
+            size = os.path.getsize(self.answers_path)
+        except FileNotFoundError:
+            size = 0
+        if self._question_stats_offset and (
+            size < self._question_stats_offset
+            or _file_identity(self.answers_path, self._question_stats_offset) != self._question_stats_file
+        ):
+            # The log was truncated, replaced or rewritten, so the counters no longer match it
+            self._question_stats = {}
+            self._question_stats_offset = 0
+            self._question_stats_file = None
+            # Make sure the stale checkpoint is replaced even if nothing is read
+            self._question_stats_unsaved = _MIN_ROWS_BETWEEN_SAVES
+            if size == 0:
+                self._save_question_stats()
+        if size == self._question_stats_offset:
+            return
+        
+        start = self._question_stats_offset
+        rows = 0
+        with open(self.answers_path, "rb") as f:
+            f.seek(start)
+            # Only whole rows; a row another process is still writing is read next time
+            for end, row in _scan_rows(f):
+                if self._question_stats_offset == 0:
+                    # The header row (only there when reading from the start of the log)
+                    self._question_stats_offset = end
+                    continue
+                self._question_stats_offset = end
+                rows += 1
+                try:
+                    a = self._row_to_answer(_row_dict(ANSWER_FIELDS, row))
+                except Exception:
+                    continue
+                self._question_stats.setdefault(a.question_id, QuestionStats()).add(a)
+        if self._question_stats_offset == start:
+            return
+        self._question_stats_file = _file_identity(self.answers_path, self._question_stats_offset)
+        # Writing the sidecar costs O(questions), so like _stats_folded() it is
+        # only written once at least that many answers were read since the last write
+        self._question_stats_unsaved += rows
+        if self._question_stats_unsaved >= max(_MIN_ROWS_BETWEEN_SAVES, len(self._question_stats)):
+            self._save_question_stats()
+
+    def _load_question_stats(self):
+        """Load the per-question counters sidecar, or start empty if it's missing or unreadable."""
+        try:
+            data = _read_sidecar(self.question_stats_path)
+            self._question_stats = {qid: QuestionStats.from_dict(s) for qid, s in data["questions"].items()}
+            self._question_stats_offset = int(data["offset"])
+            # Sidecars written before fingerprints were added never match, so they are rebuilt
+            self._question_stats_file = data.get("file")
+        except (FileNotFoundError, ValueError, KeyError, TypeError, AttributeError):
+            self._question_stats = {}
+            self._question_stats_offset = 0
+            self._question_stats_file = None
+        self._question_stats_unsaved = 0
+
+    def _save_question_stats(self):
+        """Write the per-question counters sidecar atomically."""
+        _write_sidecar(self.question_stats_path, {
+            "offset": self._question_stats_offset,
+            "file": self._question_stats_file,
+            "questions": {qid: s.to_dict() for qid, s in self._question_stats.items()},
+        })
+        self._question_stats_unsaved = 0
+
+    @metrics.timed("repo.load_results")
     def load_results(self):
         """
         Load all saved quiz results from the CSV file.
@@ -151,33 +664,434 @@ class CSVRepository:
                          Empty list if file not found or no results exist.
         
        
+        """
+        return list(self.iter_results())
+
+    def iter_results(self, offset: int = 0, limit: int | None = None):
+        """
+        Lazily yield saved quiz results, one page at a time.
+        
+        Unlike load_results(), this never builds the full list: rows are read and
+        converted only as the caller consumes them, so a screen can show one page
+        of a very large history without loading the rest. A page further down the
+        file is found through the row index (see count_results()), so reading it
+        costs the page size, not its position in the file.
+        
+        Args:
+            offset (int): Number of results to skip before yielding
+            limit (int | None): Maximum number of results to yield, or None for all
+        
+        Yields:
+            Result: Each result in the window. Malformed rows are skipped and do not
+                   count towards offset or limit, so positions match count_results().
+        """
+        if limit is not None and limit <= 0:
+            return
+        fields = None
+        if offset > 0:
+            self._refresh_row_index()
+            if not self._row_offsets:
+                return
+            block = min(offset // _ROW_INDEX_STRIDE, len(self._row_offsets) - 1)
+            start = self._row_offsets[block]
+            fields = self._rows_fields
+            offset -= block * _ROW_INDEX_STRIDE
+        try:
+            f = open(self.results_path, "rb")
+        except FileNotFoundError:
+            # If file doesn't exist, there is nothing to yield
+            return
+        with f:
+            if fields is not None:
+                f.seek(start)
+            for _, row in _scan_rows(f, eof_ends_row=True):
+                if fields is None:
+                    fields = row  # the header row
+                    continue
+                try:
+                    r = self._row_to_result(_row_dict(fields, row))
+                except Exception:
+                    # Skip rows that can't be converted (malformed data)
+                    continue
+                if offset:
+                    offset -= 1
+                    continue
+                yield r
+                if limit is not None:
+                    limit -= 1
+                    if not limit:
+                        return
+
+    def count_results(self) -> int:
+        """
+        Count the results in the results CSV.
+        
+        Used together with iter_results() to size a paged view. The count comes
+        from the row index, which is checkpointed to a sidecar file and only
+        extended with rows appended since, so this does not re-read the file.
+        A last row without its newline is counted, as load_results() reads it,
+        but it is left out of the index until it is complete.
+        
+        Returns:
+            int: Number of results (malformed rows are not counted). 0 if the file
+                 doesn't exist.
+        """
+        self._refresh_row_index()
+        if self._rows_end == self._results_size():
+            return self._rows_count
+        return self._rows_count + len(self._unterminated_results(self._rows_end, self._rows_fields))
+
+    def _unterminated_results(self, start: int, fields: list[str] | None) -> list[Result]:
+        """
+        Read the results from byte offset start to the end of the file, treating
+        the end of the file as the end of the last row.
+        
+        Incremental readers stop before a last row that has no newline yet; this
+        reads that remainder (normally at most one row) without consuming it.
+        
+        Args:
+            start (int): Offset where the complete rows end
+            fields (list[str] | None): The header, or None if start is before it
+        
+        Returns:
+            list[Result]: The valid results in the remainder
         """
         results = []
         try:
-            # Open the results CSV file for reading
-            with open(self.results_path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                
-                for row in reader:
+            with open(self.results_path, "rb") as f:
+                f.seek(start)
+                for _, row in _scan_rows(f, eof_ends_row=True):
+                    if fields is None:
+                        fields = row
+                        continue
                     try:
-                        # Convert CSV row back into Result object
-                        # Handle type conversions: score and total_questions are integers,
-                        # time_taken is a float, user_name can be None
-                        results.append(
-                            Result(
-                                user_name=row.get("user_name") or None,  # Empty string → None
-                                score=int(row.get("score", 0)),           # Convert to int
-                                total_questions=int(row.get("total_questions", 0)),  # Convert to int
-                                time_taken=float(row.get("time_taken", 0.0)),  # Convert to float
-                                timestamp=row.get("timestamp") or "",  # Keep as string or empty
-                            )
-                        )
+                        results.append(self._row_to_result(_row_dict(fields, row)))
                     except Exception:
-                        # Skip rows that can't be converted (malformed data)
                         continue
-                        
         except FileNotFoundError:
-            # If file doesn't exist, return empty list
             pass
+        return results
+
+    def _refresh_row_index(self):
+        """
+        Bring the row index up to date with the results file.
+        
+        Rows appended since the last refresh are indexed; if the file no longer
+        starts with the part the index covers (see _file_identity), the index is
+        rebuilt from the start of the file.
+        """
+        if self._row_offsets is None:
+            self._load_row_index()
+        try:
+            size = os.path.getsize(self.results_path)
+        except FileNotFoundError:
+            size = 0
+        if self._rows_end and (size < self._rows_end
+                               or _file_identity(self.results_path, self._rows_end) != self._rows_file):
+            self._row_offsets, self._rows_count, self._rows_end, self._rows_fields = [], 0, 0, None
+        if size == self._rows_end:
+            return
+        
+        indexed_end = self._rows_end
+        with open(self.results_path, "rb") as f:
+            f.seek(self._rows_end)
+            for end, row in _scan_rows(f):
+                if self._rows_fields is None:
+                    self._rows_fields = row
+                else:
+                    try:
+                        self._row_to_result(_row_dict(self._rows_fields, row))
+                    except Exception:
+                        row = None
+                    if row is not None:
+                        if self._rows_count % _ROW_INDEX_STRIDE == 0:
+                            self._row_offsets.append(self._rows_end)
+                        self._rows_count += 1
+                self._rows_end = end
+        if self._rows_end == indexed_end:
+            return  # only a partly written row was added
+        self._rows_file = _file_identity(self.results_path, self._rows_end)
+        _write_sidecar(self.row_index_path, {
+            "end": self._rows_end,
+            "file": self._rows_file,
+            "count": self._rows_count,
+            "fields": self._rows_fields,
+            "offsets": self._row_offsets,
+        })
+
+    def _load_row_index(self):
+        """Load the row index sidecar, or start empty if it's missing or unreadable."""
+        try:
+            data = _read_sidecar(self.row_index_path)
+            self._row_offsets = [int(o) for o in data["offsets"]]
+            self._rows_count = int(data["count"])
+            self._rows_end = int(data["end"])
+            self._rows_fields = data["fields"]
+            self._rows_file = data["file"]
+        except (FileNotFoundError, ValueError, KeyError, TypeError, AttributeError):
+            self._row_offsets, self._rows_count, self._rows_end = [], 0, 0
+            self._rows_fields = self._rows_file = None
+
+    @staticmethod
+    def _row_to_result(row: dict) -> Result:
+        """
+        Convert one results CSV row into a Result object.
+        
+        Handles type conversions: score and total_questions are integers,
+        time_taken is a float, user_name can be None.
+        
+        Raises:
+            ValueError: If a numeric field can't be converted
+        """
+        return Result(
+            user_name=row.get("user_name") or None,  # Empty string → None
+            score=int(row.get("score", 0)),           # Convert to int
+            total_questions=int(row.get("total_questions", 0)),  # Convert to int
+            time_taken=float(row.get("time_taken", 0.0)),  # Convert to float
+            timestamp=row.get("timestamp") or "",  # Keep as string or empty
+        )
+
+    @staticmethod
+    def _row_to_answer(row: dict) -> Answer:
+        """
+        Convert one answers log row into an Answer object.
+        
+        Raises:
+            ValueError: If a numeric field can't be converted
+        """
+        selected = row.get("selected_index")
+        seed = row.get("seed")
+        return Answer(
+            user_name=row.get("user_name") or None,
+            timestamp=row.get("timestamp") or "",
+            question_id=row["question_id"],
+            selected_index=int(selected) if selected else None,  # Empty string → skipped
+            correct=row.get("correct") == "1",
+            dwell_time=float(row.get("dwell_time") or 0.0),
+            seed=int(seed) if seed else None,  # Empty or missing (older logs) → not shuffled
+        )
+
+
+def _file_identity(path: str, covered: int) -> dict | None:
+    """
+    Fingerprint the first `covered` bytes of a data file.
+    
+    A sidecar stores this next to the offset it covers. The device and inode
+    change when the file is replaced (rotated, restored from a backup, saved by
+    an editor); the hash of its first bytes and of the bytes just before the
+    offset changes when it is rewritten in place. Either way the sidecar's
+    totals no longer describe the file and must be rebuilt.
+    
+    Args:
+        path (str): The data file
+        covered (int): Number of bytes at the start of the file the sidecar covers
+    
+    Returns:
+        dict | None: {"dev", "ino", "hash"}, or None if the file doesn't exist
+    """
+    try:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            digest = hashlib.sha1(f.read(min(covered, _IDENTITY_HEAD)))
+            if covered > _IDENTITY_HEAD:
+                f.seek(max(_IDENTITY_HEAD, covered - _IDENTITY_TAIL))
+                digest.update(f.read(covered - f.tell()))
+    except FileNotFoundError:
+        return None
+    return {"dev": st.st_dev, "ino": st.st_ino, "hash": digest.hexdigest()}
+
+
+def _row_dict(fields: list[str], row: list[str]) -> dict:
+    """
+    Pair a CSV row with its column names the way csv.DictReader does.
+    
+    Missing trailing columns are None (so a cut-off row fails conversion instead
+    of falling back to defaults) and extra values are ignored.
+    """
+    return dict(zip(fields, row + [None] * (len(fields) - len(row))))
+
+
+def _scan_rows(f, eof_ends_row: bool = False):
+    """
+    Read CSV rows from a binary file, starting at its current position.
+    
+    By default only complete rows are returned: a row another process may still
+    be writing (no trailing newline yet, or a quoted field that has not been
+    closed) is held back, so an incremental reader can read the file again from
+    the last end offset later. A full read passes eof_ends_row=True to treat the
+    end of the file as the end of the last row, like csv.reader does. Blank rows
+    are skipped.
+    
+    Args:
+        f: A file opened in binary mode
+        eof_ends_row (bool): Also return a last row that the file ends in the middle of
+    
+    Yields:
+        tuple[int, list[str]]: The byte offset just past each row, and its fields
+    """
+    pos = f.tell()
+    at_eof = False
+    
+    def lines():
+        nonlocal pos, at_eof
+        for raw in iter(f.readline, b""):
+            if not raw.endswith(b"\n") and not eof_ends_row:
+                break
+            pos += len(raw)
+            yield raw.decode("utf-8", errors="replace")
+        at_eof = True
+    
+    # csv.reader asks for the next line only while a row is unfinished, so pos is
+    # just past the current row whenever one is yielded
+    for row in csv.reader(lines()):
+        if at_eof and not eof_ends_row:
+            return  # the file ended inside a quoted field
+        if row:
+            yield pos, row
+
+
+def _read_sidecar(path: str) -> dict:
+    """
+    Read a JSON sidecar file.
+    
+    Raises:
+        FileNotFoundError: If the sidecar doesn't exist
+        ValueError: If it isn't valid JSON
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_sidecar(path: str, data: dict):
+    """Write a JSON sidecar file atomically, ignoring failures."""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Sidecars are only caches of the CSV files; they are rebuilt if missing
+        pass
+
+
+class ResultWriter:
+    """
+    Buffered writer session for a results CSV file.
+    
+    Keeps one file handle open for the whole session and writes rows in batches
+    instead of opening the file once per result. Buffered rows are flushed when:
+    - buffer_size rows are waiting
+    - flush_interval seconds have passed since the last flush (checked on each write)
+    - flush() or close() is called, or the with-block ends
+    
+    Each flush is a single write() of whole rows. With lock=True that write (and
+    the check for whether the header is still needed) happens while holding an
+    inter-process file lock, so several App processes can share one results file
+    without duplicate headers or interleaved partial rows.
+    
+    Attributes:
+        path (str): File path to the results CSV file
+        buffer_size (int): Number of buffered rows that triggers a flush
+        flush_interval (float): Seconds after which buffered rows are flushed
+        lock (bool): Whether flushes are coordinated with other processes
+        fieldnames (list[str]): Column order of the file
+    """
+    
+    def __init__(self, path: str, buffer_size: int = 500, flush_interval: float = 1.0, lock: bool = False,
+                 fieldnames: list[str] = RESULT_FIELDS):
+        """
+        Open the results file for appending.
+        
+        Args:
+            path (str): Path to the results CSV file
+            buffer_size (int): Number of buffered rows that triggers a flush
+            flush_interval (float): Seconds after which buffered rows are flushed
+            lock (bool): Hold an inter-process lock while flushing
+            fieldnames (list[str]): Column order; rows are written from each item's
+                                    to_dict() (RESULT_FIELDS for results, ANSWER_FIELDS
+                                    for the answers log)
+        """
+        self.path = path
+        self.buffer_size = max(1, buffer_size)
+        self.flush_interval = flush_interval
+        self.lock = lock
+        self.fieldnames = fieldnames
+        
+        # One handle for the whole session; "a" mode always writes at the end of the file
+        self._file = open(path, "a", newline="", encoding="utf-8")
+        
+        # Rows are formatted into memory first so each flush is one write() call
+        self._buffer = io.StringIO()
+        self._writer = csv.DictWriter(self._buffer, fieldnames=fieldnames)
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, r: Result):
+        """
+        Buffer one result, flushing if the size or time limit is reached.
+        
+        Args:
+            r (Result): The result to save
+        """
+        self._writer.writerow(r.to_dict())
+        self._pending += 1
+        if self._pending >= self.buffer_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def write_many(self, results) -> int:
+        """
+        Buffer every result from an iterable.
         
-        return results
\ No newline at end of file
+        Args:
+            results (Iterable[Result]): The results to save, in order
+        
+        Returns:
+            int: Number of results written
+        """
+        count = 0
+        for r in results:
+            self.write(r)
+            count += 1
+        return count
+
+    def flush(self):
+        """
+        Write all buffered rows to disk.
+        
+        The header row is written first if the file is still empty.
+        """
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        rows = self._buffer.getvalue()
+        
+        with (file_lock(self.path) if self.lock else contextlib.nullcontext()):
+            # Check the size on disk (not our position) so another process's header counts
+            if os.fstat(self._file.fileno()).st_size == 0:
+                header = io.StringIO()
+                csv.DictWriter(header, fieldnames=self.fieldnames).writeheader()
+                rows = header.getvalue() + rows
+            self._file.write(rows)
+            self._file.flush()
+        
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._pending = 0
+
+    def close(self):
+        """
+        Flush any buffered rows and close the file.
+        """
+        if self._file.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
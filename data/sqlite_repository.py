@@ -0,0 +1,464 @@
+"""
+SQLite Data Repository Module
+
+This module provides an SQLite persistence layer for the quiz application. It
+has the same load_questions()/append_result()/load_results() surface as
+CSVRepository, and adds indexed queries over results (leaderboards, per-user
+history, date ranges) that would otherwise need a full load_results() and
+filtering in Python.
+
+Existing CSV files can be imported from the command line:
+    python -m App.data.sqlite_repository quiz.db --questions App/csv_files/questions.csv --results App/csv_files/results.csv
+"""
+
+import argparse
+import sqlite3
+import threading
+
+from ..logic import metrics
+from ..logic.models import Answer, Question, Result
+from ..logic.stats import QuestionStats
+from .repository import CSVRepository
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    position INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    text TEXT NOT NULL,
+    choices TEXT NOT NULL,
+    correct_index INTEGER NOT NULL,
+    category TEXT NOT NULL DEFAULT '',
+    difficulty TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS results (
+    rowid INTEGER PRIMARY KEY,
+    user_name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    total_questions INTEGER NOT NULL,
+    time_taken REAL NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_user ON results (user_name, timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_timestamp ON results (timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_leaderboard ON results (score DESC, time_taken ASC);
+CREATE TABLE IF NOT EXISTS answers (
+    rowid INTEGER PRIMARY KEY,
+    user_name TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    selected_index INTEGER,
+    correct INTEGER NOT NULL,
+    dwell_time REAL NOT NULL,
+    seed INTEGER
+);
+CREATE TABLE IF NOT EXISTS question_stats (
+    question_id TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    skipped INTEGER NOT NULL,
+    dwell_sum REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS question_option_counts (
+    question_id TEXT NOT NULL,
+    option_index INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (question_id, option_index)
+);
+"""
+
+# (table, column, definition) of columns added to SCHEMA after its first release
+_ADDED_COLUMNS = [
+    ("questions", "category", "TEXT NOT NULL DEFAULT ''"),
+    ("questions", "difficulty", "TEXT NOT NULL DEFAULT ''"),
+    ("answers", "seed", "INTEGER"),
+]
+
+_RESULT_COLUMNS = "user_name, score, total_questions, time_taken, timestamp"
+
+
+def _to_result(row) -> Result:
+    """Convert a results table row into a Result (empty name becomes None, like the CSV loader)."""
+    user_name, score, total_questions, time_taken, timestamp = row
+    return Result(
+        user_name=user_name or None,
+        score=score,
+        total_questions=total_questions,
+        time_taken=time_taken,
+        timestamp=timestamp,
+    )
+
+
+def _to_params(r: Result) -> tuple:
+    """Convert a Result into parameters for an INSERT into results."""
+    return (r.user_name or "", int(r.score), int(r.total_questions), float(r.time_taken), r.timestamp or "")
+
+
+class SQLiteRepository:
+    """
+    Manages reading and writing quiz data in an SQLite database.
+
+    The database runs in WAL mode, so the results screen can read while another
+    process is saving a result. Each thread gets one pooled connection that is
+    opened on first use and reused afterwards (sqlite3 connections can't be
+    shared between threads).
+
+    Answers are logged in their own table, and per-question counters
+    (question_stats, question_option_counts) are updated in the same transaction.
+
+    Indexed queries:
+    - top_n(): leaderboard by score, ties broken by fastest time
+    - results_for_user(): one user's history
+    - results_between(): attempts within a timestamp range
+    - attempts_per_day(): number of attempts per calendar day
+
+    Attributes:
+        db_path (str): File path to the SQLite database
+        field_sep (str): Separator used to store multiple answer choices in one column
+    """
+
+    def __init__(self, db_path: str, field_sep: str = "||"):
+        """
+        Initialize the repository and create the schema if needed.
+
+        Args:
+            db_path (str): Path to the SQLite database file (created if missing)
+            field_sep (str): Separator used to join answer choices when storing them
+        """
+        self.db_path = db_path
+        self.field_sep = field_sep
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        conn = self._conn()
+        conn.executescript(SCHEMA)
+        # Databases created by older versions lack columns added to SCHEMA since
+        for table, column, definition in _ADDED_COLUMNS:
+            if column not in {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+        conn.commit()
+
+    # --- Connection pool ---
+    def _conn(self) -> sqlite3.Connection:
+        """
+        Return this thread's pooled connection, opening it on first use.
+
+        Returns:
+            sqlite3.Connection: A connection configured for WAL mode
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Each connection is only used by its own thread; check_same_thread=False
+            # just lets close() release them all from whichever thread calls it
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # NORMAL is durable across application crashes in WAL mode and avoids an fsync per commit
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self):
+        """
+        Close every pooled connection.
+        """
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    # --- Questions ---
+    @metrics.timed("repo.load_questions")
+    def load_questions(self):
+        """
+        Load all quiz questions from the database, in their stored order.
+
+        Like CSVRepository.load_questions(), only questions that pass
+        Question.is_valid() are returned.
+
+        Returns:
+            list[Question]: List of valid Question objects. Empty list if there are none.
+        """
+        questions = []
+        rows = self._conn().execute(
+            "SELECT id, text, choices, correct_index, category, difficulty FROM questions ORDER BY position")
+        for qid, text, choices, correct_index, category, difficulty in rows:
+            q = Question(
+                id=qid,
+                text=text,
+                options=[c for c in choices.split(self.field_sep) if c],
+                correct_index=correct_index,
+                category=category,
+                difficulty=difficulty,
+            )
+            if q.is_valid():
+                questions.append(q)
+        return questions
+
+    def replace_questions(self, questions) -> int:
+        """
+        Replace the stored question bank.
+
+        Args:
+            questions (Iterable[Question]): The new questions, in display order
+
+        Returns:
+            int: Number of questions stored
+        """
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM questions")
+            cur = conn.executemany(
+                "INSERT INTO questions (id, text, choices, correct_index, category, difficulty) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                ((q.id, q.text, self.field_sep.join(q.options), q.correct_index, q.category, q.difficulty)
+                 for q in questions),
+            )
+        return cur.rowcount
+
+    # --- Results ---
+    @metrics.timed("repo.append_result")
+    def append_result(self, r: Result):
+        """
+        Save a quiz result.
+
+        Args:
+            r (Result): The Result object to save
+        """
+        self.append_results([r])
+
+    def append_results(self, results) -> int:
+        """
+        Save many quiz results in one transaction.
+
+        Args:
+            results (Iterable[Result]): The results to save, in order
+
+        Returns:
+            int: Number of results written
+        """
+        conn = self._conn()
+        with conn:
+            cur = conn.executemany(
+                f"INSERT INTO results ({_RESULT_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                (_to_params(r) for r in results),
+            )
+        return cur.rowcount
+
+    @metrics.timed("repo.load_results")
+    def load_results(self):
+        """
+        Load all saved quiz results in the order they were saved.
+
+        Returns:
+            list[Result]: List of Result objects. Empty list if there are none.
+        """
+        return list(self.iter_results())
+
+    def iter_results(self, offset: int = 0, limit: int | None = None):
+        """
+        Lazily yield saved quiz results, one page at a time.
+
+        Args:
+            offset (int): Number of results to skip
+            limit (int | None): Maximum number of results to yield, or None for all
+
+        Yields:
+            Result: Each result in the window, in the order they were saved
+        """
+        rows = self._conn().execute(
+            f"SELECT {_RESULT_COLUMNS} FROM results ORDER BY rowid LIMIT ? OFFSET ?",
+            (-1 if limit is None else limit, max(0, offset)),
+        )
+        for row in rows:
+            yield _to_result(row)
+
+    def count_results(self) -> int:
+        """
+        Return the number of stored results.
+
+        Returns:
+            int: Number of rows in the results table
+        """
+        return self._conn().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def top_n(self, n: int = 10):
+        """
+        Return the leaderboard: highest scores first, fastest time breaking ties.
+
+        Args:
+            n (int): Number of results to return
+
+        Returns:
+            list[Result]: Up to n results
+        """
+        rows = self._conn().execute(
+            f"SELECT {_RESULT_COLUMNS} FROM results ORDER BY score DESC, time_taken ASC LIMIT ?",
+            (n,),
+        )
+        return [_to_result(row) for row in rows]
+
+    def results_for_user(self, user_name: str):
+        """
+        Load every result saved under one user name.
+
+        Args:
+            user_name (str): The exact user name to look up
+
+        Returns:
+            list[Result]: The user's results ordered by timestamp
+        """
+        rows = self._conn().execute(
+            f"SELECT {_RESULT_COLUMNS} FROM results WHERE user_name = ? ORDER BY timestamp, rowid",
+            (user_name or "",),
+        )
+        return [_to_result(row) for row in rows]
+
+    def results_between(self, start: str | None = None, end: str | None = None):
+        """
+        Load the results whose timestamp falls within [start, end].
+
+        Args:
+            start (str | None): Inclusive lower bound, or None for no lower bound
+            end (str | None): Inclusive upper bound, or None for no upper bound
+
+        Returns:
+            list[Result]: Matching results ordered by timestamp
+        """
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("timestamp <= ?")
+            params.append(end)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn().execute(
+            f"SELECT {_RESULT_COLUMNS} FROM results {where} ORDER BY timestamp, rowid",
+            params,
+        )
+        return [_to_result(row) for row in rows]
+
+    def attempts_per_day(self) -> dict[str, int]:
+        """
+        Count attempts per calendar day.
+
+        Returns:
+            dict[str, int]: Maps "YYYY-MM-DD" to the number of attempts that day
+        """
+        rows = self._conn().execute(
+            "SELECT substr(timestamp, 1, 10) AS day, COUNT(*) FROM results GROUP BY day ORDER BY day"
+        )
+        return dict(rows)
+
+    # --- Answers ---
+    def append_answers(self, answers) -> int:
+        """
+        Log answers and update the per-question counters in one transaction.
+
+        Args:
+            answers (Iterable[Answer]): The answers to save, e.g. Quiz.answer_log(result)
+
+        Returns:
+            int: Number of answers written
+        """
+        answers = list(answers)
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT INTO answers (user_name, timestamp, question_id, selected_index, correct, dwell_time, seed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((a.user_name or "", a.timestamp or "", a.question_id, a.selected_index, int(a.correct),
+                  float(a.dwell_time), a.seed) for a in answers),
+            )
+            conn.executemany(
+                "INSERT INTO question_stats (question_id, attempts, correct, skipped, dwell_sum) "
+                "VALUES (?, 1, ?, ?, ?) "
+                "ON CONFLICT (question_id) DO UPDATE SET attempts = attempts + 1, "
+                "correct = correct + excluded.correct, skipped = skipped + excluded.skipped, "
+                "dwell_sum = dwell_sum + excluded.dwell_sum",
+                ((a.question_id, int(a.correct), int(a.selected_index is None), float(a.dwell_time))
+                 for a in answers),
+            )
+            conn.executemany(
+                "INSERT INTO question_option_counts (question_id, option_index, count) VALUES (?, ?, 1) "
+                "ON CONFLICT (question_id, option_index) DO UPDATE SET count = count + 1",
+                ((a.question_id, a.selected_index) for a in answers if a.selected_index is not None),
+            )
+        return len(answers)
+
+    def iter_answers(self):
+        """
+        Lazily yield every logged answer, oldest first.
+
+        Yields:
+            Answer: Each answer
+        """
+        rows = self._conn().execute(
+            "SELECT user_name, timestamp, question_id, selected_index, correct, dwell_time, seed "
+            "FROM answers ORDER BY rowid"
+        )
+        for user_name, timestamp, question_id, selected_index, correct, dwell_time, seed in rows:
+            yield Answer(user_name or None, timestamp, question_id, selected_index, bool(correct), dwell_time, seed)
+
+    def question_stats(self) -> dict[str, QuestionStats]:
+        """
+        Return the per-question counters, without reading the answers table.
+
+        Returns:
+            dict[str, QuestionStats]: Counters keyed by question id
+        """
+        conn = self._conn()
+        stats = {
+            qid: QuestionStats(attempts=attempts, correct=correct, skipped=skipped, dwell_sum=dwell_sum)
+            for qid, attempts, correct, skipped, dwell_sum in conn.execute(
+                "SELECT question_id, attempts, correct, skipped, dwell_sum FROM question_stats"
+            )
+        }
+        for qid, option_index, count in conn.execute(
+            "SELECT question_id, option_index, count FROM question_option_counts"
+        ):
+            stats[qid].option_counts[option_index] = count
+        return stats
+
+    # --- Import ---
+    def import_csv(self, questions_path: str | None = None, results_path: str | None = None) -> tuple[int, int]:
+        """
+        Import data from the existing CSV files.
+
+        Questions replace the stored bank; results are appended. Rows are read
+        with CSVRepository, so malformed rows are skipped the same way.
+
+        Args:
+            questions_path (str | None): Questions CSV to import, or None to skip
+            results_path (str | None): Results CSV to import, or None to skip
+
+        Returns:
+            tuple[int, int]: Number of questions and results imported
+        """
+        csv_repo = CSVRepository(questions_path or "", results_path or "", self.field_sep)
+        n_questions = self.replace_questions(csv_repo.load_questions()) if questions_path else 0
+        n_results = self.append_results(csv_repo.iter_results()) if results_path else 0
+        return n_questions, n_results
+
+
+def main(argv=None):
+    """Command-line entry point: import CSV files into an SQLite database."""
+    parser = argparse.ArgumentParser(description="Import quiz CSV files into an SQLite database.")
+    parser.add_argument("db_path", help="SQLite database to create or update")
+    parser.add_argument("--questions", help="questions CSV to import (replaces stored questions)")
+    parser.add_argument("--results", help="results CSV to import (appended)")
+    parser.add_argument("--sep", default="||", help='separator between choices (default "||")')
+    args = parser.parse_args(argv)
+
+    repo = SQLiteRepository(args.db_path, args.sep)
+    n_questions, n_results = repo.import_csv(args.questions, args.results)
+    repo.close()
+    print(f"Imported {n_questions} questions and {n_results} results into {args.db_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Results Tail Reader Module
+
+This module lets a live "recent attempts" board follow the results CSV file.
+Instead of re-reading the whole file with load_results(), the reader remembers
+how far it got and only parses rows appended since the previous poll.
+"""
+
+import os
+
+from .repository import CSVRepository, RESULT_FIELDS, _row_dict, _scan_rows
+
+# How many bytes are read at a time when looking back for the last complete line
+_SCAN_CHUNK = 64 * 1024
+
+
+class ResultsTailReader:
+    """
+    Incrementally reads new rows from a results CSV file.
+
+    Each call to poll() returns only the results appended since the last call.
+    When nothing changed, poll() costs a single os.stat(), so it is cheap to
+    call every second even on a very large file.
+
+    The reader copes with:
+    - partial rows: a row still being written (no trailing newline yet) is left
+      for the next poll
+    - truncation: if the file shrinks below the saved offset, it starts again
+      from the beginning
+    - rotation: if the path now points at a different file (e.g. results.csv was
+      moved away and recreated), it starts reading the new file from the beginning
+
+    Attributes:
+        path (str): File path to the results CSV file
+        offset (int): Byte offset just past the last row that was read
+    """
+
+    def __init__(self, path: str, from_end: bool = False, offset: int = 0):
+        """
+        Initialize the reader.
+
+        Args:
+            path (str): Path to the results CSV file
+            from_end (bool): If True, skip the rows already in the file and only
+                             report rows appended after the first poll
+            offset (int): Resume from a byte offset saved from a previous reader's
+                          offset attribute (the header is then assumed to be
+                          the standard RESULT_FIELDS)
+        """
+        self.path = path
+        self.offset = offset
+        self._from_end = from_end
+        self._file_id: tuple[int, int] | None = None
+        self._fields: list[str] | None = list(RESULT_FIELDS) if offset else None
+
+    def poll(self):
+        """
+        Return the results appended since the previous call.
+
+        Returns:
+            list[Result]: New results in file order. Empty list if there are none
+                         or the file doesn't exist.
+        """
+        return list(self.iter_new())
+
+    def iter_new(self):
+        """
+        Yield the results appended since the previous call, one at a time.
+
+        Like poll(), but the new rows are read and converted as they are consumed,
+        so following a large backlog (e.g. the first read of a big file) never
+        holds all of it in memory. The offset attribute advances past each row
+        as it is read.
+
+        Yields:
+            Result: New results in file order
+        """
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return
+
+        file_id = (st.st_dev, st.st_ino)
+        if self._file_id is None:
+            # First poll: adopt whatever file is there (a resumed offset is kept)
+            self._file_id = file_id
+        if file_id != self._file_id or st.st_size < self.offset:
+            # Rotated or truncated file: start over from the beginning
+            self._file_id = file_id
+            self.offset = 0
+            self._fields = None
+        elif st.st_size == self.offset:
+            # Nothing new since the last poll
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            # Rows are parsed as they are read, quote-aware: a half-written row
+            # (including one inside an unclosed quoted field) waits for the next poll
+            rows = _scan_rows(f)
+            if self._fields is None:
+                # The first row of the file is the header
+                first = next(rows, None)
+                if first is None:
+                    return
+                self.offset, self._fields = first
+                if self._from_end:
+                    # Skip everything that was already in the file without reading it
+                    self._from_end = False
+                    self.offset = max(self.offset, _last_line_end(f, st.st_size))
+                    return
+
+            for end, row in rows:
+                self.offset = end
+                try:
+                    result = CSVRepository._row_to_result(_row_dict(self._fields, row))
+                except Exception:
+                    # Skip rows that can't be converted (malformed data)
+                    continue
+                yield result
+
+
+def _last_line_end(f, size: int) -> int:
+    """
+    Find where the last line in the first size bytes of a file ends.
+
+    The file is read backwards from size in chunks, so only the tail is read
+    however large the file is.
+
+    Args:
+        f: A file opened in binary mode
+        size (int): Number of bytes at the start of the file to consider
+
+    Returns:
+        int: The byte offset just past the last newline, or 0 if there is none
+    """
+    end = size
+    while end > 0:
+        start = max(0, end - _SCAN_CHUNK)
+        f.seek(start)
+        newline = f.read(end - start).rfind(b"\n")
+        if newline >= 0:
+            return start + newline + 1
+        end = start
+    return 0
@@ -23,6 +23,11 @@ class QuestionScreen(tk.Frame):
         selected (tk.IntVar): Tracks which option the user selected (-1 = none selected)
         _radio_widgets (list): Stores all radio buttons for enabling/disabling
         _option_labels (list): Stores feedback labels (✓/✗) for each option
+        _option_rows (list): Pool of option row frames, reused from question to question
+    
+    The screen is meant to stay alive for a whole quiz: set_question() swaps the
+    content in place, and option rows are only created when a question has more
+    options than any question before it.
     """
     def __init__(self, parent, submit_callback, next_callback):
         """
@@ -43,6 +48,7 @@ class QuestionScreen(tk.Frame):
         self.selected = tk.IntVar(value=-1)
         self._radio_widgets: list[ttk.Radiobutton] = []
         self._option_labels: list[ttk.Label] = []
+        self._option_rows: list[ttk.Frame] = []
 
         # Layout configuration 
         self.columnconfigure(0, weight=1)
@@ -189,34 +195,36 @@ class QuestionScreen(tk.Frame):
         """
         self.next_callback()
 
+    def focus_default(self):
+        """
+        Set keyboard focus to the first answer option so the quiz can be
+        answered without the mouse.
+        """
+        if self._radio_widgets:
+            self._radio_widgets[0].focus_set()
+
     # Widgets Rendering  
     def _render_options(self, options: list[str]):
         """
-        Dynamically create radio buttons for each answer option.
+        Show a radio button for each answer option, reusing pooled rows.
         
         This method:
-        1. Clears any previously rendered options
-        2. Creates a radio button for each option text
-        3. Creates a placeholder label next to each button for feedback symbols (✓/✗)
-        4. Stores references to both for later use (locking, feedback display)
+        1. Creates new rows only if there are more options than pooled rows
+           (each row holds a radio button and a feedback label for ✓/✗)
+        2. Sets each visible radio button's text and clears its feedback label
+        3. Hides pooled rows that this question doesn't need
         
         Args:
             options (list[str]): List of answer option texts to display
         """
-        # Clear previous options
-        for w in self.options_frame.winfo_children():
-            w.destroy()
-        self._radio_widgets.clear()
-        self._option_labels.clear()
-
-        # Create UI for each option
-        for i, opt in enumerate(options):
+        # Grow the pool when this question has more options than any before it
+        while len(self._option_rows) < len(options):
+            i = len(self._option_rows)
             # Create a frame to hold the radio button and feedback label side by side
             row = ttk.Frame(self.options_frame)
-            row.pack(anchor="w", pady=2)
             
             # Create the radio button for this option
-            rb = ttk.Radiobutton(row, text=opt, value=i, variable=self.selected)
+            rb = ttk.Radiobutton(row, value=i, variable=self.selected)
             rb.pack(side="left")
             
             # Create placeholder label for feedback (✓ or ✗ will appear here)
@@ -224,5 +232,15 @@ class QuestionScreen(tk.Frame):
             fb.pack(side="left", padx=(8, 0))
             
             # Store references for later use
+            self._option_rows.append(row)
             self._radio_widgets.append(rb)
-            self._option_labels.append(fb)
\ No newline at end of file
+            self._option_labels.append(fb)
+
+        for i, row in enumerate(self._option_rows):
+            if i < len(options):
+                self._radio_widgets[i].config(text=options[i])
+                self._option_labels[i].config(text="")
+                # Hidden rows are always at the end, so re-packing keeps the order
+                row.pack(anchor="w", pady=2)
+            else:
+                row.pack_forget()
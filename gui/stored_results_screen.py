@@ -12,8 +12,16 @@ class StoredResultsScreen(ttk.Frame):
     - Score (e.g., 8/10)
     - Date & Time (e.g., 2024-02-20 14:30)
     - Time Taken in seconds (e.g., 245s)
+    
+    The table is virtualized: it only ever holds the rows that are visible, and
+    scrolling swaps their contents, so very large histories open instantly.
     """
     
+    # Number of extra results fetched above and below the visible page
+    PREFETCH = 50
+    # Approximate height of the heading row, in pixels
+    HEADING_HEIGHT = 25
+    
     def __init__(self, parent, exit_callback):
         """
         Initialize the StoredResultsScreen with a table for displaying past results.
@@ -48,6 +56,26 @@ class StoredResultsScreen(ttk.Frame):
         
         self.table.grid(row=1, column=0, sticky="nsew")
         
+        # The scrollbar drives our own virtual offset instead of the Treeview's yview
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+        
+        # Virtual list state (see display_paged)
+        self._total = 0
+        self._fetch = lambda offset, limit: []
+        self._top = 0
+        self._window_start = 0
+        self._window = []
+        self._visible_rows = 12
+        self._row_height = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+        
+        self.table.bind("<Configure>", self._on_resize)
+        self.table.bind("<MouseWheel>", self._on_mousewheel)
+        self.table.bind("<Button-4>", self._on_mousewheel)
+        self.table.bind("<Button-5>", self._on_mousewheel)
+        for key in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.table.bind(key, self._on_key)
+        
        
         self.rowconfigure(1, weight=1)
         
@@ -63,27 +91,142 @@ class StoredResultsScreen(ttk.Frame):
         Args:
             results (list[Result]): List of Result objects containing historical quiz attempts
         """
-        # Clear all existing rows from the table
-        for row_id in self.table.get_children():
-            self.table.delete(row_id)
-        
-        # Insert each result as a new row in the table
-        for r in results:
-            # Convert seconds to min and sec 
-            minutes = int(r.time_taken // 60)
-            seconds = int(r.time_taken % 60) 
-            time_formatted = f"{minutes}m {seconds}s"
-            
-            self.table.insert(
-                "", 
-                "end", 
-                values=(
-                    r.user_name or "—",                    
-                    f"{r.score}/{r.total_questions}",      
-                    r.timestamp,                           
-                    time_formatted                   
-                )
-            )
+        self.display_paged(len(results), lambda offset, limit: results[offset:offset + limit])
+
+    def display_paged(self, total: int, fetch):
+        """
+        Show results from a paged source without loading all of them.
+        
+        Only the rows that fit in the table are created; scrolling reuses those
+        rows and fetches new results on demand. Fetched results are kept in a
+        small window (the visible page plus PREFETCH rows either side) so short
+        scrolls don't hit the repository again.
+        
+        Args:
+            total (int): Total number of results available
+            fetch (function): Called as fetch(offset, limit) and returns an iterable
+                              of Result objects, e.g. CSVRepository.iter_results
+        """
+        self._total = total
+        self._fetch = fetch
+        self._top = 0
+        self._window_start = 0
+        self._window = []
+        self._render()
+
+    # Virtual scrolling
+    def _scroll_to(self, top: int):
+        """
+        Make the result at index top the first visible row.
+        
+        Args:
+            top (int): Index of the result to show first (clamped to the valid range)
+        """
+        top = max(0, min(top, self._total - self._visible_rows))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        """
+        Handle scrollbar drags and arrow clicks.
+        
+        The scrollbar calls this with ("moveto", fraction) when dragged and with
+        ("scroll", n, "units" | "pages") when its arrows or trough are clicked.
+        """
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * self._total))
+        elif action == "scroll":
+            step = self._visible_rows if unit == "pages" else 1
+            self._scroll_to(self._top + int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        """Scroll three rows per wheel notch (Windows/macOS and X11 events)."""
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_to(self._top - 3)
+        else:
+            self._scroll_to(self._top + 3)
+        return "break"
+
+    def _on_key(self, event):
+        """Keep keyboard navigation working past the rows currently on screen."""
+        steps = {"Up": -1, "Down": 1, "Prior": -self._visible_rows, "Next": self._visible_rows}
+        if event.keysym == "Home":
+            self._scroll_to(0)
+        elif event.keysym == "End":
+            self._scroll_to(self._total)
+        elif event.keysym in steps:
+            self._scroll_to(self._top + steps[event.keysym])
+        return "break"
+
+    def _on_resize(self, event):
+        """Recompute how many rows fit in the table after it is resized."""
+        rows = max(1, (event.height - self.HEADING_HEIGHT) // self._row_height)
+        if rows != self._visible_rows:
+            self._visible_rows = rows
+            self._render()
+
+    def _rows(self, start: int, count: int):
+        """
+        Return the formatted rows for results [start, start + count).
+        
+        Rows come from the cached window when possible; otherwise a new window
+        around the requested page is fetched from the source.
+        """
+        end = min(start + count, self._total)
+        window_end = self._window_start + len(self._window)
+        if start < self._window_start or end > window_end:
+            self._window_start = max(0, start - self.PREFETCH)
+            limit = (end - self._window_start) + self.PREFETCH
+            self._window = [self._format(r) for r in self._fetch(self._window_start, limit)]
+        return self._window[start - self._window_start:end - self._window_start]
+
+    def _render(self):
+        """
+        Show the visible page in the table.
+        
+        Existing table rows are updated in place; rows are only inserted or
+        deleted when the number of visible rows changes.
+        """
+        rows = self._rows(self._top, self._visible_rows)
+        items = self.table.get_children()
+        
+        for i, values in enumerate(rows):
+            if i < len(items):
+                self.table.item(items[i], values=values)
+            else:
+                self.table.insert("", "end", values=values)
+        # Remove rows left over from a taller page
+        if len(items) > len(rows):
+            self.table.delete(*items[len(rows):])
+        
+        # Position the scrollbar thumb to reflect the virtual list
+        if self._total:
+            self.scrollbar.set(self._top / self._total, (self._top + len(rows)) / self._total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    @staticmethod
+    def _format(r):
+        """
+        Convert a Result into the values shown in one table row.
+        
+        Args:
+            r (Result): The result to format
+        
+        Returns:
+            tuple: (name, score, timestamp, time taken)
+        """
+        # Convert seconds to min and sec 
+        minutes = int(r.time_taken // 60)
+        seconds = int(r.time_taken % 60) 
+        time_formatted = f"{minutes}m {seconds}s"
+        return (
+            r.user_name or "—",                    
+            f"{r.score}/{r.total_questions}",      
+            r.timestamp,                           
+            time_formatted                   
+        )
 
     def on_exit(self):
         """
@@ -0,0 +1,384 @@
+"""
+Columnar Storage Module
+
+Keeps large numbers of questions and results in parallel arrays instead of one
+Python object per record. Repetitive strings are interned in a StringPool, so a
+user name that appears in a million results is stored once; mostly-unique strings
+such as question texts are packed into a single UTF-8 buffer (TextColumn). Every
+record then costs a few array slots instead of an object with a __dict__.
+
+QuestionBank and ResultTable are read-only sequences that hand out lightweight
+views (QuestionView, ResultView) with the same attributes as Question and
+Result, so existing code such as Quiz and the result screens can use them
+unchanged. Build them straight from a stream to avoid ever holding the full
+list of objects, e.g. QuestionBank.from_questions(repo.iter_questions()).
+"""
+
+from array import array
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
+
+from .models import Question, Result
+
+# Result timestamps in the format Quiz.finish() writes are stored as epoch seconds
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# User name id stored for an anonymous result (user_name None), so it reads back as
+# None rather than "" (the largest id an array("I") holds, never given out by a pool)
+_NO_USER = 0xFFFFFFFF
+
+
+class StringPool:
+    """
+    Stores each distinct string once and refers to it by an integer id.
+
+    Attributes:
+        strings (list[str]): The distinct strings, indexed by id
+    """
+
+    def __init__(self):
+        self.strings: list[str] = []
+        self._ids: dict[str, int] = {}
+
+    def intern(self, s: str) -> int:
+        """
+        Return the id of a string, adding it to the pool if it is new.
+
+        Args:
+            s (str): The string to store
+
+        Returns:
+            int: The string's id
+        """
+        i = self._ids.get(s)
+        if i is None:
+            i = self._ids[s] = len(self.strings)
+            self.strings.append(s)
+        return i
+
+    def __getitem__(self, i: int) -> str:
+        return self.strings[i]
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+class TextColumn:
+    """
+    Strings packed end to end as UTF-8 in one buffer, for columns where almost
+    every value is different (question ids and texts), so interning wouldn't help.
+    """
+
+    def __init__(self):
+        self._data = bytearray()
+        self._ends = array("Q")
+
+    def append(self, s: str):
+        """Add a string to the end of the column."""
+        self._data += s.encode("utf-8")
+        self._ends.append(len(self._data))
+
+    def __getitem__(self, i: int) -> str:
+        start = self._ends[i - 1] if i else 0
+        return self._data[start:self._ends[i]].decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+
+class QuestionView:
+    """
+    Read-only view of one question in a QuestionBank, with the attributes of Question.
+
+    Only a reference to the bank and a row number are stored; each attribute is
+    read from the bank's arrays when it is accessed.
+    """
+    __slots__ = ("_bank", "_row")
+
+    def __init__(self, bank: "QuestionBank", row: int):
+        self._bank = bank
+        self._row = row
+
+    @property
+    def id(self) -> str:
+        return self._bank._ids[self._row]
+
+    @property
+    def text(self) -> str:
+        return self._bank._texts[self._row]
+
+    @property
+    def options(self) -> tuple:
+        bank = self._bank
+        start, end = bank._option_starts[self._row], bank._option_starts[self._row + 1]
+        return tuple(bank.pool[i] for i in bank._options[start:end])
+
+    @property
+    def correct_index(self) -> int:
+        return self._bank._correct[self._row]
+
+    @property
+    def category(self) -> str:
+        return self._bank.pool[self._bank._categories[self._row]]
+
+    @property
+    def difficulty(self) -> str:
+        return self._bank.pool[self._bank._difficulties[self._row]]
+
+    def is_valid(self) -> bool:
+        """Same checks as Question.is_valid()."""
+        options = self.options
+        return bool(self.text.strip()) and len(options) >= 2 and 0 <= self.correct_index < len(options)
+
+    def to_question(self) -> Question:
+        """Copy the view into a standalone Question."""
+        return Question(id=self.id, text=self.text, options=list(self.options), correct_index=self.correct_index,
+                        category=self.category, difficulty=self.difficulty)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (Question, QuestionView)):
+            return NotImplemented
+        return (self.id, self.text, tuple(self.options), self.correct_index, self.category, self.difficulty) == \
+               (other.id, other.text, tuple(other.options), other.correct_index, other.category, other.difficulty)
+
+    def __hash__(self) -> int:
+        return hash((self.id, self.text, self.options, self.correct_index))
+
+    def __repr__(self) -> str:
+        return (f"QuestionView(id={self.id!r}, text={self.text!r}, "
+                f"options={self.options!r}, correct_index={self.correct_index!r}, "
+                f"category={self.category!r}, difficulty={self.difficulty!r})")
+
+
+class QuestionBank(Sequence):
+    """
+    Questions stored column by column with interned strings.
+
+    Columns: id and text (packed in TextColumns), a flat array of option string
+    ids with per-question start offsets, correct_index, and category and
+    difficulty string ids. Options, categories and difficulties repeat a lot
+    ("True"/"False", "All of the above", "easy", ...), so they are interned.
+
+    Attributes:
+        pool (StringPool): Pool for option, category and difficulty strings
+    """
+
+    def __init__(self, pool: StringPool | None = None):
+        """
+        Create an empty bank.
+
+        Args:
+            pool (StringPool | None): Pool to intern options into (e.g. shared with
+                                      another bank); None creates a new one
+        """
+        self.pool = pool or StringPool()
+        self._ids = TextColumn()
+        self._texts = TextColumn()
+        self._option_starts = array("I", [0])
+        self._options = array("I")
+        self._correct = array("i")
+        self._categories = array("I")
+        self._difficulties = array("I")
+
+    @classmethod
+    def from_questions(cls, questions: Iterable[Question]) -> "QuestionBank":
+        """
+        Build a bank from questions, consuming them one at a time.
+
+        Args:
+            questions (Iterable[Question]): Questions or anything with the same attributes
+
+        Returns:
+            QuestionBank: A bank holding all the questions, in order
+        """
+        bank = cls()
+        for q in questions:
+            bank.append(q)
+        return bank
+
+    def append(self, q: Question):
+        """
+        Add a question to the end of the bank.
+
+        Args:
+            q (Question): The question to add
+        """
+        intern = self.pool.intern
+        self._ids.append(q.id)
+        self._texts.append(q.text)
+        self._options.extend(intern(o) for o in q.options)
+        self._option_starts.append(len(self._options))
+        self._correct.append(q.correct_index)
+        self._categories.append(intern(q.category))
+        self._difficulties.append(intern(q.difficulty))
+
+    def correct_index(self, i: int) -> int:
+        """Return the correct index of question i without creating a view."""
+        return self._correct[i]
+
+    def __len__(self) -> int:
+        return len(self._correct)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [QuestionView(self, j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("question index out of range")
+        return QuestionView(self, i)
+
+    def __iter__(self) -> Iterator[QuestionView]:
+        return (QuestionView(self, i) for i in range(len(self)))
+
+
+class ResultView:
+    """
+    Read-only view of one result in a ResultTable, with the attributes of Result.
+    """
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "ResultTable", row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def user_name(self) -> str | None:
+        user = self._table._users[self._row]
+        return None if user == _NO_USER else self._table.pool[user]
+
+    @property
+    def score(self) -> int:
+        return self._table._scores[self._row]
+
+    @property
+    def total_questions(self) -> int:
+        return self._table._totals[self._row]
+
+    @property
+    def time_taken(self) -> float:
+        return self._table._times[self._row]
+
+    @property
+    def timestamp(self) -> str:
+        return self._table._timestamp(self._row)
+
+    def to_dict(self) -> dict:
+        """Same dictionary as Result.to_dict()."""
+        return {
+            "user_name": self.user_name or "",
+            "score": self.score,
+            "total_questions": self.total_questions,
+            "time_taken": self.time_taken,
+            "timestamp": self.timestamp,
+        }
+
+    def to_result(self) -> Result:
+        """Copy the view into a standalone Result."""
+        return Result(self.user_name, self.score, self.total_questions, self.time_taken, self.timestamp)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (Result, ResultView)):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.to_dict().values()))
+
+    def __repr__(self) -> str:
+        return (f"ResultView(user_name={self.user_name!r}, score={self.score!r}, "
+                f"total_questions={self.total_questions!r}, time_taken={self.time_taken!r}, "
+                f"timestamp={self.timestamp!r})")
+
+
+class ResultTable(Sequence):
+    """
+    Results stored column by column.
+
+    User names are interned (an anonymous result's None is kept as None).
+    Timestamps in TIMESTAMP_FORMAT are stored as epoch seconds in an int64
+    column; any other timestamp string is interned and stored as -(id + 1), so
+    every value reads back exactly as it was added.
+
+    Attributes:
+        pool (StringPool): Pool for user names and non-standard timestamps
+    """
+
+    def __init__(self, pool: StringPool | None = None):
+        """
+        Create an empty table.
+
+        Args:
+            pool (StringPool | None): Pool to intern strings into; None creates a new one
+        """
+        self.pool = pool or StringPool()
+        self._users = array("I")
+        self._scores = array("i")
+        self._totals = array("i")
+        self._times = array("d")
+        self._stamps = array("q")
+
+    @classmethod
+    def from_results(cls, results: Iterable[Result]) -> "ResultTable":
+        """
+        Build a table from results, consuming them one at a time.
+
+        Args:
+            results (Iterable[Result]): Results or anything with the same attributes
+
+        Returns:
+            ResultTable: A table holding all the results, in order
+        """
+        table = cls()
+        for r in results:
+            table.append(r)
+        return table
+
+    def append(self, r: Result):
+        """
+        Add a result to the end of the table.
+
+        Args:
+            r (Result): The result to add
+        """
+        self._users.append(_NO_USER if r.user_name is None else self.pool.intern(r.user_name))
+        self._scores.append(r.score)
+        self._totals.append(r.total_questions)
+        self._times.append(r.time_taken)
+        self._stamps.append(self._encode_timestamp(r.timestamp))
+
+    def _encode_timestamp(self, ts: str) -> int:
+        """Epoch seconds for a standard timestamp, else -(pool id + 1)."""
+        try:
+            seconds = int(datetime.strptime(ts, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc).timestamp())
+            # strptime accepts e.g. unpadded fields; only keep the number if it reads back identically
+            if _format_timestamp(seconds) == ts and seconds >= 0:
+                return seconds
+        except (TypeError, ValueError):
+            pass
+        return -(self.pool.intern(ts or "") + 1)
+
+    def _timestamp(self, row: int) -> str:
+        """Decode the timestamp stored for a row."""
+        value = self._stamps[row]
+        return _format_timestamp(value) if value >= 0 else self.pool[-value - 1]
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [ResultView(self, j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("result index out of range")
+        return ResultView(self, i)
+
+    def __iter__(self) -> Iterator[ResultView]:
+        return (ResultView(self, i) for i in range(len(self)))
+
+
+def _format_timestamp(seconds: int) -> str:
+    """Format epoch seconds as a TIMESTAMP_FORMAT string."""
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime(TIMESTAMP_FORMAT)
@@ -0,0 +1,251 @@
+"""
+Metrics Module
+
+Optional timers and counters for the hot paths of a quiz session (loading
+questions, saving and loading results, starting and finishing a quiz, showing
+screens), plus an optional cProfile capture of one session.
+
+Everything is off by default. When disabled, a @timed function only pays for
+one flag check before calling straight through, and count()/record() return
+immediately.
+
+Environment variables (read once at import):
+    QUIZ_METRICS  Enable metrics and export them to this file when the process
+                  exits: Prometheus text format if it ends in ".prom", JSON otherwise
+    QUIZ_PROFILE  Capture a cProfile of the first quiz session (from
+                  QuizSession.start to finish) and save it to this file; inspect
+                  it with `python -m pstats <file>`
+"""
+
+import atexit
+import functools
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+
+class _State:
+    """Module-wide switches, in one object so the hot-path check is a single attribute read."""
+    enabled = False
+
+
+_state = _State()
+_lock = threading.Lock()
+# name -> count
+_counters: dict[str, int] = {}
+# name -> [count, total seconds, max seconds]
+_timers: dict[str, list] = {}
+
+
+def enable():
+    """Start collecting metrics."""
+    _state.enabled = True
+
+
+def disable():
+    """Stop collecting metrics (already collected values are kept)."""
+    _state.enabled = False
+
+
+def is_enabled() -> bool:
+    """True while metrics are being collected."""
+    return _state.enabled
+
+
+def reset():
+    """Forget every collected counter and timer."""
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+
+
+def count(name: str, n: int = 1):
+    """
+    Add to a counter.
+
+    Args:
+        name (str): Counter name, e.g. "repo.results_saved"
+        n (int): Amount to add
+    """
+    if not _state.enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def record(name: str, seconds: float):
+    """
+    Record one timing that was measured elsewhere.
+
+    Args:
+        name (str): Timer name, e.g. "app.show_question.reused"
+        seconds (float): The measured duration
+    """
+    if not _state.enabled:
+        return
+    with _lock:
+        entry = _timers.get(name)
+        if entry is None:
+            _timers[name] = [1, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
+
+
+@contextmanager
+def timer(name: str):
+    """
+    Time a block of code:
+
+        with metrics.timer("import.csv"):
+            ...
+
+    Args:
+        name (str): Timer name
+    """
+    if not _state.enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+def timed(name: str):
+    """
+    Decorator that times every call of a function under the given name.
+
+    Args:
+        name (str): Timer name, e.g. "repo.load_questions"
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+def snapshot() -> dict:
+    """
+    Return a copy of everything collected so far.
+
+    Returns:
+        dict: {"counters": {name: int},
+               "timers": {name: {"count": int, "total_s": float, "mean_s": float, "max_s": float}}}
+    """
+    with _lock:
+        return {
+            "counters": dict(_counters),
+            "timers": {
+                name: {"count": n, "total_s": total, "mean_s": total / n, "max_s": peak}
+                for name, (n, total, peak) in _timers.items()
+            },
+        }
+
+
+def to_prometheus(snap: dict | None = None, prefix: str = "quiz") -> str:
+    """
+    Format metrics in the Prometheus text exposition format.
+
+    Counters become <prefix>_<name>_total; timers become a summary
+    <prefix>_<name>_seconds (with _count and _sum) plus a _seconds_max gauge.
+
+    Args:
+        snap (dict | None): A snapshot() result, or None to take one now
+        prefix (str): Prefix for every metric name
+
+    Returns:
+        str: The metrics, one sample per line
+    """
+    snap = snap or snapshot()
+    lines = []
+    for name, value in sorted(snap["counters"].items()):
+        metric = _metric_name(prefix, name) + "_total"
+        lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+    for name, t in sorted(snap["timers"].items()):
+        metric = _metric_name(prefix, name) + "_seconds"
+        lines += [
+            f"# TYPE {metric} summary",
+            f"{metric}_count {t['count']}",
+            f"{metric}_sum {t['total_s']:.9f}",
+            f"# TYPE {metric}_max gauge",
+            f"{metric}_max {t['max_s']:.9f}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def export(path: str):
+    """
+    Write the collected metrics to a file, atomically.
+
+    Args:
+        path (str): Destination; ".prom" files get Prometheus text format, anything else JSON
+    """
+    snap = snapshot()
+    text = to_prometheus(snap) if path.endswith(".prom") else json.dumps(snap, indent=2, sort_keys=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _metric_name(prefix: str, name: str) -> str:
+    """Turn "repo.load_questions" into a valid Prometheus name like "quiz_repo_load_questions"."""
+    return f"{prefix}_{re.sub(r'[^a-zA-Z0-9_]', '_', name)}"
+
+
+class SessionProfiler:
+    """
+    Captures a cProfile of one quiz session, if QUIZ_PROFILE is set.
+
+    QuizSession calls start() when a quiz starts and stop() when it finishes.
+    Only the first session is captured, so the profile isn't diluted by the
+    time spent on the welcome screen between quizzes.
+
+    Attributes:
+        path (str | None): Where the profile is saved, or None if profiling is off
+    """
+
+    def __init__(self, path: str | None):
+        self.path = path
+        self._profile = None
+        self._done = False
+
+    def start(self):
+        """Start profiling, unless profiling is off or a session was already captured."""
+        if self.path is None or self._done or self._profile is not None:
+            return
+        import cProfile
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def stop(self):
+        """Stop profiling and save the profile to path."""
+        if self._profile is None:
+            return
+        self._profile.disable()
+        self._profile.dump_stats(self.path)
+        self._profile = None
+        self._done = True
+
+
+session_profiler = SessionProfiler(os.environ.get("QUIZ_PROFILE") or None)
+
+_export_path = os.environ.get("QUIZ_METRICS")
+if _export_path:
+    enable()
+    atexit.register(export, _export_path)
@@ -7,6 +7,7 @@ Data Models for the Quiz Application
 This module contains the core data classes used throughout the application:
 - Question: Represents a single quiz question with options and correct answer
 - Result: Represents the outcome of a completed quiz attempt
+- Answer: Represents one answered question of a completed attempt
 """
 
 @dataclass(frozen=True)
@@ -23,11 +24,15 @@ class Question:
         text (str): The question text displayed to the user 
         options (List[str]): List of answer choices 
         correct_index (int): Index of the correct answer in the options list 
+        category (str): Topic of the question ("" if the bank doesn't say)
+        difficulty (str): Difficulty level, e.g. "easy" ("" if the bank doesn't say)
     """
     id: str
     text: str
     options: List[str]
     correct_index: int
+    category: str = ""
+    difficulty: str = ""
 
     def is_valid(self) -> bool:
         """
@@ -78,4 +83,112 @@ class Result:
             "total_questions": self.total_questions,
             "time_taken": self.time_taken,
             "timestamp": self.timestamp,
-        }
\ No newline at end of file
+        }
+
+@dataclass(frozen=True)
+class Answer:
+    """
+    One question of a completed quiz attempt, as recorded in the answers log.
+    
+    Answers are linked to their attempt's Result by user_name and timestamp.
+    
+    Attributes:
+        user_name (str): Name of the person who took the quiz
+        timestamp (str): Timestamp of the attempt's Result
+        question_id (str): Id of the question that was shown
+        selected_index (int | None): Option the user chose (index into the original,
+                                     unshuffled options), or None if they skipped it
+        correct (bool): Whether the chosen option was the correct one
+        dwell_time (float): Seconds the question was on screen
+        seed (int | None): Seed of a shuffled quiz (see Quiz.shuffled), or None
+    """
+    user_name: str
+    timestamp: str
+    question_id: str
+    selected_index: int | None
+    correct: bool
+    dwell_time: float
+    seed: int | None = None
+
+    def to_dict(self) -> dict:
+        """
+        Convert the Answer object to a dictionary format, for saving to CSV.
+        """
+        return {
+            "user_name": self.user_name or "",
+            "timestamp": self.timestamp,
+            "question_id": self.question_id,
+            "selected_index": "" if self.selected_index is None else self.selected_index,
+            "correct": int(self.correct),
+            "dwell_time": self.dwell_time,
+            "seed": "" if self.seed is None else self.seed,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class SlottedQuestion:
+    """
+    Memory-compact variant of Question.
+    
+    Same fields and behaviour as Question, but with __slots__ instead of a
+    per-instance __dict__, and options stored as a tuple. Use it when many
+    questions are kept in memory at once (see also logic.columnar.QuestionBank).
+    
+    Attributes:
+        id (str): Unique identifier for each question
+        text (str): The question text displayed to the user
+        options (tuple[str, ...]): Answer choices
+        correct_index (int): Index of the correct answer in options
+        category (str): Topic of the question
+        difficulty (str): Difficulty level
+    """
+    id: str
+    text: str
+    options: tuple
+    correct_index: int
+    category: str = ""
+    difficulty: str = ""
+
+    @classmethod
+    def from_question(cls, q: "Question | SlottedQuestion") -> "SlottedQuestion":
+        """Convert a Question (or anything with the same attributes)."""
+        return cls(id=q.id, text=q.text, options=tuple(q.options), correct_index=q.correct_index,
+                   category=q.category, difficulty=q.difficulty)
+
+    def is_valid(self) -> bool:
+        """Same checks as Question.is_valid()."""
+        return bool(self.text.strip()) and len(self.options) >= 2 and 0 <= self.correct_index < len(self.options)
+
+
+@dataclass(frozen=True, slots=True)
+class SlottedResult:
+    """
+    Memory-compact variant of Result, with __slots__ instead of a per-instance __dict__.
+    
+    Attributes:
+        user_name (str): Name of the person who took the quiz
+        score (int): Number of questions answered correctly
+        total_questions (int): Total number of questions in the quiz
+        time_taken (float): Time taken to complete the quiz in seconds
+        timestamp (str): Date and time when the quiz was completed
+    """
+    user_name: str
+    score: int
+    total_questions: int
+    time_taken: float
+    timestamp: str
+
+    @classmethod
+    def from_result(cls, r: "Result | SlottedResult") -> "SlottedResult":
+        """Convert a Result (or anything with the same attributes)."""
+        return cls(r.user_name, r.score, r.total_questions, r.time_taken, r.timestamp)
+
+    def to_dict(self) -> dict:
+        """Same dictionary as Result.to_dict()."""
+        return {
+            "user_name": self.user_name or "",
+            "score": self.score,
+            "total_questions": self.total_questions,
+            "time_taken": self.time_taken,
+            "timestamp": self.timestamp,
+        }
@@ -0,0 +1,289 @@
+"""
+Question Index Module
+
+Finds duplicate questions in one pass, looks questions up by id in O(1), and
+keeps an inverted index by category and difficulty so a filtered quiz ("10
+easy ethics questions") can be drawn without scanning the bank.
+
+Two questions are duplicates if they have the same id, or the same text after
+normalize_text() (case, accents, punctuation and spacing are ignored), which
+catches the same question merged in from two content teams' banks under
+different ids. Which copy survives is decided by a policy:
+
+    "first-wins"  keep the earliest copy, drop later ones
+    "last-wins"   keep the latest copy, in the position of the earliest
+    "reject"      raise DuplicateQuestionError listing every duplicate
+"""
+
+import random
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List
+
+from .models import Question
+
+FIRST_WINS = "first-wins"
+LAST_WINS = "last-wins"
+REJECT = "reject"
+POLICIES = (FIRST_WINS, LAST_WINS, REJECT)
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Reduce question text to a key that near-identical texts share.
+
+    Unicode is NFKD-normalized with accents removed, case is folded, and every
+    run of punctuation or whitespace becomes a single space, so
+    "What is  IBM's policy?" and "what is ibm s policy" give the same key.
+
+    Args:
+        text (str): The question text
+
+    Returns:
+        str: The normalized key
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_WORD.sub(" ", stripped.casefold()).strip()
+
+
+def facet_key(value: str) -> str:
+    """
+    Key used to match a category or difficulty: "Ethics " and "ethics" are the same.
+
+    Args:
+        value (str): A category or difficulty
+
+    Returns:
+        str: The value stripped and case-folded
+    """
+    return value.strip().casefold()
+
+
+@dataclass(frozen=True)
+class Duplicate:
+    """
+    One duplicate found while building a QuestionIndex.
+
+    Attributes:
+        kind (str): "id" if the ids matched, "text" if the normalized texts matched
+        kept (Question): The copy that stays in the index
+        dropped (Question): The copy that was left out
+    """
+    kind: str
+    kept: Question
+    dropped: Question
+
+
+class DuplicateQuestionError(ValueError):
+    """
+    Raised by the "reject" policy when the questions contain duplicates.
+
+    Attributes:
+        duplicates (List[Duplicate]): Every duplicate that was found
+    """
+
+    def __init__(self, duplicates: List[Duplicate]):
+        self.duplicates = duplicates
+        first = duplicates[0]
+        super().__init__(
+            f"{len(duplicates)} duplicate question(s), e.g. {first.dropped.id!r} "
+            f"duplicates {first.kept.id!r} by {first.kind}"
+        )
+
+
+class QuestionIndex:
+    """
+    De-duplicated questions with O(1) lookup by id and by category/difficulty.
+
+    Attributes:
+        policy (str): The duplicate policy used to build the index
+        duplicates (List[Duplicate]): Duplicates found (and dropped) while building
+    """
+
+    def __init__(self, questions: Iterable[Question], policy: str = FIRST_WINS, match_text: bool = True):
+        """
+        Index questions in a single pass.
+
+        Args:
+            questions (Iterable[Question]): Questions in bank order
+            policy (str): "first-wins", "last-wins" or "reject"
+            match_text (bool): Also treat equal normalized texts as duplicates
+
+        Raises:
+            ValueError: If policy is unknown
+            DuplicateQuestionError: If policy is "reject" and there are duplicates
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown duplicate policy: {policy!r} (expected one of {', '.join(POLICIES)})")
+        self.policy = policy
+        self.match_text = match_text
+        self.duplicates: List[Duplicate] = []
+
+        # Questions sit in slots in bank order; a slot is emptied when last-wins
+        # merges it into an earlier one. Both dicts map a key to a slot number.
+        self._slots: List[Question | None] = []
+        self._by_id: dict[str, int] = {}
+        self._by_text: dict[str, int] = {}
+        for q in questions:
+            self._add(q)
+
+        if policy == REJECT and self.duplicates:
+            raise DuplicateQuestionError(self.duplicates)
+        self._questions = [q for q in self._slots if q is not None]
+
+        # Inverted index: (category key, difficulty key) -> questions in bank order,
+        # with None standing for "any", so every filter is one dict lookup
+        self._by_facet: dict[tuple[str | None, str | None], List[Question]] = {(None, None): self._questions}
+        # Facet key -> the spelling first seen in the bank, for display
+        self._category_names: dict[str, str] = {}
+        self._difficulty_names: dict[str, str] = {}
+        for q in self._questions:
+            category, difficulty = facet_key(q.category), facet_key(q.difficulty)
+            self._category_names.setdefault(category, q.category.strip())
+            self._difficulty_names.setdefault(difficulty, q.difficulty.strip())
+            for key in ((category, difficulty), (category, None), (None, difficulty)):
+                postings = self._by_facet.get(key)
+                if postings is None:
+                    self._by_facet[key] = [q]
+                else:
+                    postings.append(q)
+
+    def _add(self, q: Question):
+        """Place one question, resolving any duplicate by the policy."""
+        text_key = normalize_text(q.text) if self.match_text else None
+        id_slot = self._by_id.get(q.id)
+        text_slot = self._by_text.get(text_key) if text_key is not None else None
+
+        if id_slot is None and text_slot is None:
+            slot = len(self._slots)
+            self._slots.append(q)
+            self._index(q, text_key, slot)
+            return
+
+        # Compare with the earliest clashing copy; a question can clash with two
+        # different copies (one by id, another by text)
+        clashes = sorted({s for s in (id_slot, text_slot) if s is not None})
+        if self.policy != LAST_WINS:
+            existing = self._slots[clashes[0]]
+            self.duplicates.append(Duplicate("id" if clashes[0] == id_slot else "text", existing, q))
+            return
+
+        keep_slot = clashes[0]
+        for slot in clashes:
+            old = self._slots[slot]
+            self.duplicates.append(Duplicate("id" if slot == id_slot else "text", q, old))
+            self._unindex(old, slot)
+            self._slots[slot] = None
+        self._slots[keep_slot] = q
+        self._index(q, text_key, keep_slot)
+
+    def _index(self, q: Question, text_key: str | None, slot: int):
+        self._by_id[q.id] = slot
+        if text_key is not None:
+            self._by_text[text_key] = slot
+
+    def _unindex(self, q: Question, slot: int):
+        if self._by_id.get(q.id) == slot:
+            del self._by_id[q.id]
+        if self.match_text:
+            key = normalize_text(q.text)
+            if self._by_text.get(key) == slot:
+                del self._by_text[key]
+
+    @property
+    def questions(self) -> List[Question]:
+        """The surviving questions, in bank order."""
+        return list(self._questions)
+
+    def get(self, question_id: str) -> Question | None:
+        """
+        Look up a question by id.
+
+        Args:
+            question_id (str): The question's id
+
+        Returns:
+            Question | None: The question, or None if there is no such id
+        """
+        slot = self._by_id.get(question_id)
+        return self._slots[slot] if slot is not None else None
+
+    def categories(self) -> List[str]:
+        """The distinct categories in the bank, in order of first appearance ("" if any are missing)."""
+        return list(self._category_names.values())
+
+    def difficulties(self) -> List[str]:
+        """The distinct difficulties in the bank, in order of first appearance ("" if any are missing)."""
+        return list(self._difficulty_names.values())
+
+    def count(self, category: str | None = None, difficulty: str | None = None) -> int:
+        """
+        Count the questions matching a filter, in O(1).
+
+        Args:
+            category (str | None): Category to match (case-insensitive), or None for any
+            difficulty (str | None): Difficulty to match (case-insensitive), or None for any
+
+        Returns:
+            int: Number of matching questions
+        """
+        return len(self._postings(category, difficulty))
+
+    def matching(self, category: str | None = None, difficulty: str | None = None) -> List[Question]:
+        """
+        List the questions matching a filter, in bank order.
+
+        Args:
+            category (str | None): Category to match (case-insensitive), or None for any
+            difficulty (str | None): Difficulty to match (case-insensitive), or None for any
+
+        Returns:
+            List[Question]: The matching questions (a new list)
+        """
+        return list(self._postings(category, difficulty))
+
+    def select(self, k: int, category: str | None = None, difficulty: str | None = None,
+               rng: random.Random | None = None) -> List[Question]:
+        """
+        Pick k random questions matching a filter.
+
+        The matching questions are found with one dict lookup and sampled in
+        place, so the cost grows with k, not with the size of the bank.
+
+        Args:
+            k (int): Number of questions to pick
+            category (str | None): Category to match (case-insensitive), or None for any
+            difficulty (str | None): Difficulty to match (case-insensitive), or None for any
+            rng (random.Random | None): Random generator to use; pass a seeded one
+                                        for a reproducible selection
+
+        Returns:
+            List[Question]: Up to k questions (fewer if fewer match)
+        """
+        postings = self._postings(category, difficulty)
+        return (rng or random.Random()).sample(postings, max(0, min(k, len(postings))))
+
+    def _postings(self, category: str | None, difficulty: str | None) -> List[Question]:
+        """Return the internal list of questions matching a filter (do not modify)."""
+        key = (None if category is None else facet_key(category),
+               None if difficulty is None else facet_key(difficulty))
+        return self._by_facet.get(key, [])
+
+    def __getitem__(self, question_id: str) -> Question:
+        q = self.get(question_id)
+        if q is None:
+            raise KeyError(question_id)
+        return q
+
+    def __contains__(self, question_id) -> bool:
+        return question_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._questions)
+
+    def __iter__(self) -> Iterator[Question]:
+        return iter(self._questions)
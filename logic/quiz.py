@@ -5,10 +5,17 @@ Handles the core quiz logic including question progression,
 answer tracking, timing, and score calculation.
 """
 
+import random
 import time
-from typing import List
+from typing import TYPE_CHECKING, Iterable, List, Sequence
 from datetime import datetime, timezone
-from .models import Question, Result
+from . import metrics
+from .models import Answer, Question, Result
+from .sampling import reservoir_sample
+from .shuffle import PickedQuestions, ShuffledQuestion, option_order, seeded_rng
+
+if TYPE_CHECKING:
+    from .question_index import QuestionIndex
 
 
 class Quiz:
@@ -20,30 +27,117 @@ class Quiz:
     calculate the final score.
     
     Attributes:
-        questions (List[Question]): List of all questions in the quiz
+        questions (Sequence[Question]): All questions in the quiz (a lazy
+                                        PickedQuestions view for shuffled())
         current_index (int): Index of the current question 
-        user_answers (List[int | None]): List of answer indexes
+        user_answers (List[int | None]): List of answer indexes, always into the
+                                        question's original (unshuffled) options
+        seed (int | None): Seed the quiz was shuffled with, or None if it isn't shuffled
+        option_orders (dict[int, tuple[int, ...]] | None): Option orders drawn so
+                                        far, by question position (see option_order()),
+                                        or None if options are in their original order
+        dwell_times (List[float]): Seconds each question has been on screen
         start_time (float | None): timestamp when quiz started
         end_time (float | None): timestamp when quiz ended
         is_active (bool): Whether the quiz is currently running
 
     """
     
-    def __init__(self, questions: List[Question]):
+    def __init__(self, questions: List[Question], seed: int | None = None):
         """
         Initialize a quiz with questions.
         
         Args:
             questions (List[Question]): List of Question objects to display
+            seed (int | None): Shuffle each question's options with this seed,
+                               or None to show them in their original order
         """
         self.questions = questions
+        self.seed = seed
+        # Drawn one question at a time, when it is presented, so a quiz over a large
+        # bank doesn't pay for permutations of questions nobody reaches
+        self.option_orders: dict[int, tuple[int, ...]] | None = None if seed is None else {}
         self.current_index = 0
         # Sets up the quiz with an empty answer list
         self.user_answers: List[int | None] = [None] * len(questions)
+        self.dwell_times: List[float] = [0.0] * len(questions)
+        # perf_counter() when the current question was shown (None while not running)
+        self._shown_at: float | None = None
         self.start_time: float | None = None
         self.end_time: float | None = None
         self.is_active = False
 
+    @classmethod
+    def from_stream(cls, questions: Iterable[Question], k: int, seed: int | None = None) -> "Quiz":
+        """
+        Build a quiz of k random questions from a stream of questions.
+        
+        The stream is read once and only the k sampled questions are kept, so the
+        full bank never has to be loaded (e.g. pass CSVRepository.iter_questions()).
+        
+        Args:
+            questions (Iterable[Question]): The question bank, consumed once
+            k (int): Number of questions in the quiz
+            seed (int | None): Seed for a reproducible selection, or None for a random one
+        
+        Returns:
+            Quiz: A new (not yet started) quiz with up to k questions
+        """
+        return cls(reservoir_sample(questions, k, random.Random(seed)))
+
+    @classmethod
+    def shuffled(cls, questions: Sequence[Question], k: int | None = None, seed: int | None = None) -> "Quiz":
+        """
+        Build a quiz of k questions in random order, with shuffled options.
+        
+        Questions are picked by position, so only the k chosen questions are
+        touched (a lazily decoded bank such as CompiledQuestionBank only decodes
+        those), and options are shown through a permutation instead of being
+        copied. The same bank and seed always give the same quiz, so an attempt
+        can be replayed from the seed saved in its answer log.
+        
+        Args:
+            questions (Sequence[Question]): The question bank
+            k (int | None): Number of questions in the quiz, or None for all of them
+            seed (int | None): Seed for the selection and option order; None draws a new one
+        
+        Returns:
+            Quiz: A new (not yet started) quiz with up to k questions
+        """
+        if seed is None:
+            seed = random.getrandbits(32)
+        n = len(questions)
+        k = n if k is None else max(0, min(k, n))
+        # The selection has its own stream; option orders are drawn per question
+        # (see option_order()), so the quiz size doesn't change them
+        picked = seeded_rng(seed, "select").sample(range(n), k)
+        # Questions are looked up when they are shown, so even a quiz over the
+        # whole bank (k=None) doesn't decode it up front
+        return cls(PickedQuestions(questions, picked), seed=seed)
+
+    @classmethod
+    def from_index(cls, index: "QuestionIndex", k: int, category: str | None = None,
+                   difficulty: str | None = None, seed: int | None = None) -> "Quiz":
+        """
+        Build a quiz of k random questions from a category and/or difficulty.
+        
+        The index already groups questions by category and difficulty, so this
+        takes time proportional to k rather than to the size of the bank
+        (e.g. pass CSVRepository.question_index()).
+        
+        Args:
+            index (QuestionIndex): The indexed question bank
+            k (int): Number of questions in the quiz
+            category (str | None): Only use questions from this category (None for any)
+            difficulty (str | None): Only use questions at this difficulty (None for any)
+            seed (int | None): Seed for a reproducible selection, or None for a random one
+        
+        Returns:
+            Quiz: A new (not yet started) quiz with up to k questions
+        """
+        return cls(index.select(k, category, difficulty, random.Random(seed)))
+
+    @metrics.timed("quiz.start")
     def start(self):
         """
         Start the quiz and begin timing.
@@ -52,6 +146,8 @@ class Quiz:
         """
         self.current_index = 0
         self.user_answers = [None] * len(self.questions)
+        self.dwell_times = [0.0] * len(self.questions)
+        self._shown_at = time.perf_counter()
         self.start_time = time.time()
         self.end_time = None
         self.is_active = True
@@ -61,17 +157,49 @@ class Quiz:
         Get the question currently being displayed.
         
         Returns:
-            Question: The Question object at the current index
+            Question | ShuffledQuestion: The Question object at the current index,
+                                         with its options in displayed order
         """
-        return self.questions[self.current_index]
+        q = self.questions[self.current_index]
+        if self.option_orders is None:
+            return q
+        return ShuffledQuestion(q, self.option_order(self.current_index))
+
+    def option_order(self, index: int) -> tuple[int, ...] | None:
+        """
+        Return the order a question's options are shown in, drawing it on first use.
+        
+        The order depends only on the seed and the question's id, so the same
+        question is shown the same way whichever quiz size or position it has.
+        
+        Args:
+            index (int): Position of the question in the quiz
+        
+        Returns:
+            tuple[int, ...] | None: The original option index shown at each
+                                    position, or None if the quiz isn't shuffled
+        """
+        if self.option_orders is None:
+            return None
+        order = self.option_orders.get(index)
+        if order is None:
+            q = self.questions[index]
+            order = option_order(len(q.options), seeded_rng(self.seed, "options", q.id))
+            self.option_orders[index] = order
+        return order
 
     def submit_answer(self, selected_index: int):
         """
         Records the user's answer for the current question.
         
         Args:
-            selected_index (int): The index of the option the user selected 
+            selected_index (int): The index of the option the user selected, in
+                                  displayed order
         """
+        if self.option_orders is not None:
+            # Store the original option index so scoring and the answer log
+            # don't depend on the order the options were shown in
+            selected_index = self.option_order(self.current_index)[selected_index]
         self.user_answers[self.current_index] = selected_index
 
     def next_question(self):
@@ -83,10 +211,19 @@ class Quiz:
                   False if we're on the last question
         """
         if self.current_index + 1 < len(self.questions):
+            self._record_dwell()
             self.current_index += 1
             return True
         return False
 
+    def _record_dwell(self):
+        """Add the time since the current question was shown to its dwell time."""
+        if self._shown_at is None or not self.questions:
+            return
+        now = time.perf_counter()
+        self.dwell_times[self.current_index] += now - self._shown_at
+        self._shown_at = now
+
     def calculate_score(self) :
         """
         Calculate the number of correct answers.
@@ -98,12 +235,36 @@ class Quiz:
             int: Number of questions answered correctly
         """
         score = 0
-        # zip pairs each answer with its corresponding question
-        for ans, q in zip(self.user_answers, self.questions):
-            if ans is not None and ans == q.correct_index:
+        # Unanswered questions are skipped without being looked up, so a lazily
+        # loaded question list (see shuffled()) isn't decoded just to score it
+        for i, ans in enumerate(self.user_answers):
+            if ans is not None and ans == self.questions[i].correct_index:
                 score += 1
         return score
 
+    @staticmethod
+    def score_batch(questions: List[Question], answer_sheets, backend: str = "auto"):
+        """
+        Score many answer sheets for the same questions at once.
+
+        Gives the same score per sheet as calculate_score(), but works on a whole
+        N x Q matrix of answers, e.g. to re-score archived attempts after a
+        question's correct_index has been corrected.
+
+        Args:
+            questions (List[Question]): The Q questions, in the order of the answer columns
+            answer_sheets: N rows of Q answers (None or scoring.UNANSWERED for
+                           unanswered), or a 2-D NumPy array
+            backend (str): "numpy", "array", or "auto" (NumPy when installed)
+
+        Returns:
+            BatchScores: Per-sheet scores and per-question correct counts
+        """
+        # Imported here so NumPy is only loaded when batch scoring is actually used
+        from .scoring import score_batch
+        return score_batch(answer_sheets, [q.correct_index for q in questions], backend=backend)
+
+    @metrics.timed("quiz.finish")
     def finish(self, user_name: str | None) :
         """
         End the quiz and create a result record.
@@ -120,6 +281,8 @@ class Quiz:
        
         """
         self.end_time = time.time()
+        self._record_dwell()
+        self._shown_at = None
         self.is_active = False
         
         # Calculate time in seconds, rounded to 2 decimal places
@@ -134,4 +297,28 @@ class Quiz:
             total_questions=len(self.questions),
             time_taken=time_taken,
             timestamp=ts
-        )
\ No newline at end of file
+        )
+
+    def answer_log(self, result: Result) -> List[Answer]:
+        """
+        List what was chosen for each question and how long it was shown.
+        
+        Args:
+            result (Result): The Result returned by finish(), used to link the
+                             answers to the attempt
+        
+        Returns:
+            List[Answer]: One Answer per question, in quiz order
+        """
+        return [
+            Answer(
+                user_name=result.user_name,
+                timestamp=result.timestamp,
+                question_id=q.id,
+                selected_index=ans,
+                correct=ans is not None and ans == q.correct_index,
+                dwell_time=round(dwell, 3),
+                seed=self.seed,
+            )
+            for q, ans, dwell in zip(self.questions, self.user_answers, self.dwell_times)
+        ]
@@ -0,0 +1,45 @@
+"""
+Sampling Module for Quiz Application
+
+This module contains helpers for picking random questions from a question bank
+without loading the whole bank into memory.
+"""
+
+import random
+from typing import Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+def reservoir_sample(items: Iterable[T], k: int, rng: random.Random | None = None) -> List[T]:
+    """
+    Pick k items uniformly at random from an iterable in a single pass.
+
+    This is reservoir sampling (Algorithm R): the first k items fill the
+    reservoir, and every later item i replaces a random slot with probability
+    k / (i + 1). Only k items are ever held in memory, so the iterable can be a
+    generator over a bank with millions of rows.
+
+    Args:
+        items (Iterable[T]): The items to sample from (consumed once)
+        k (int): Number of items to pick
+        rng (random.Random | None): Random generator to use; pass a seeded one
+                                    for a reproducible sample
+
+    Returns:
+        List[T]: Up to k items (all of them, in order, if there are k or fewer)
+    """
+    if k <= 0:
+        return []
+    rng = rng or random.Random()
+
+    reservoir: List[T] = []
+    for i, item in enumerate(items):
+        if i < k:
+            reservoir.append(item)
+        else:
+            # randrange(i + 1) < k happens with probability k / (i + 1)
+            j = rng.randrange(i + 1)
+            if j < k:
+                reservoir[j] = item
+    return reservoir
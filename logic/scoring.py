@@ -0,0 +1,124 @@
+"""
+Batch Scoring Module
+
+Scores many answer sheets at once, e.g. to re-score archived attempts after a
+question's correct_index has been fixed. Answers are an N x Q matrix (one row
+per sheet, one column per question) and the correct answers a Q-length vector.
+
+NumPy is used when it is installed; otherwise the same results are computed with
+the standard library's array module. Both give exactly what Quiz.calculate_score()
+would give for each sheet.
+"""
+
+from array import array
+from operator import add, eq
+from typing import Iterable, NamedTuple, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the array fallback gives the same results
+    np = None
+
+# Marks an unanswered question in an answer matrix (Quiz.user_answers uses None)
+UNANSWERED = -1
+
+
+class BatchScores(NamedTuple):
+    """
+    Result of score_batch().
+
+    Attributes:
+        scores: Number of correct answers per sheet (length N)
+        question_correct: Number of sheets that answered each question correctly (length Q)
+
+    Both are NumPy int64 arrays with the NumPy backend and array("q") otherwise;
+    either way they support len(), indexing, iteration and list().
+    """
+    scores: Sequence[int]
+    question_correct: Sequence[int]
+
+
+def answer_row(user_answers: Iterable[int | None]) -> array:
+    """
+    Convert one sheet of answers (as in Quiz.user_answers) to a matrix row.
+
+    Args:
+        user_answers (Iterable[int | None]): Selected option per question, None if unanswered
+
+    Returns:
+        array: The answers as array("q"), with UNANSWERED in place of None
+    """
+    return array("q", (UNANSWERED if a is None else a for a in user_answers))
+
+
+def score_batch(answers, correct: Sequence[int], backend: str = "auto") -> BatchScores:
+    """
+    Score N answer sheets against Q correct answers.
+
+    Args:
+        answers: N x Q answers, either a 2-D NumPy array or an iterable of rows
+                 (lists, tuples or arrays); UNANSWERED or None marks a skipped question
+        correct (Sequence[int]): Correct option index for each of the Q questions
+        backend (str): "numpy", "array", or "auto" to use NumPy when it is installed
+
+    Returns:
+        BatchScores: Per-sheet scores and per-question correct counts
+
+    Raises:
+        ValueError: If a row doesn't have exactly Q answers, or backend is unknown
+        ImportError: If backend is "numpy" but NumPy isn't installed
+    """
+    if backend == "auto":
+        backend = "numpy" if np is not None else "array"
+    if backend == "numpy":
+        if np is None:
+            raise ImportError("NumPy is not installed")
+        return _score_numpy(answers, correct)
+    if backend == "array":
+        return _score_array(answers, correct)
+    raise ValueError(f"Unknown scoring backend: {backend!r}")
+
+
+def _score_numpy(answers, correct: Sequence[int]) -> BatchScores:
+    """NumPy implementation of score_batch()."""
+    key = np.asarray(correct, dtype=np.int64)
+    if isinstance(answers, np.ndarray):
+        matrix = answers.astype(np.int64, copy=False)
+    else:
+        rows = [_check_row(r, len(key)) for r in answers]
+        matrix = np.array(rows, dtype=np.int64).reshape(len(rows), len(key))
+    if matrix.ndim != 2 or matrix.shape[1] != len(key):
+        raise ValueError(f"Expected an N x {len(key)} answer matrix, got shape {matrix.shape}")
+
+    hits = (matrix == key) & (matrix != UNANSWERED)
+    return BatchScores(hits.sum(axis=1, dtype=np.int64), hits.sum(axis=0, dtype=np.int64))
+
+
+def _score_array(answers, correct: Sequence[int]) -> BatchScores:
+    """Pure-Python implementation of score_batch() using array("q") buffers."""
+    key = array("q", correct)
+    q = len(key)
+    # With only valid (non-negative) correct indexes neither None nor UNANSWERED can
+    # ever match, so rows can be compared as they are without converting them first
+    needs_mask = any(c < 0 for c in key)
+    scores = array("q")
+    counts = [0] * q
+    for row in answers:
+        if needs_mask:
+            row = _check_row(row, q)
+            hits = [a == c and a != UNANSWERED for a, c in zip(row, key)]
+        else:
+            if len(row) != q:
+                raise ValueError(f"Answer row has {len(row)} answers, expected {q}")
+            hits = list(map(eq, row, key))
+        scores.append(sum(hits))
+        counts = list(map(add, counts, hits))
+    return BatchScores(scores, array("q", counts))
+
+
+def _check_row(row, q: int):
+    """Replace None with UNANSWERED and check the row has q answers."""
+    row = [UNANSWERED if a is None else int(a) for a in row]
+    if len(row) != q:
+        raise ValueError(f"Answer row has {len(row)} answers, expected {q}")
+    return row
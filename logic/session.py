@@ -0,0 +1,248 @@
+"""
+Quiz Session Module
+
+UI-agnostic controller for one quiz attempt. QuizSession drives a Quiz and a
+repository through start, submit, next and finish, and tells a front-end what
+to display. The Tkinter App is one front-end; HeadlessFrontEnd lets sessions run
+without a display, e.g. for tests and load benchmarks on CI machines.
+"""
+
+from typing import Callable, Protocol, Sequence
+
+from . import metrics
+from .models import Question, Result
+from .quiz import Quiz
+
+
+class FrontEnd(Protocol):
+    """
+    What a QuizSession needs from a user interface.
+
+    Each method is called by the session after its state has changed; a front-end
+    only displays things and forwards user actions back to the session.
+    """
+
+    def show_question(self, question: Question, number: int, total: int) -> None:
+        """Display a question (number is 1-based)."""
+
+    def show_feedback(self, question: Question, selected_index: int, correct: bool) -> None:
+        """Display whether the submitted answer was correct."""
+
+    def show_results(self, result: Result) -> None:
+        """Display the final result of the quiz."""
+
+    def notify(self, level: str, title: str, message: str) -> None:
+        """Show a "warning" or "error" message to the user."""
+
+
+class QuizSession:
+    """
+    Runs one quiz attempt from start to finish, independent of any UI.
+
+    Attributes:
+        repo: Any repository with load_questions() and append_result(); if it also
+              has append_answers(), each attempt's answers are logged too
+        front_end (FrontEnd): The user interface being driven
+        writer: Optional background writer (see data.background_writer) used to
+                save results without blocking the front-end
+        shuffle (bool): Whether quizzes use a random question and option order
+        quiz_size (int | None): Questions per shuffled quiz, or None for the whole bank
+        quiz (Quiz | None): The current quiz, once started
+        user_name (str): Name of the person taking the quiz
+        result (Result | None): The final result, once finished
+    """
+
+    def __init__(self, repo, front_end: FrontEnd, writer=None, shuffle: bool = False, quiz_size: int | None = None):
+        """
+        Initialize a session.
+
+        Args:
+            repo: Repository used to load questions and save the result
+            front_end (FrontEnd): The user interface to drive
+            writer: Object with submit(item, on_done) that saves results in the
+                    background; None saves synchronously with repo.append_result()
+            shuffle (bool): Give every quiz a new seeded random question order and
+                            option order (see Quiz.shuffled), so consecutive users
+                            can't pass answers on by position
+            quiz_size (int | None): With shuffle, pick this many questions from the
+                                    bank; None uses every question
+        """
+        self.repo = repo
+        self.front_end = front_end
+        self.writer = writer
+        self.shuffle = shuffle
+        self.quiz_size = quiz_size
+        self.quiz: Quiz | None = None
+        self.user_name = ""
+        self.result: Result | None = None
+        # Only the first failed save of an attempt is reported (result and answers
+        # usually fail together, e.g. on a full disk)
+        self._save_failed = False
+
+    @property
+    def finished(self) -> bool:
+        """True once the quiz has been finished (or never started)."""
+        return self.quiz is None or not self.quiz.is_active
+
+    @property
+    def current_question(self) -> Question:
+        """The question currently being shown."""
+        assert self.quiz is not None
+        return self.quiz.get_current_question()
+
+    def start(self, user_name: str, questions: Sequence[Question] | None = None, seed: int | None = None) -> bool:
+        """
+        Load the questions, start a quiz and show the first question.
+
+        Args:
+            user_name (str): The user's name (surrounding spaces are removed)
+            questions (Sequence[Question] | None): Questions that were already loaded
+                                                   (e.g. preloaded in the background);
+                                                   None loads them from the repository
+            seed (int | None): With shuffle, replay the quiz that used this seed
+                               (it is saved in the answer log); None draws a new one
+
+        Returns:
+            bool: True if the quiz started, False if there were no questions
+        """
+        # Profiles this session (only if QUIZ_PROFILE is set, and only the first session)
+        metrics.session_profiler.start()
+        self.user_name = user_name.strip()
+        self.result = None
+        if questions is None:
+            questions = self.repo.load_questions()
+        if not questions:
+            self.quiz = None
+            self.front_end.notify("warning", "No questions", "No questions available. Please add questions to continue.")
+            return False
+        if self.shuffle:
+            self.quiz = Quiz.shuffled(questions, k=self.quiz_size, seed=seed)
+        else:
+            self.quiz = Quiz(questions=questions)
+        self.quiz.start()
+        self._show_current()
+        return True
+
+    def submit(self, selected_index: int):
+        """
+        Record an answer for the current question and show feedback.
+
+        Args:
+            selected_index (int): Index of the option the user selected
+        """
+        assert self.quiz is not None
+        self.quiz.submit_answer(selected_index)
+        metrics.count("session.answers")
+        q = self.quiz.get_current_question()
+        self.front_end.show_feedback(q, selected_index, selected_index == q.correct_index)
+
+    def next(self):
+        """
+        Show the next question, or finish the quiz after the last one.
+        """
+        assert self.quiz is not None
+        if self.quiz.next_question():
+            self._show_current()
+        else:
+            self.finish()
+
+    def finish(self) -> Result:
+        """
+        End the quiz, save the result and show it.
+
+        The per-question answers (Quiz.answer_log) are saved as well when the
+        repository supports it. With a background writer the result is shown
+        straight away and saved afterwards. Either way, a failed save is reported
+        to the front-end but doesn't stop the result from being shown.
+
+        Returns:
+            Result: The final result
+        """
+        assert self.quiz is not None
+        self.result = self.quiz.finish(user_name=self.user_name)
+        self._save_failed = False
+        append_answers = getattr(self.repo, "append_answers", None)
+        answers = self.quiz.answer_log(self.result) if append_answers else None
+        if self.writer is not None:
+            self.writer.submit(self.result, on_done=self._on_saved)
+            if answers:
+                self.writer.submit(answers, on_done=self._on_saved, write=append_answers)
+        else:
+            try:
+                self.repo.append_result(self.result)
+                if answers:
+                    append_answers(answers)
+            except Exception as ex:
+                self._on_saved(ex)
+        self.front_end.show_results(self.result)
+        metrics.count("session.completed")
+        metrics.session_profiler.stop()
+        return self.result
+
+    def _on_saved(self, error: Exception | None):
+        """Report a failed save to the front-end."""
+        if error is not None and not self._save_failed:
+            self._save_failed = True
+            metrics.count("session.save_failed")
+            self.front_end.notify("error", "Save failed", f"Could not save results: {error}")
+
+    def _show_current(self):
+        """Tell the front-end to display the current question."""
+        assert self.quiz is not None
+        self.front_end.show_question(
+            self.quiz.get_current_question(), self.quiz.current_index + 1, len(self.quiz.questions)
+        )
+
+
+class HeadlessFrontEnd:
+    """
+    Front-end that displays nothing and just counts what it was asked to show.
+
+    Attributes:
+        questions_shown (int): Number of show_question() calls
+        feedback_shown (int): Number of show_feedback() calls
+        correct (int): Number of feedback calls for a correct answer
+        last_result (Result | None): The most recent result shown
+        messages (list[tuple[str, str, str]]): (level, title, message) of every notification
+    """
+
+    def __init__(self):
+        self.questions_shown = 0
+        self.feedback_shown = 0
+        self.correct = 0
+        self.last_result: Result | None = None
+        self.messages: list[tuple[str, str, str]] = []
+
+    def show_question(self, question: Question, number: int, total: int) -> None:
+        self.questions_shown += 1
+
+    def show_feedback(self, question: Question, selected_index: int, correct: bool) -> None:
+        self.feedback_shown += 1
+        self.correct += correct
+
+    def show_results(self, result: Result) -> None:
+        self.last_result = result
+
+    def notify(self, level: str, title: str, message: str) -> None:
+        self.messages.append((level, title, message))
+
+
+def run_scripted_session(session: QuizSession, user_name: str, choose: Callable[[Question], int]) -> Result | None:
+    """
+    Play a whole session without a user, answering with a scripted strategy.
+
+    Args:
+        session (QuizSession): A session whose front-end doesn't need real input
+                               (e.g. HeadlessFrontEnd)
+        user_name (str): Name to record on the result
+        choose (Callable[[Question], int]): Returns the option index to answer with
+
+    Returns:
+        Result | None: The final result, or None if the quiz couldn't start
+    """
+    if not session.start(user_name):
+        return None
+    while not session.finished:
+        session.submit(choose(session.current_question))
+        session.next()
+    return session.result
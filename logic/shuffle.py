@@ -0,0 +1,170 @@
+"""
+Shuffle Module
+
+Presents questions with their options in a per-session random order without
+copying them. A ShuffledQuestion wraps the original Question and a permutation
+tuple (displayed position -> original option index); its options and
+correct_index are read through the permutation, so correct_index always points
+at the same option text it did in the bank.
+"""
+
+import random
+from array import array
+from collections.abc import Sequence
+
+from .models import Question
+
+
+def seeded_rng(seed: int, *labels) -> random.Random:
+    """
+    Random generator for one independent use of a session seed.
+
+    Each use (e.g. picking the questions, ordering one question's options) gets
+    its own stream, so changing one of them (e.g. the quiz size) doesn't change
+    the others, and a stored seed replays the same session.
+
+    Args:
+        seed (int): The session seed
+        *labels: What the stream is for, e.g. "select" or ("options", question id)
+
+    Returns:
+        random.Random: A generator seeded from the seed and the labels
+    """
+    # String seeds are hashed with SHA-512, so this is the same in every process
+    return random.Random(":".join(str(part) for part in (seed, *labels)))
+
+
+def option_order(n: int, rng: random.Random) -> tuple[int, ...]:
+    """
+    Draw a random order for n options.
+
+    Args:
+        n (int): Number of options
+        rng (random.Random): Random generator to use
+
+    Returns:
+        tuple[int, ...]: Permutation of range(n); item i is the original index of
+                         the option shown at position i
+    """
+    order = list(range(n))
+    rng.shuffle(order)
+    return tuple(order)
+
+
+class PermutedOptions(Sequence):
+    """
+    Read-only view of a question's options in permuted order.
+    """
+    __slots__ = ("_options", "_order")
+
+    def __init__(self, options, order: tuple[int, ...]):
+        self._options = options
+        self._order = order
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._options[j] for j in self._order[i]]
+        return self._options[self._order[i]]
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"PermutedOptions({list(self)!r})"
+
+
+class PickedQuestions(Sequence):
+    """
+    Read-only view of the questions picked from a bank, in picked order.
+
+    Only the positions are stored; each question is looked up in the bank when
+    it is accessed, so a lazily decoded bank (e.g. CompiledQuestionBank) only
+    decodes the questions that are actually shown.
+    """
+    __slots__ = ("_questions", "_picked")
+
+    def __init__(self, questions, picked):
+        self._questions = questions
+        self._picked = array("I", picked)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._questions[j] for j in self._picked[i]]
+        return self._questions[self._picked[i]]
+
+    def __len__(self) -> int:
+        return len(self._picked)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"PickedQuestions({len(self)} of {len(self._questions)} questions)"
+
+
+class ShuffledQuestion:
+    """
+    A question as shown to one session, with its options in permuted order.
+
+    Has the attributes of Question; options and correct_index are in displayed
+    order, everything else is the original question's.
+
+    Attributes:
+        question (Question): The original question
+        order (tuple[int, ...]): Original option index for each displayed position
+    """
+    __slots__ = ("question", "order")
+
+    def __init__(self, question: Question, order: tuple[int, ...]):
+        self.question = question
+        self.order = order
+
+    @property
+    def id(self) -> str:
+        return self.question.id
+
+    @property
+    def text(self) -> str:
+        return self.question.text
+
+    @property
+    def category(self) -> str:
+        return self.question.category
+
+    @property
+    def difficulty(self) -> str:
+        return self.question.difficulty
+
+    @property
+    def options(self) -> PermutedOptions:
+        return PermutedOptions(self.question.options, self.order)
+
+    @property
+    def correct_index(self) -> int:
+        return self.order.index(self.question.correct_index)
+
+    def original_index(self, displayed_index: int) -> int:
+        """
+        Translate a displayed option position into the original option index.
+
+        Args:
+            displayed_index (int): Position of the option as shown
+
+        Returns:
+            int: Index of the same option in the original question
+        """
+        return self.order[displayed_index]
+
+    def is_valid(self) -> bool:
+        """Same checks as Question.is_valid()."""
+        return self.question.is_valid()
+
+    def __repr__(self) -> str:
+        return f"ShuffledQuestion({self.question!r}, order={self.order!r})"
@@ -0,0 +1,273 @@
+"""
+Result Statistics Module
+
+Running aggregates over quiz results. Instead of loading every Result to answer
+"what is the average score?", the repository keeps a ResultStats up to date as
+results are saved, and every statistic is then computed in O(1).
+
+QuestionStats does the same per question from the answers log (attempts,
+correct answers, option histogram and dwell time), which gives item-difficulty
+reports without re-reading every answer.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+from .models import Answer, Result
+
+
+@dataclass
+class ResultStats:
+    """
+    Running count, sum and sum-of-squares for score and time_taken.
+
+    Adding results one at a time gives exactly the same numbers as
+    ResultStats.from_results() over the same results in the same order.
+
+    Attributes:
+        pass_mark (float): Fraction of questions needed to pass (e.g. 0.7 = 70%)
+        count (int): Number of results added
+        score_sum (int): Sum of all scores
+        score_sq_sum (int): Sum of all squared scores
+        time_sum (float): Sum of all times taken, in seconds
+        time_sq_sum (float): Sum of all squared times taken
+        passed (int): Number of results at or above the pass mark
+        best_by_user (Dict[str, int]): Best score per user name ("" for anonymous)
+    """
+    pass_mark: float = 0.7
+    count: int = 0
+    score_sum: int = 0
+    score_sq_sum: int = 0
+    time_sum: float = 0.0
+    time_sq_sum: float = 0.0
+    passed: int = 0
+    best_by_user: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_results(cls, results: Iterable[Result], pass_mark: float = 0.7) -> "ResultStats":
+        """
+        Compute statistics from scratch.
+
+        Args:
+            results (Iterable[Result]): The results to aggregate
+            pass_mark (float): Fraction of questions needed to pass
+
+        Returns:
+            ResultStats: Statistics over all the given results
+        """
+        stats = cls(pass_mark=pass_mark)
+        for r in results:
+            stats.add(r)
+        return stats
+
+    def add(self, r: Result):
+        """
+        Fold one result into the running totals.
+
+        Args:
+            r (Result): The result to add
+        """
+        self.count += 1
+        self.score_sum += r.score
+        self.score_sq_sum += r.score * r.score
+        self.time_sum += r.time_taken
+        self.time_sq_sum += r.time_taken * r.time_taken
+        if r.total_questions > 0 and r.score / r.total_questions >= self.pass_mark:
+            self.passed += 1
+
+        name = r.user_name or ""
+        best = self.best_by_user.get(name)
+        if best is None or r.score > best:
+            self.best_by_user[name] = r.score
+
+    @property
+    def mean_score(self) -> float:
+        """Average score, or 0.0 if there are no results."""
+        return self.score_sum / self.count if self.count else 0.0
+
+    @property
+    def score_stddev(self) -> float:
+        """Population standard deviation of the scores."""
+        return _stddev(self.count, self.score_sum, self.score_sq_sum)
+
+    @property
+    def mean_time(self) -> float:
+        """Average time taken in seconds, or 0.0 if there are no results."""
+        return self.time_sum / self.count if self.count else 0.0
+
+    @property
+    def time_stddev(self) -> float:
+        """Population standard deviation of the times taken."""
+        return _stddev(self.count, self.time_sum, self.time_sq_sum)
+
+    @property
+    def pass_rate(self) -> float:
+        """Fraction of results at or above the pass mark, or 0.0 if there are none."""
+        return self.passed / self.count if self.count else 0.0
+
+    def best_score(self, user_name: str | None) -> int | None:
+        """
+        Return a user's best score.
+
+        Args:
+            user_name (str | None): The user name (None or "" for anonymous attempts)
+
+        Returns:
+            int | None: The best score, or None if the user has no results
+        """
+        return self.best_by_user.get(user_name or "")
+
+    def to_dict(self) -> dict:
+        """
+        Convert the statistics to a JSON-friendly dictionary.
+        """
+        return {
+            "pass_mark": self.pass_mark,
+            "count": self.count,
+            "score_sum": self.score_sum,
+            "score_sq_sum": self.score_sq_sum,
+            "time_sum": self.time_sum,
+            "time_sq_sum": self.time_sq_sum,
+            "passed": self.passed,
+            "best_by_user": self.best_by_user,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ResultStats":
+        """
+        Rebuild statistics saved with to_dict().
+
+        Args:
+            data (dict): A dictionary produced by to_dict()
+
+        Returns:
+            ResultStats: The restored statistics
+        """
+        return cls(
+            pass_mark=float(data["pass_mark"]),
+            count=int(data["count"]),
+            score_sum=int(data["score_sum"]),
+            score_sq_sum=int(data["score_sq_sum"]),
+            time_sum=float(data["time_sum"]),
+            time_sq_sum=float(data["time_sq_sum"]),
+            passed=int(data["passed"]),
+            best_by_user={str(k): int(v) for k, v in data["best_by_user"].items()},
+        )
+
+
+@dataclass
+class QuestionStats:
+    """
+    Running per-question counters over the answers log.
+    
+    Attributes:
+        attempts (int): Number of times the question was shown in a finished quiz
+        correct (int): Number of correct answers
+        skipped (int): Number of times it was left unanswered
+        dwell_sum (float): Total seconds the question was on screen
+        option_counts (Dict[int, int]): How often each option index was chosen
+    """
+    attempts: int = 0
+    correct: int = 0
+    skipped: int = 0
+    dwell_sum: float = 0.0
+    option_counts: Dict[int, int] = field(default_factory=dict)
+
+    def add(self, a: Answer):
+        """
+        Fold one answer into the counters.
+        
+        Args:
+            a (Answer): An answer to this question
+        """
+        self.attempts += 1
+        self.correct += a.correct
+        self.dwell_sum += a.dwell_time
+        if a.selected_index is None:
+            self.skipped += 1
+        else:
+            self.option_counts[a.selected_index] = self.option_counts.get(a.selected_index, 0) + 1
+
+    @property
+    def p_correct(self) -> float:
+        """Fraction answered correctly (the item's difficulty index), or 0.0 if never attempted."""
+        return self.correct / self.attempts if self.attempts else 0.0
+
+    @property
+    def mean_dwell(self) -> float:
+        """Average seconds on screen, or 0.0 if never attempted."""
+        return self.dwell_sum / self.attempts if self.attempts else 0.0
+
+    def to_dict(self) -> dict:
+        """
+        Convert the counters to a JSON-friendly dictionary.
+        """
+        return {
+            "attempts": self.attempts,
+            "correct": self.correct,
+            "skipped": self.skipped,
+            "dwell_sum": self.dwell_sum,
+            "option_counts": {str(k): v for k, v in self.option_counts.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "QuestionStats":
+        """
+        Rebuild counters saved with to_dict().
+        
+        Args:
+            data (dict): A dictionary produced by to_dict()
+        
+        Returns:
+            QuestionStats: The restored counters
+        """
+        return cls(
+            attempts=int(data["attempts"]),
+            correct=int(data["correct"]),
+            skipped=int(data["skipped"]),
+            dwell_sum=float(data["dwell_sum"]),
+            option_counts={int(k): int(v) for k, v in data["option_counts"].items()},
+        )
+
+
+def question_stats_from_answers(answers: Iterable[Answer]) -> Dict[str, QuestionStats]:
+    """
+    Compute per-question counters from scratch.
+    
+    Args:
+        answers (Iterable[Answer]): The answers to aggregate
+    
+    Returns:
+        Dict[str, QuestionStats]: Counters keyed by question id
+    """
+    stats: Dict[str, QuestionStats] = {}
+    for a in answers:
+        stats.setdefault(a.question_id, QuestionStats()).add(a)
+    return stats
+
+
+def difficulty_report(stats: Dict[str, QuestionStats], min_attempts: int = 1) -> List[Tuple[str, QuestionStats]]:
+    """
+    Rank questions from hardest to easiest.
+    
+    Args:
+        stats (Dict[str, QuestionStats]): Counters keyed by question id
+        min_attempts (int): Leave out questions with fewer attempts than this
+    
+    Returns:
+        List[Tuple[str, QuestionStats]]: (question id, counters), lowest p_correct
+                                         first, longer mean dwell first on ties
+    """
+    rows = [(qid, s) for qid, s in stats.items() if s.attempts >= min_attempts]
+    rows.sort(key=lambda row: (row[1].p_correct, -row[1].mean_dwell, row[0]))
+    return rows
+
+
+def _stddev(n: int, total: float, sq_total: float) -> float:
+    """Population standard deviation from a count, sum and sum of squares."""
+    if n == 0:
+        return 0.0
+    mean = total / n
+    # Rounding can push the variance slightly below zero for identical values
+    return math.sqrt(max(0.0, sq_total / n - mean * mean))
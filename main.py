@@ -1,21 +1,38 @@
+from __future__ import annotations
+
+import threading
+import time
 import tkinter as tk
-from tkinter import PhotoImage, ttk, messagebox
+from tkinter import ttk
+from typing import TYPE_CHECKING
 
+# Only the first screen (and the small metrics module) is imported up front so the
+# window appears as soon as possible. The other screens, messagebox, the quiz logic
+# and the data layer are imported the first time they are needed (see the methods below).
 from .gui.welcome_screen import WelcomeScreen
-from .gui.question_screen import QuestionScreen
-from .gui.results_screen import ResultsScreen
-from .gui.stored_results_screen import StoredResultsScreen
+from .logic import metrics
 
-from .logic.models import Question
-from .logic.quiz import Quiz  
-from .logic.validate import format_time
-from .data.repository import CSVRepository
+if TYPE_CHECKING:
+    from .logic.models import Question
+    from .logic.quiz import Quiz
 
+# Non-functional requirement: every screen transition must finish within 500 ms
+TRANSITION_BUDGET_S = 0.5
+# How often finished background saves are checked for, in milliseconds
+WRITER_POLL_MS = 100
 
 
 
 class App(tk.Tk):
-    def __init__(self, questions_path="App/csv_files/questions.csv", results_path="App/csv_files/results.csv"):
+    """
+    Tkinter front-end for the quiz.
+
+    The quiz flow itself lives in QuizSession; App implements the session's
+    FrontEnd methods (show_question, show_feedback, show_results, notify) and
+    forwards button clicks back to the session.
+    """
+
+    def __init__(self, questions_path="App/csv_files/questions.csv", results_path="App/csv_files/results.csv", repo=None):
         super().__init__()
 
 
@@ -28,26 +45,104 @@ class App(tk.Tk):
         self.container.pack(fill="both", expand=True)
 
         # Data + logic dependencies:
-        self.repo = CSVRepository(questions_path, results_path) # Handles loading/saving questions and results from CSV files
-        self.quiz : Quiz | None = None # hold the Quiz object once the user starts PROBLEM !!!!
-        self.current_user: str = "" 
+        # Handles loading/saving questions and results. Any backend with the same methods
+        # (e.g. BinaryRepository) can be passed in; CSV files are the default and are
+        # created on first use (see the repo property).
+        self._repo = repo
+        self._repo_lock = threading.Lock()
+        self._questions_path = questions_path
+        self._results_path = results_path
+
+        # Start loading the question bank now, while the user is still typing their name.
+        # The worker thread also pays for importing the data layer.
+        self._started_at = time.perf_counter()
+        self.startup_to_first_question: float | None = None
+        self._preloaded_questions = None
+        self._preload_thread: threading.Thread | None = threading.Thread(
+            target=self._preload_questions, name="question-preload", daemon=True
+        )
+        self._preload_thread.start()
+
+        # Created on the first "Start Quiz" (see _ensure_session)
+        self.writer = None
+        self.session = None
+        # Each screen is built the first time it is needed and then kept for reuse
+        self._screens: dict[str, tk.Widget] = {}
+        self._current_screen: tk.Widget | None = None
+        # (screen name, "built" or "reused", seconds) for each screen transition
+        self.transition_times: list[tuple[str, str, float]] = []
+
+        # Closing the window goes through _exit_app too, so queued results are flushed
+        self.protocol("WM_DELETE_WINDOW", self._exit_app)
 
         self.show_welcome()
 
 
 
     # --- Navigation helpers ---
-    def clear(self):
+    def _show_screen(self, name: str, factory):
         """
-    
+        Show the cached screen called name, building it first if needed.
 
-        Function, which clears everything currently in the container 
-        
+        The screen that was showing is hidden (not destroyed), so switching back to
+        it later is just a pack() call.
+
+        :param name: Key of the screen in the cache
+        :param factory: Called with no arguments to build the screen the first time
+        :return: (screen, mode) where mode is "built" or "reused"
+        """
+        screen = self._screens.get(name)
+        mode = "reused"
+        if screen is None:
+            screen = factory()
+            self._screens[name] = screen
+            mode = "built"
+        if screen is not self._current_screen:
+            if self._current_screen is not None:
+                self._current_screen.pack_forget()
+            screen.pack(fill="both", expand=True)
+            self._current_screen = screen
+        return screen, mode
+
+    def _finish_transition(self, screen_name: str, mode: str, start: float):
+        """
+        Record how long a screen transition took, and count and log it if it was
+        over budget.
+
+        :param screen_name: Name of the screen that was shown
+        :param mode: "built" if the screen was constructed, "reused" if it was cached
+        :param start: time.perf_counter() value taken when the transition began
+        """
+        # Let Tk finish layout so the measurement includes it
+        self.update_idletasks()
+        elapsed = time.perf_counter() - start
+        self.transition_times.append((screen_name, mode, elapsed))
+        metrics.record(f"app.show_{screen_name}.{mode}", elapsed)
+        if elapsed > TRANSITION_BUDGET_S:
+            metrics.count(f"app.show_{screen_name}.{mode}.over_budget")
+            # Imported here: it is only needed when something is already slow
+            import logging
+            logging.getLogger(__name__).warning(
+                "Slow transition to %s (%s): %.0f ms (budget %.0f ms)",
+                screen_name, mode, elapsed * 1000, TRANSITION_BUDGET_S * 1000,
+            )
+
+    def transition_report(self) -> dict:
         """
-        for widgets in self.container.winfo_children():
-            widgets.destroy()
+        Summarise screen transition times, split into construction and reuse.
 
-    
+        :return: {screen name: {"built" | "reused": {"count": int, "mean_ms": float, "max_ms": float}}}
+        """
+        report: dict = {}
+        for name, mode, elapsed in self.transition_times:
+            entry = report.setdefault(name, {}).setdefault(mode, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += elapsed * 1000
+            entry["max_ms"] = max(entry["max_ms"], elapsed * 1000)
+        for modes in report.values():
+            for entry in modes.values():
+                entry["mean_ms"] = entry.pop("total_ms") / entry["count"]
+        return report
 
     def show_welcome(self):
         """
@@ -56,101 +151,168 @@ class App(tk.Tk):
         Loads the Welcome screen and puts it in the container. Passing two functions start_quiz_flow() and exit_app() 
         into the Welcome screen so it knows what to do when the user clicks a button. 
         """ 
-        self.clear()
-        screen = WelcomeScreen(
+        start = time.perf_counter()
+        screen, mode = self._show_screen("welcome", lambda: WelcomeScreen(
             parent=self.container,
             start_callback=self.start_quiz_flow,
             exit_callback=self._exit_app
-        )
-        screen.pack(fill="both", expand=True)
+        ))
         screen.focus_default()
+        self._finish_transition("welcome", mode, start)
+
 
 
+    @property
+    def repo(self):
+        """
+        The data repository, created on first use.
+
+        Building the default CSVRepository imports the whole data layer, so it is
+        deferred until the preload thread (or a screen) first needs it.
+        """
+        with self._repo_lock:
+            if self._repo is None:
+                from .data.repository import CSVRepository
+                # Kiosks run one App per seat against a shared results file, so writes
+                # take the inter-process file lock (see data.locking)
+                self._repo = CSVRepository(self._questions_path, self._results_path, lock_writes=True)
+            return self._repo
+
+    def _ensure_session(self):
+        """
+        Create the quiz session and its background writer the first time a quiz starts.
+        """
+        if self.session is None:
+            from .data.background_writer import BackgroundWriter
+            from .logic.session import QuizSession
+
+            # Results are saved on a worker thread so a slow disk never freezes the window
+            self.writer = BackgroundWriter(self.repo.append_result)
+            # Runs the quiz flow and calls back into this window to display each step
+            # Shuffled, so the next person at the kiosk can't copy answers by position
+            self.session = QuizSession(self.repo, front_end=self, writer=self.writer, shuffle=True)
+            self._pump_writer()
 
     def start_quiz_flow(self, name: str):
         """
         
         
         :param name: Username
-        Save their name
-
-        Load questions from the CSV
-        Create a Quiz object with those questions
-        Start the quiz 
-        Show the first question screen
+        Start a quiz session for this user. The first quiz uses the questions
+        preloaded in __init__ (waiting for them if they are still loading); later
+        quizzes let the session load them from the repository. The session starts
+        the quiz and calls show_question() with the first question
+        (or notify() if there are no questions).
         
         """
-        self.current_user = name.strip()
-        questions = self.repo.load_questions()
-        if not questions:
-            messagebox.showwarning("No questions", "No questions available. Please add questions to continue.")
-            return
-        self.quiz = Quiz(questions=questions)
-        self.quiz.start()
-        self.show_question()
+        self._ensure_session()
+        self.session.start(name, questions=self._take_preloaded_questions())
 
-        
+    def _preload_questions(self):
+        """
+        Load the question bank on the preload thread. Errors are ignored here;
+        the session simply loads the questions itself later.
+        """
+        try:
+            self._preloaded_questions = self.repo.load_questions()
+        except Exception:
+            self._preloaded_questions = None
+
+    def _take_preloaded_questions(self):
+        """
+        Return the questions loaded in the background at startup, once.
+
+        :return: The preloaded questions, or None if they were already used or
+                 preloading failed (the session then loads them itself)
+        """
+        thread, self._preload_thread = self._preload_thread, None
+        if thread is None:
+            return None
+        thread.join()
+        questions, self._preloaded_questions = self._preloaded_questions, None
+        return questions
+
+    @property
+    def quiz(self) -> Quiz | None:
+        """The Quiz being played by the current session."""
+        return self.session.quiz if self.session is not None else None
+
+    # --- FrontEnd methods called by QuizSession ---
+    def show_question(self, question: Question, number: int, total: int):
+        from .gui.question_screen import QuestionScreen
 
-    def show_question(self):
-        self.clear()
-        assert self.quiz is not None
-        q = self.quiz.get_current_question()
-        screen = QuestionScreen(
+        start = time.perf_counter()
+        # The same screen is reused for every question (and every quiz)
+        screen, mode = self._show_screen("question", lambda: QuestionScreen(
             parent=self.container,
-            submit_callback=self._submit_answer_and_feedback,
-            next_callback=self._go_next_or_finish
-        )
-        screen.pack(fill="both", expand=True)
-        screen.set_question(q)
+            submit_callback=self.session.submit,
+            next_callback=self.session.next
+        ))
+        screen.set_question(question)
         screen.show_question_mode()
         screen.focus_default()
+        self._finish_transition("question", mode, start)
+        if self.startup_to_first_question is None:
+            self.startup_to_first_question = time.perf_counter() - self._started_at
 
-    def _submit_answer_and_feedback(self, selected_idx: int):
-        assert self.quiz is not None
-        self.quiz.submit_answer(selected_idx)
-        q = self.quiz.get_current_question()
-        # Show feedback (correct vs selected)
-        screen = self.container.winfo_children()[0]  # current QuestionScreen
-        # call screen method safely
-        if hasattr(screen, "show_feedback_mode"):
-            screen.show_feedback_mode(correct_index=q.correct_index, selected_index=selected_idx)
-
-    def _go_next_or_finish(self):
-        assert self.quiz is not None
-        if self.quiz.next_question():
-            self.show_question()
-        else:
-            result = self.quiz.finish(user_name=self.current_user)
-            self.show_results(result)
+    def show_feedback(self, question: Question, selected_index: int, correct: bool):
+        start = time.perf_counter()
+        # Show feedback (correct vs selected) on the current QuestionScreen
+        screen = self._screens.get("question")
+        if screen is not None:
+            screen.show_feedback_mode(correct_index=question.correct_index, selected_index=selected_index)
+        self._finish_transition("feedback", "reused", start)
 
     def show_results(self, result):
-        self.clear()
-        # persist result
-        try:
-            self.repo.append_result(result)
-        except Exception as ex:
-            messagebox.showerror("Save failed", f"Could not save results: {ex}")
+        from .gui.results_screen import ResultsScreen
 
-        screen = ResultsScreen(
+        start = time.perf_counter()
+        # The session has already saved the result
+        screen, mode = self._show_screen("results", lambda: ResultsScreen(
             parent=self.container,
             view_results_callback=self.show_stored_results
-        )
-        screen.pack(fill="both", expand=True)
+        ))
         screen.display(result)
         screen.focus_default()
+        self._finish_transition("results", mode, start)
+
+    def notify(self, level: str, title: str, message: str):
+        from tkinter import messagebox
+
+        if level == "warning":
+            messagebox.showwarning(title, message)
+        else:
+            messagebox.showerror(title, message)
 
     def show_stored_results(self):
-        self.clear()
-        results = self.repo.load_results()
-        screen = StoredResultsScreen(
+        from .gui.stored_results_screen import StoredResultsScreen
+
+        start = time.perf_counter()
+        screen, mode = self._show_screen("stored_results", lambda: StoredResultsScreen(
             parent=self.container,
             exit_callback=self._exit_app
-        )
-        screen.pack(fill="both", expand=True)
-        screen.display(results)
+        ))
+        # The result just shown may still be queued on the background writer;
+        # wait for it so the list includes it
+        if self.writer is not None:
+            self.writer.flush()
+        # Only the visible page is read from the repository, not the whole history
+        screen.display_paged(self.repo.count_results(), self.repo.iter_results)
         screen.focus_default()
+        self._finish_transition("stored_results", mode, start)
+
+    def _pump_writer(self):
+        """
+        Run completion callbacks for finished background saves on the Tk thread,
+        then check again shortly.
+        """
+        self.writer.dispatch_completions()
+        self.after(WRITER_POLL_MS, self._pump_writer)
 
     def _exit_app(self):
+        # Make sure every queued result reaches the disk before the window closes
+        if self.writer is not None:
+            self.writer.close()
         self.destroy()
 
 if __name__ == "__main__":
@@ -10,10 +10,52 @@ This test suite validates core business logic including:
 Run with: python -m pytest test_quiz_app.py -v
 """
 
+import collections.abc
+import csv
+import gc
+import importlib
+import io
+import json
+import os
+import random
+import sqlite3
+import sys
+import threading
+import weakref
+from pathlib import Path
+
 import pytest
 from logic.validate import validate_selected_answer, check_answer, format_time
-from logic.models import Question, Result
+from logic.models import Answer, Question, Result, SlottedQuestion, SlottedResult
+from logic.columnar import QuestionBank, ResultTable, StringPool
+from logic.question_index import DuplicateQuestionError, QuestionIndex, normalize_text
 from logic.quiz import Quiz
+from logic.sampling import reservoir_sample
+from logic.scoring import UNANSWERED, answer_row, score_batch
+from logic.stats import QuestionStats, ResultStats, difficulty_report, question_stats_from_answers
+from logic import metrics
+from logic.session import HeadlessFrontEnd, QuizSession, run_scripted_session
+from data.background_writer import BackgroundWriter
+from benchmarks.import_profile import profile_imports
+from benchmarks.regression import compare, load_baseline, save_baseline
+
+
+PACKAGE = Path(__file__).resolve().parent
+
+
+def package_module(name: str):
+    """
+    Import one of the App's modules through the package name (e.g. "data.repository").
+    
+    The data layer uses relative imports, so it only imports as part of the
+    package. Its models are then the package's own classes, so tests of it use
+    package_module("logic.models") rather than the top-level imports above.
+    """
+    if not PACKAGE.name.isidentifier():
+        pytest.skip("package folder name is not importable")
+    if str(PACKAGE.parent) not in sys.path:
+        sys.path.insert(0, str(PACKAGE.parent))
+    return importlib.import_module(f"{PACKAGE.name}.{name}")
 
 
 # VALIDATION FUNCTION TESTS
@@ -392,6 +434,1784 @@ class TestQuiz:
 
 
 
+# SHUFFLED QUIZ TESTS
+
+
+class TestShuffledQuiz:
+    """Test cases for Quiz.shuffled() and ShuffledQuestion"""
+    
+    def setup_method(self):
+        self.bank = [
+            Question(id=f"q{i}", text=f"Question {i}?", options=["A", "B", "C", "D"], correct_index=i % 4)
+            for i in range(50)
+        ]
+    
+    def test_same_seed_same_quiz(self):
+        """Test that a seed reproduces both the questions and the option orders"""
+        a = Quiz.shuffled(self.bank, k=10, seed=7)
+        b = Quiz.shuffled(self.bank, k=10, seed=7)
+        assert [q.id for q in a.questions] == [q.id for q in b.questions]
+        assert [a.option_order(i) for i in range(10)] == [b.option_order(i) for i in range(10)]
+        assert a.seed == 7
+        assert len(Quiz.shuffled(self.bank, k=500).questions) == 50
+    
+    def test_option_order_does_not_depend_on_quiz_size(self):
+        """Test that the same seed shows a question's options the same way for any quiz size"""
+        small = Quiz.shuffled(self.bank, k=5, seed=11)
+        full = Quiz.shuffled(self.bank, seed=11)
+        orders = {q.id: full.option_order(i) for i, q in enumerate(full.questions)}
+        assert all(small.option_order(i) == orders[q.id] for i, q in enumerate(small.questions))
+        assert len({orders[q.id] for q in full.questions}) > 1
+    
+    def test_option_orders_are_drawn_when_presented(self):
+        """Test that only the questions actually shown get a permutation"""
+        quiz = Quiz.shuffled(self.bank, seed=3)
+        assert quiz.option_orders == {}
+        quiz.start()
+        quiz.get_current_question()
+        quiz.next_question()
+        quiz.submit_answer(0)
+        assert sorted(quiz.option_orders) == [0, 1]
+
+    def test_whole_bank_quiz_only_looks_up_shown_questions(self):
+        """Test that k=None doesn't read every question of a lazily decoded bank up front"""
+        looked_up = []
+
+        class LazyBank(collections.abc.Sequence):
+            def __getitem__(bank, i):
+                looked_up.append(i)
+                return self.bank[i]
+
+            def __len__(bank):
+                return len(self.bank)
+
+        quiz = Quiz.shuffled(LazyBank(), seed=5)
+        assert looked_up == [] and len(quiz.questions) == 50
+        quiz.start()
+        quiz.submit_answer(quiz.get_current_question().correct_index)
+        assert quiz.finish("Ann").score == 1
+        assert len(set(looked_up)) == 1
+
+    def test_correct_index_follows_the_option(self):
+        """Test that the displayed correct_index points at the original correct text"""
+        quiz = Quiz.shuffled(self.bank, seed=1)
+        quiz.start()
+        for i, original in enumerate(quiz.questions):
+            quiz.current_index = i
+            shown = quiz.get_current_question()
+            assert shown.question is original  # a view, not a copy
+            assert sorted(shown.options) == original.options
+            assert shown.options[shown.correct_index] == original.options[original.correct_index]
+    
+    def test_answers_are_stored_in_original_order(self):
+        """Test that scoring and the answer log use original option indexes"""
+        quiz = Quiz.shuffled(self.bank, k=3, seed=2)
+        quiz.start()
+        for _ in range(3):
+            quiz.submit_answer(quiz.get_current_question().correct_index)
+            quiz.next_question()
+        result = quiz.finish("Ann")
+        assert result.score == 3
+        log = quiz.answer_log(result)
+        assert [a.selected_index for a in log] == [q.correct_index for q in quiz.questions]
+        assert all(a.seed == 2 and a.correct for a in log)
+    
+    def test_unshuffled_quiz_is_unchanged(self):
+        """Test that a quiz without a seed shows the original Question objects"""
+        quiz = Quiz(self.bank[:2])
+        quiz.start()
+        assert quiz.get_current_question() is self.bank[0]
+        assert quiz.option_orders is None
+
+
+
+# COLUMNAR STORAGE TESTS
+
+
+class TestColumnarStorage:
+    """Test cases for slotted models, QuestionBank and ResultTable"""
+    
+    def setup_method(self):
+        self.questions = [
+            Question(id="q1", text="First?", options=["Yes", "No"], correct_index=0),
+            Question(id="q2", text="Second \u2713?", options=["Yes", "No", "Maybe"], correct_index=2),
+        ]
+        self.results = [
+            Result("Ann", 3, 5, 12.5, "2024-02-20T14:30:00Z"),
+            Result("Bob", 5, 5, 8.0, "yesterday"),
+            Result("Ann", 4, 5, 10.25, "2024-02-21T09:05:07Z"),
+        ]
+    
+    def test_slotted_models_have_no_dict(self):
+        """Test that slotted variants keep the fields but drop __dict__"""
+        q = SlottedQuestion.from_question(self.questions[0])
+        r = SlottedResult.from_result(self.results[0])
+        assert not hasattr(q, "__dict__") and not hasattr(r, "__dict__")
+        assert q.options == ("Yes", "No") and q.is_valid()
+        assert r.to_dict() == self.results[0].to_dict()
+    
+    def test_string_pool_stores_each_string_once(self):
+        """Test that interning the same string twice returns the same id"""
+        pool = StringPool()
+        assert pool.intern("a") == pool.intern("a") == 0
+        assert pool.intern("b") == 1
+        assert pool[1] == "b" and len(pool) == 2
+    
+    def test_question_bank_views_match_questions(self):
+        """Test that every view reads back the question it was built from"""
+        bank = QuestionBank.from_questions(self.questions)
+        assert len(bank) == 2
+        assert list(bank) == self.questions
+        assert bank[-1].options == ("Yes", "No", "Maybe")
+        assert bank[1].to_question() == self.questions[1]
+        assert bank.correct_index(1) == 2
+        assert len(bank.pool) == 4  # "Yes" and "No" are shared; "" is the empty category and difficulty
+        with pytest.raises(IndexError):
+            bank[2]
+    
+    def test_quiz_runs_on_question_bank(self):
+        """Test that Quiz works unchanged with views instead of Questions"""
+        quiz = Quiz(QuestionBank.from_questions(self.questions))
+        quiz.start()
+        quiz.submit_answer(0)
+        quiz.next_question()
+        quiz.submit_answer(2)
+        assert quiz.finish(user_name="Ann").score == 2
+    
+    def test_result_table_round_trips_timestamps(self):
+        """Test that standard and non-standard timestamps read back exactly"""
+        table = ResultTable.from_results(self.results)
+        assert [r.to_result() for r in table] == self.results
+        assert table[1].timestamp == "yesterday"
+        assert table[0].to_dict() == self.results[0].to_dict()
+        assert len(table.pool) == 3  # "Ann", "Bob" and "yesterday"
+    
+    def test_result_table_keeps_anonymous_results(self):
+        """Test that a None user name reads back as None and an empty one as an empty string"""
+        results = [Result(None, 3, 5, 1.0, "2024-01-01T12:00:00Z"), Result("", 4, 5, 2.0, "2024-01-01T12:00:00Z")]
+        table = ResultTable.from_results(results)
+        assert table[0].user_name is None and table[1].user_name == ""
+        assert [r.to_result() for r in table] == results
+        assert table[0].to_dict()["user_name"] == ""
+
+
+
+# BATCH SCORING TESTS
+
+
+class TestScoreBatch:
+    """Test cases for batch scoring of answer sheets"""
+    
+    @pytest.fixture(params=["array", "numpy"])
+    def backend(self, request):
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        return request.param
+    
+    def test_matches_calculate_score(self, backend):
+        """Test that every sheet gets the same score as Quiz.calculate_score()"""
+        rng = random.Random(7)
+        questions = [Question(id=f"q{i}", text="Q?", options=["A", "B", "C"], correct_index=rng.randrange(3))
+                     for i in range(12)]
+        sheets = [[rng.choice([None, 0, 1, 2]) for _ in questions] for _ in range(50)]
+        
+        expected = []
+        for sheet in sheets:
+            quiz = Quiz(questions)
+            quiz.user_answers = list(sheet)
+            expected.append(quiz.calculate_score())
+        
+        batch = Quiz.score_batch(questions, sheets, backend=backend)
+        assert list(batch.scores) == expected
+        for j, q in enumerate(questions):
+            assert batch.question_correct[j] == sum(sheet[j] == q.correct_index for sheet in sheets)
+    
+    def test_unanswered_never_counts(self, backend):
+        """Test that None and UNANSWERED are both treated as unanswered"""
+        batch = score_batch([[None, UNANSWERED], answer_row([1, None])], [1, 0], backend=backend)
+        assert list(batch.scores) == [0, 1]
+        assert list(batch.question_correct) == [1, 0]
+    
+    def test_no_sheets(self, backend):
+        """Test that an empty batch gives no scores and zero counts"""
+        batch = score_batch([], [0, 1, 2], backend=backend)
+        assert list(batch.scores) == []
+        assert list(batch.question_correct) == [0, 0, 0]
+    
+    def test_ragged_row_rejected(self, backend):
+        """Test that a sheet with the wrong number of answers is an error"""
+        with pytest.raises(ValueError):
+            score_batch([[0, 1], [0]], [0, 1], backend=backend)
+    
+    def test_unknown_backend_rejected(self):
+        """Test that an unknown backend name is an error"""
+        with pytest.raises(ValueError):
+            score_batch([[0]], [0], backend="gpu")
+
+
+
+# ANSWER LOG TESTS
+
+
+class TestAnswerLog:
+    """Test cases for per-question dwell times and Quiz.answer_log()"""
+    
+    def setup_method(self):
+        self.questions = [
+            Question(id="q1", text="First?", options=["A", "B"], correct_index=0),
+            Question(id="q2", text="Second?", options=["A", "B", "C"], correct_index=2),
+        ]
+    
+    def test_dwell_time_per_question(self, monkeypatch):
+        """Test that time on screen is attributed to the question being shown"""
+        clock = iter([10.0, 13.5, 20.0])
+        monkeypatch.setattr("logic.quiz.time.perf_counter", lambda: next(clock))
+        quiz = Quiz(self.questions)
+        quiz.start()             # q1 shown at 10.0
+        quiz.submit_answer(0)
+        quiz.next_question()     # q2 shown at 13.5
+        quiz.finish(user_name="Ann")  # ends at 20.0
+        assert quiz.dwell_times == [3.5, 6.5]
+    
+    def test_answer_log_records_choices(self):
+        """Test that the log has the chosen option and correctness of every question"""
+        quiz = Quiz(self.questions)
+        quiz.start()
+        quiz.submit_answer(1)
+        quiz.next_question()
+        result = quiz.finish(user_name="Ann")
+        log = quiz.answer_log(result)
+        assert [(a.question_id, a.selected_index, a.correct) for a in log] == [("q1", 1, False), ("q2", None, False)]
+        assert all(a.user_name == "Ann" and a.timestamp == result.timestamp for a in log)
+        assert log[1].to_dict()["selected_index"] == ""
+
+
+
+# STATISTICS TESTS
+
+
+class TestResultStats:
+    """Test cases for ResultStats running aggregates"""
+    
+    def setup_method(self):
+        """Create sample results for each test"""
+        self.results = [
+            Result(user_name="Alice", score=8, total_questions=10, time_taken=120.5, timestamp="t1"),
+            Result(user_name="Bob", score=5, total_questions=10, time_taken=200.0, timestamp="t2"),
+            Result(user_name="Alice", score=10, total_questions=10, time_taken=90.25, timestamp="t3"),
+            Result(user_name="", score=7, total_questions=10, time_taken=150.0, timestamp="t4"),
+        ]
+    
+    def test_empty_stats(self):
+        """Test that statistics over no results are all zero"""
+        stats = ResultStats()
+        assert stats.count == 0
+        assert stats.mean_score == 0.0
+        assert stats.score_stddev == 0.0
+        assert stats.pass_rate == 0.0
+        assert stats.best_score("Alice") is None
+    
+    def test_means_and_pass_rate(self):
+        """Test average score, average time and pass rate"""
+        stats = ResultStats.from_results(self.results)
+        assert stats.count == 4
+        assert stats.mean_score == 7.5
+        assert stats.mean_time == pytest.approx((120.5 + 200.0 + 90.25 + 150.0) / 4)
+        # 8/10, 10/10 and 7/10 reach the default 70% pass mark
+        assert stats.pass_rate == 0.75
+    
+    def test_stddev_matches_direct_computation(self):
+        """Test that sum-of-squares standard deviation matches the definition"""
+        stats = ResultStats.from_results(self.results)
+        scores = [r.score for r in self.results]
+        mean = sum(scores) / len(scores)
+        expected = (sum((x - mean) ** 2 for x in scores) / len(scores)) ** 0.5
+        assert stats.score_stddev == pytest.approx(expected)
+    
+    def test_best_score_per_user(self):
+        """Test per-user best score, with anonymous attempts grouped together"""
+        stats = ResultStats.from_results(self.results)
+        assert stats.best_score("Alice") == 10
+        assert stats.best_score("Bob") == 5
+        assert stats.best_score(None) == 7
+    
+    def test_incremental_matches_recompute(self):
+        """Test that adding results one by one equals a full recompute"""
+        stats = ResultStats()
+        for r in self.results:
+            stats.add(r)
+        assert stats == ResultStats.from_results(self.results)
+    
+    def test_dict_round_trip(self):
+        """Test that to_dict()/from_dict() preserve every aggregate"""
+        stats = ResultStats.from_results(self.results, pass_mark=0.5)
+        assert ResultStats.from_dict(stats.to_dict()) == stats
+
+
+
+class TestQuestionStats:
+    """Test cases for per-question counters over the answers log"""
+    
+    def setup_method(self):
+        self.answers = [
+            Answer("Ann", "t1", "q1", 0, True, 2.0),
+            Answer("Bob", "t2", "q1", 1, False, 4.0),
+            Answer("Bob", "t2", "q2", None, False, 1.0),
+            Answer("Cy", "t3", "q1", 0, True, 3.0),
+        ]
+    
+    def test_counters(self):
+        """Test attempts, correct, skipped, option histogram and mean dwell"""
+        stats = question_stats_from_answers(self.answers)
+        q1 = stats["q1"]
+        assert (q1.attempts, q1.correct, q1.skipped) == (3, 2, 0)
+        assert q1.option_counts == {0: 2, 1: 1}
+        assert q1.p_correct == pytest.approx(2 / 3)
+        assert q1.mean_dwell == pytest.approx(3.0)
+        assert stats["q2"].skipped == 1
+    
+    def test_dict_round_trip(self):
+        """Test that from_dict(to_dict()) restores the counters (int option keys included)"""
+        q1 = question_stats_from_answers(self.answers)["q1"]
+        assert QuestionStats.from_dict(q1.to_dict()) == q1
+    
+    def test_difficulty_report_hardest_first(self):
+        """Test that the report puts the lowest p_correct first"""
+        report = difficulty_report(question_stats_from_answers(self.answers))
+        assert [qid for qid, _ in report] == ["q2", "q1"]
+        assert difficulty_report(question_stats_from_answers(self.answers), min_attempts=2)[0][0] == "q1"
+    
+    def test_repository_counters_follow_log(self, tmp_path):
+        """Test that a question whose id is literally "question_id" is counted, and a half-written row waits"""
+        repository = package_module("data.repository")
+        models = package_module("logic.models")
+        repo = repository.CSVRepository("", str(tmp_path / "results.csv"))
+        repo.append_answers([models.Answer("Ann", "t1", "question_id", 0, True, 2.0)])
+        assert repo.question_stats()["question_id"].attempts == 1
+        # Another process is halfway through writing a row with a multi-byte name
+        row = "Zoë,t2,q1,1,0,4.0,\n".encode("utf-8")
+        cut = row.index("ë".encode("utf-8")) + 1
+        with open(repo.answers_path, "ab") as f:
+            f.write(row[:cut])
+        assert "q1" not in repo.question_stats()
+        with open(repo.answers_path, "ab") as f:
+            f.write(row[cut:])
+        assert repo.question_stats()["q1"].attempts == 1
+        recomputed = package_module("logic.stats").question_stats_from_answers(repo.iter_answers())
+        assert repo.question_stats() == recomputed
+        assert repository.CSVRepository("", repo.results_path).question_stats() == recomputed
+
+    def test_replaced_larger_log_is_rebuilt(self, tmp_path):
+        """Test that a different, larger answers log at the same path is not resumed from the old offset"""
+        repository = package_module("data.repository")
+        models = package_module("logic.models")
+        repo = repository.CSVRepository("", str(tmp_path / "results.csv"))
+        repo.append_answers([models.Answer("Ann", "t1", "q1", 0, True, 2.0) for _ in range(5)])
+        assert repo.question_stats()["q1"].attempts == 5
+        other = repository.CSVRepository("", str(tmp_path / "other.csv"))
+        other.append_answers([models.Answer("Bob", "t2", "q2", 1, False, 1.0) for _ in range(20)])
+        os.replace(other.answers_path, repo.answers_path)
+        recomputed = package_module("logic.stats").question_stats_from_answers(repo.iter_answers())
+        assert {qid: s.attempts for qid, s in repo.question_stats().items()} == {"q2": 20}
+        assert repo.question_stats() == recomputed
+        assert repository.CSVRepository("", repo.results_path).question_stats() == recomputed
+
+    def test_append_does_not_rewrite_sidecar_every_time(self, tmp_path):
+        """Test that the O(questions) sidecar write is amortized over many finished quizzes"""
+        repository = package_module("data.repository")
+        models = package_module("logic.models")
+        repo = repository.CSVRepository("", str(tmp_path / "results.csv"))
+        repo.append_answers([models.Answer("Ann", "t1", "q1", 0, True, 2.0)])
+        repo.question_stats()
+        before = os.stat(repo.question_stats_path).st_mtime_ns if os.path.exists(repo.question_stats_path) else None
+        for i in range(10):
+            repo.append_answers([models.Answer("Bob", f"t{i}", f"q{i % 3}", 1, False, 1.0)])
+        after = os.stat(repo.question_stats_path).st_mtime_ns if os.path.exists(repo.question_stats_path) else None
+        assert before == after
+        recomputed = package_module("logic.stats").question_stats_from_answers(repo.iter_answers())
+        assert repo.question_stats() == recomputed
+        assert repository.CSVRepository("", repo.results_path).question_stats() == recomputed
+
+
+
+class TestResultStatsSidecar:
+    """Test that CSVRepository.result_stats() always matches a full recompute"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.repository = package_module("data.repository")
+        self.models = package_module("logic.models")
+        self.stats = package_module("logic.stats")
+        self.tmp_path = tmp_path
+        self.path = str(tmp_path / "results.csv")
+    
+    def result(self, i):
+        return self.models.Result(f"user{i % 7}", i % 11, 10, float(i % 90), f"2024-01-{1 + i % 28:02d}T12:00:00Z")
+    
+    def write_file(self, path, results):
+        """Write a complete results CSV, bypassing the repository"""
+        repo = self.repository.CSVRepository("", path)
+        with repo.result_writer() as writer:
+            writer.write_many(results)
+    
+    def assert_matches_recompute(self, repo):
+        recomputed = self.stats.ResultStats.from_results(repo.load_results())
+        assert repo.result_stats().to_dict() == recomputed.to_dict()
+        # A new repository (e.g. another process) resumes from the sidecar
+        fresh = self.repository.CSVRepository("", self.path)
+        assert fresh.result_stats().to_dict() == recomputed.to_dict()
+    
+    def test_appends_match_recompute(self):
+        """Test that stats stay exact across many appends and sidecar checkpoints"""
+        repo = self.repository.CSVRepository("", self.path)
+        for i in range(150):
+            repo.append_result(self.result(i))
+            if i in (0, 3, 70, 149):
+                self.assert_matches_recompute(repo)
+        repo.append_results(self.result(i) for i in range(150, 400))
+        self.assert_matches_recompute(repo)
+    
+    def test_truncated_file_is_rebuilt(self):
+        """Test that a file cut back to fewer rows is recomputed from scratch"""
+        repo = self.repository.CSVRepository("", self.path)
+        repo.append_results(self.result(i) for i in range(100))
+        repo.result_stats()
+        self.write_file(self.path + ".new", [self.result(i) for i in range(5)])
+        with open(self.path + ".new", "rb") as src, open(self.path, "r+b") as dst:
+            data = src.read()
+            dst.write(data)
+            dst.truncate(len(data))
+        self.assert_matches_recompute(repo)
+    
+    def test_replaced_larger_file_is_rebuilt(self):
+        """Test that a different, larger file at the same path is not resumed from the old offset"""
+        repo = self.repository.CSVRepository("", self.path)
+        repo.append_results(self.result(i) for i in range(100))
+        repo.result_stats()
+        other = str(self.tmp_path / "other.csv")
+        self.write_file(other, [self.result(i * 3 + 1) for i in range(300)])
+        os.replace(other, self.path)
+        self.assert_matches_recompute(repo)
+    
+    def test_rewritten_in_place_is_rebuilt(self):
+        """Test that the same inode rewritten with new content is detected"""
+        repo = self.repository.CSVRepository("", self.path)
+        repo.append_results(self.result(i) for i in range(100))
+        repo.result_stats()
+        self.write_file(self.path + ".new", [self.result(i + 5) for i in range(300)])
+        with open(self.path + ".new", "rb") as src, open(self.path, "wb") as dst:
+            dst.write(src.read())
+        self.assert_matches_recompute(repo)
+    
+    def test_append_does_not_rewrite_sidecar_every_time(self):
+        """Test that the O(users) sidecar write is amortized over many appends"""
+        repo = self.repository.CSVRepository("", self.path)
+        repo.append_result(self.result(0))
+        repo.result_stats()
+        before = os.stat(repo.stats_path).st_mtime_ns if os.path.exists(repo.stats_path) else None
+        for i in range(1, 10):
+            repo.append_result(self.result(i))
+        after = os.stat(repo.stats_path).st_mtime_ns if os.path.exists(repo.stats_path) else None
+        assert before == after
+        self.assert_matches_recompute(repo)
+
+
+
+class TestPagedResults:
+    """Test CSVRepository.iter_results() windows and count_results() through the row index"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        self.repository = package_module("data.repository")
+        self.models = package_module("logic.models")
+        # A small stride so a few dozen rows span many index blocks
+        monkeypatch.setattr(self.repository, "_ROW_INDEX_STRIDE", 4)
+        self.tmp_path = tmp_path
+        self.path = str(tmp_path / "results.csv")
+        self.repo = self.repository.CSVRepository("", self.path)
+    
+    def result(self, i):
+        return self.models.Result(f"user{i}", i % 11, 10, float(i), "2024-01-01T12:00:00Z")
+    
+    def names(self, results):
+        return [r.user_name for r in results]
+    
+    def assert_pages_match(self, repo, page):
+        everything = repo.load_results()
+        assert repo.count_results() == len(everything)
+        for start in range(0, len(everything) + page, page):
+            assert list(repo.iter_results(offset=start, limit=page)) == everything[start:start + page]
+    
+    def test_pages_match_full_load(self):
+        """Test that every window, across index blocks, equals the same slice of load_results()"""
+        self.repo.append_results(self.result(i) for i in range(37))
+        for page in (1, 3, 4, 10):
+            self.assert_pages_match(self.repo, page)
+        assert list(self.repo.iter_results(offset=30)) == self.repo.load_results()[30:]
+    
+    def test_index_follows_appends_and_resumes(self):
+        """Test that appended rows are indexed and a new repository resumes from the sidecar"""
+        self.repo.append_results(self.result(i) for i in range(10))
+        assert self.repo.count_results() == 10
+        self.repo.append_results(self.result(i) for i in range(10, 25))
+        self.assert_pages_match(self.repo, 4)
+        fresh = self.repository.CSVRepository("", self.path)
+        self.assert_pages_match(fresh, 3)
+    
+    def test_malformed_rows_do_not_shift_positions(self):
+        """Test that malformed rows are neither counted nor used up by offsets"""
+        with open(self.path, "w", newline="", encoding="utf-8") as f:
+            f.write("user_name,score,total_questions,time_taken,timestamp\n")
+            for i in range(20):
+                f.write(f"user{i},{i % 11},10,{float(i)},2024-01-01T12:00:00Z\n")
+                if i % 3 == 0:
+                    f.write("broken,not-a-number,10,1.0,2024-01-01T12:00:00Z\n\n")
+        assert self.repo.count_results() == 20
+        assert [r.user_name for r in self.repo.iter_results(offset=9, limit=2)] == ["user9", "user10"]
+        self.assert_pages_match(self.repo, 4)
+    
+    def test_partial_rows_are_left_for_later(self):
+        """Test that a row still being written, even inside a quoted field, is not indexed"""
+        self.repo.append_results(self.result(i) for i in range(6))
+        with open(self.path, "a", newline="", encoding="utf-8") as f:
+            f.write('"multi\nline",3,10,4.0,2024-01-01T12:00:00Z\n"still open\n')
+        assert self.repo.count_results() == 7
+        assert list(self.repo.iter_results(offset=6))[0].user_name == "multi\nline"
+        with open(self.path, "a", newline="", encoding="utf-8") as f:
+            f.write('writing",5,10,6.0,2024-01-01T12:00:00Z\n')
+        assert self.repo.count_results() == 8
+        assert list(self.repo.iter_results(offset=7))[0].user_name == "still open\nwriting"
+    
+    def test_last_row_without_newline(self):
+        """Test that a file whose last row has no newline reads that row, like csv.DictReader does"""
+        with open(self.path, "w", newline="", encoding="utf-8") as f:
+            f.write("user_name,score,total_questions,time_taken,timestamp\n"
+                    "user0,1,10,1.0,2024-01-01T12:00:00Z\n"
+                    "user1,2,10,2.0,2024-01-01T12:00:00Z")
+        assert self.names(self.repo.load_results()) == ["user0", "user1"]
+        assert self.repo.count_results() == 2
+        assert self.names(self.repo.iter_results(offset=1)) == ["user1"]
+        assert self.repo.result_stats().count == 2
+        assert self.repository.CSVRepository("", self.path).count_results() == 2
+        # Once the row is finished it is indexed and folded in like any other
+        with open(self.path, "a", newline="", encoding="utf-8") as f:
+            f.write("\nuser2,3,10,3.0,2024-01-01T12:00:00Z\n")
+        assert self.repo.count_results() == 3
+        assert self.names(self.repo.iter_results(offset=2)) == ["user2"]
+        assert self.repo.result_stats().count == 3
+    
+    def test_replaced_file_is_reindexed(self):
+        """Test that a different, larger file at the same path is indexed from the start"""
+        self.repo.append_results(self.result(i) for i in range(10))
+        assert self.repo.count_results() == 10
+        other = self.repository.CSVRepository("", str(self.tmp_path / "other.csv"))
+        other.append_results(self.result(i * 7) for i in range(30))
+        os.replace(other.results_path, self.path)
+        self.assert_pages_match(self.repo, 4)
+        assert next(self.repo.iter_results(offset=5)).user_name == "user35"
+
+
+
+# QUESTION INDEX TESTS
+
+
+class TestQuestionIndex:
+    """Test cases for QuestionIndex duplicate policies and lookup by id"""
+    
+    @staticmethod
+    def make(qid, text, correct_index=0):
+        return Question(id=qid, text=text, options=["A", "B"], correct_index=correct_index)
+    
+    def setup_method(self):
+        self.bank = [
+            self.make("q1", "What is 2+2?"),
+            self.make("q2", "Capital of France?"),
+            self.make("q1", "Another question?", 1),
+            self.make("q3", "  what is 2 + 2 "),
+        ]
+    
+    def test_normalize_text(self):
+        """Test that case, accents, punctuation and spacing are ignored"""
+        assert normalize_text("  Café,  au LAIT?") == normalize_text("cafe au lait")
+        assert normalize_text("What is 2+2?") == "what is 2 2"
+    
+    def test_first_wins(self):
+        """Test that later duplicates by id or text are dropped"""
+        index = QuestionIndex(self.bank)
+        assert [q.id for q in index] == ["q1", "q2"]
+        assert index["q1"].text == "What is 2+2?"
+        assert [(d.kind, d.dropped.id) for d in index.duplicates] == [("id", "q1"), ("text", "q3")]
+    
+    def test_last_wins_keeps_position_of_first(self):
+        """Test that the latest copy replaces the earliest, in its place"""
+        index = QuestionIndex(self.bank, policy="last-wins")
+        # The second q1 replaced the first, so q3's text no longer clashes
+        assert [q.id for q in index] == ["q1", "q2", "q3"]
+        assert index["q1"].text == "Another question?"
+        index = QuestionIndex([self.bank[0], self.bank[1], self.bank[3]], policy="last-wins")
+        assert [q.id for q in index] == ["q3", "q2"]
+        assert "q1" not in index
+    
+    def test_reject_lists_every_duplicate(self):
+        """Test that the reject policy raises with all duplicates"""
+        with pytest.raises(DuplicateQuestionError) as info:
+            QuestionIndex(self.bank, policy="reject")
+        assert len(info.value.duplicates) == 2
+        assert QuestionIndex(self.bank[:2], policy="reject").questions == self.bank[:2]
+    
+    def test_id_only_matching(self):
+        """Test that match_text=False only treats equal ids as duplicates"""
+        index = QuestionIndex(self.bank, match_text=False)
+        assert [q.id for q in index] == ["q1", "q2", "q3"]
+    
+    def test_lookup_missing_id(self):
+        """Test that unknown ids give None from get() and KeyError from []"""
+        index = QuestionIndex(self.bank)
+        assert index.get("nope") is None
+        with pytest.raises(KeyError):
+            index["nope"]
+    
+    def test_unknown_policy(self):
+        """Test that an unknown policy is a ValueError"""
+        with pytest.raises(ValueError):
+            QuestionIndex(self.bank, policy="newest")
+
+    def test_category_and_difficulty_filters(self):
+        """Test that the inverted index matches category and difficulty case-insensitively"""
+        bank = [
+            Question(id=f"q{i}", text=f"Question {i}?", options=["A", "B"], correct_index=0,
+                     category=["Ethics", "Security"][i % 2], difficulty=["easy", "hard"][i % 3 == 0])
+            for i in range(12)
+        ]
+        index = QuestionIndex(bank)
+        assert index.categories() == ["Ethics", "Security"]
+        assert index.count() == 12
+        assert index.count(category="ethics") == 6
+        assert [q.id for q in index.matching(category=" ETHICS", difficulty="hard")] == ["q0", "q6"]
+        assert index.count(category="Unknown") == 0
+    
+    def test_quiz_from_index(self):
+        """Test that a filtered quiz only has matching questions and is reproducible by seed"""
+        bank = [
+            Question(id=f"q{i}", text=f"Question {i}?", options=["A", "B"], correct_index=0,
+                     category="Ethics" if i % 2 else "Security", difficulty="easy")
+            for i in range(100)
+        ]
+        index = QuestionIndex(bank)
+        quiz = Quiz.from_index(index, 5, category="Ethics", difficulty="easy", seed=3)
+        assert len(quiz.questions) == 5
+        assert all(q.category == "Ethics" for q in quiz.questions)
+        assert quiz.questions == Quiz.from_index(index, 5, category="Ethics", difficulty="easy", seed=3).questions
+        assert len(Quiz.from_index(index, 500, category="Security").questions) == 50
+
+
+
+# SAMPLING TESTS
+
+
+class TestReservoirSample:
+    """Test cases for reservoir_sample() and Quiz.from_stream()"""
+    
+    def test_returns_k_items(self):
+        """Test that exactly k distinct items are picked from a larger stream"""
+        sample = reservoir_sample(iter(range(1000)), 10)
+        assert len(sample) == 10
+        assert len(set(sample)) == 10
+        assert all(0 <= x < 1000 for x in sample)
+    
+    def test_short_stream_returns_everything_in_order(self):
+        """Test that a stream shorter than k is returned unchanged"""
+        assert reservoir_sample(iter([1, 2, 3]), 5) == [1, 2, 3]
+    
+    def test_zero_k_returns_empty(self):
+        """Test that k=0 picks nothing"""
+        assert reservoir_sample(iter(range(10)), 0) == []
+    
+    def test_same_seed_same_sample(self):
+        """Test that a seeded generator makes the sample reproducible"""
+        a = reservoir_sample(range(10000), 5, random.Random(42))
+        b = reservoir_sample(range(10000), 5, random.Random(42))
+        assert a == b
+    
+    def test_every_item_can_be_picked(self):
+        """Test that late items are not starved (sample is roughly uniform)"""
+        rng = random.Random(0)
+        counts = [0] * 10
+        for _ in range(2000):
+            for x in reservoir_sample(range(10), 3, rng):
+                counts[x] += 1
+        # Each item is expected 600 times (2000 * 3 / 10)
+        assert all(450 < c < 750 for c in counts)
+    
+    def test_quiz_from_stream(self):
+        """Test that Quiz.from_stream builds a quiz of k questions from a generator"""
+        bank = (
+            Question(id=f"q{i}", text=f"Question {i}?", options=["A", "B"], correct_index=0)
+            for i in range(500)
+        )
+        quiz = Quiz.from_stream(bank, k=4, seed=1)
+        assert len(quiz.questions) == 4
+        assert len(quiz.user_answers) == 4
+        quiz.start()
+        assert quiz.get_current_question().id.startswith("q")
+
+
+
+# SESSION TESTS
+
+
+class MemoryRepository:
+    """In-memory stand-in for CSVRepository used by session tests"""
+    
+    def __init__(self, questions, fail_saves=False):
+        self.questions = questions
+        self.saved = []
+        self.answers = []
+        self.fail_saves = fail_saves
+    
+    def load_questions(self):
+        return list(self.questions)
+    
+    def append_result(self, r):
+        if self.fail_saves:
+            raise OSError("disk full")
+        self.saved.append(r)
+    
+    def append_answers(self, answers):
+        if self.fail_saves:
+            raise OSError("disk full")
+        self.answers.extend(answers)
+
+
+class TestQuizSession:
+    """Test cases for the headless QuizSession controller"""
+    
+    def setup_method(self):
+        """Create sample questions for each test"""
+        self.questions = [
+            Question(id="q001", text="First?", options=["A", "B"], correct_index=0),
+            Question(id="q002", text="Second?", options=["A", "B", "C"], correct_index=2),
+        ]
+    
+    def test_full_session_saves_and_shows_result(self):
+        """Test start → submit → next through every question, then finish"""
+        repo = MemoryRepository(self.questions)
+        ui = HeadlessFrontEnd()
+        session = QuizSession(repo, ui)
+        
+        assert session.start("  Alice ") is True
+        assert ui.questions_shown == 1
+        session.submit(0)
+        session.next()
+        session.submit(1)
+        session.next()
+        
+        assert session.finished
+        assert ui.feedback_shown == 2
+        assert ui.correct == 1
+        assert ui.last_result.user_name == "Alice"
+        assert ui.last_result.score == 1
+        assert repo.saved == [ui.last_result]
+        assert [(a.question_id, a.selected_index) for a in repo.answers] == [("q001", 0), ("q002", 1)]
+    
+    def test_shuffled_session_replays_from_seed(self):
+        """Test that a shuffled session can be replayed exactly from its seed"""
+        repo = MemoryRepository(self.questions)
+        session = QuizSession(repo, HeadlessFrontEnd(), shuffle=True, quiz_size=1)
+        result = run_scripted_session(session, "Bob", lambda q: q.correct_index)
+        assert result.score == 1 and result.total_questions == 1
+        seed = repo.answers[0].seed
+        first = session.quiz
+        session.start("Bob", seed=seed)
+        assert session.quiz.questions == first.questions
+        assert session.quiz.option_order(0) == first.option_order(0)
+    
+    def test_no_questions_warns(self):
+        """Test that an empty bank shows a warning and doesn't start"""
+        ui = HeadlessFrontEnd()
+        session = QuizSession(MemoryRepository([]), ui)
+        assert session.start("Bob") is False
+        assert ui.messages[0][0] == "warning"
+        assert ui.questions_shown == 0
+    
+    def test_failed_save_still_shows_result(self):
+        """Test that a save error is reported but the result is still shown"""
+        ui = HeadlessFrontEnd()
+        session = QuizSession(MemoryRepository(self.questions, fail_saves=True), ui)
+        result = run_scripted_session(session, "Carol", lambda q: q.correct_index)
+        assert result.score == 2
+        assert ui.last_result is result
+        assert ui.messages[0][:2] == ("error", "Save failed")
+    
+    def test_scripted_session(self):
+        """Test run_scripted_session answers every question"""
+        ui = HeadlessFrontEnd()
+        session = QuizSession(MemoryRepository(self.questions), ui)
+        result = run_scripted_session(session, "Dan", lambda q: 0)
+        assert result.score == 1
+        assert result.total_questions == 2
+        assert ui.questions_shown == 2
+
+
+
+# BACKGROUND WRITER TESTS
+
+
+class TestBackgroundWriter:
+    """Test cases for BackgroundWriter retries and completion callbacks"""
+    
+    def test_writes_and_reports_success(self):
+        """Test that items are written and on_done gets None after flush()"""
+        written, done = [], []
+        writer = BackgroundWriter(written.append)
+        writer.submit("a", on_done=done.append)
+        writer.submit("b", on_done=done.append)
+        writer.close()
+        assert written == ["a", "b"]
+        assert done == [None, None]
+    
+    def test_callbacks_wait_for_dispatch(self):
+        """Test that callbacks run on the thread calling dispatch_completions()"""
+        done = []
+        writer = BackgroundWriter(lambda item: None)
+        writer.submit("a", on_done=done.append)
+        writer._jobs.join()
+        assert done == []
+        assert writer.dispatch_completions() == 1
+        assert done == [None]
+        writer.close()
+    
+    def test_retries_until_success(self):
+        """Test that a failing write is retried with backoff"""
+        attempts = []
+        
+        def flaky(item):
+            attempts.append(item)
+            if len(attempts) < 3:
+                raise OSError("busy")
+        
+        done = []
+        writer = BackgroundWriter(flaky, retries=3, backoff=0.001)
+        writer.submit("a", on_done=done.append)
+        writer.close()
+        assert len(attempts) == 3
+        assert done == [None]
+    
+    def test_gives_up_after_retries(self):
+        """Test that the last error is reported once retries run out"""
+        def always_fails(item):
+            raise OSError("read-only")
+        
+        done = []
+        writer = BackgroundWriter(always_fails, retries=2, backoff=0.001)
+        writer.submit("a", on_done=done.append)
+        writer.close()
+        assert isinstance(done[0], OSError)
+    
+    def test_submit_after_close_fails(self):
+        """Test that a closed writer rejects new items"""
+        writer = BackgroundWriter(lambda item: None)
+        writer.close()
+        with pytest.raises(RuntimeError):
+            writer.submit("a")
+    
+    def test_session_with_writer_saves_in_background(self):
+        """Test that QuizSession saves through the writer and reports failures"""
+        questions = [Question(id="q1", text="Q?", options=["A", "B"], correct_index=1)]
+        repo = MemoryRepository(questions, fail_saves=True)
+        writer = BackgroundWriter(repo.append_result, retries=1, backoff=0.001)
+        ui = HeadlessFrontEnd()
+        session = QuizSession(repo, ui, writer=writer)
+        
+        result = run_scripted_session(session, "Eve", lambda q: 1)
+        assert ui.last_result is result
+        writer.close()
+        # Result and answers both failed, but the user is told only once
+        assert ui.messages == [("error", "Save failed", "Could not save results: disk full")]
+    
+    def test_per_item_write_function(self):
+        """Test that submit(write=...) overrides the writer function for one item"""
+        results, answers = [], []
+        writer = BackgroundWriter(results.append)
+        writer.submit("result")
+        writer.submit(["a1", "a2"], write=answers.extend)
+        writer.close()
+        assert results == ["result"]
+        assert answers == ["a1", "a2"]
+
+
+# CSV REPOSITORY TESTS
+
+
+class TestQuestionCache:
+    """Test the process-wide question cache behind CSVRepository.load_questions()"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.repository = package_module("data.repository")
+        self.repository.clear_question_cache()
+        self.path = tmp_path / "questions.csv"
+        self.write_bank(["q1", "q2"])
+        yield
+        self.repository.clear_question_cache()
+    
+    def write_bank(self, ids):
+        lines = ["id,text,choices,correct_index"] + [f"{qid},Question {qid}?,A||B,0" for qid in ids]
+        self.path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    
+    def load(self):
+        return self.repository.CSVRepository(str(self.path), "").load_questions()
+    
+    def test_hits_and_misses(self):
+        """Test that a second repository on the same unchanged file reuses the parsed bank"""
+        first = self.load()
+        second = self.load()
+        assert [q.id for q in second] == ["q1", "q2"]
+        assert second == first and second is not first
+        assert self.repository.question_cache_info() == {"hits": 1, "misses": 1, "entries": 1}
+    
+    def test_changed_size_invalidates(self):
+        """Test that a file with different content is parsed again"""
+        self.load()
+        self.write_bank(["q1", "q2", "q3"])
+        assert [q.id for q in self.load()] == ["q1", "q2", "q3"]
+        assert self.repository.question_cache_info()["misses"] == 2
+    
+    def test_changed_mtime_invalidates(self):
+        """Test that a rewrite of the same size is caught by the modification time"""
+        self.load()
+        st = os.stat(self.path)
+        self.write_bank(["q8", "q9"])
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert os.path.getsize(self.path) == st.st_size
+        assert [q.id for q in self.load()] == ["q8", "q9"]
+        assert self.repository.question_cache_info() == {"hits": 0, "misses": 2, "entries": 1}
+    
+    def test_callers_cannot_change_the_cache(self):
+        """Test that changing a returned list leaves the cached bank alone"""
+        self.load().clear()
+        assert len(self.load()) == 2
+
+
+class TestResultWriter:
+    """Test the buffered ResultWriter and CSVRepository.append_results()"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.repository = package_module("data.repository")
+        self.models = package_module("logic.models")
+        self.path = str(tmp_path / "results.csv")
+    
+    def result(self, i):
+        return self.models.Result(f"user{i}", i, 10, float(i), "2024-01-01T12:00:00Z")
+    
+    def lines(self):
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, encoding="utf-8") as f:
+            return f.read().splitlines()
+    
+    def test_header_written_once(self):
+        """Test that later sessions on the same file don't repeat the header"""
+        for i in range(3):
+            with self.repository.ResultWriter(self.path) as writer:
+                writer.write(self.result(i))
+        lines = self.lines()
+        assert lines[0] == ",".join(self.repository.RESULT_FIELDS)
+        assert len(lines) == 4
+        assert lines.count(lines[0]) == 1
+    
+    def test_flush_on_size(self):
+        """Test that rows stay buffered until buffer_size of them are waiting"""
+        writer = self.repository.ResultWriter(self.path, buffer_size=3, flush_interval=3600)
+        writer.write(self.result(0))
+        writer.write(self.result(1))
+        assert len(self.lines()) == 0
+        writer.write(self.result(2))
+        assert len(self.lines()) == 4
+        writer.close()
+    
+    def test_flush_on_time(self, monkeypatch):
+        """Test that a write after flush_interval seconds flushes the buffer"""
+        now = [100.0]
+        monkeypatch.setattr(self.repository.time, "monotonic", lambda: now[0])
+        writer = self.repository.ResultWriter(self.path, buffer_size=100, flush_interval=1.0)
+        writer.write(self.result(0))
+        assert len(self.lines()) == 0
+        now[0] += 1.5
+        writer.write(self.result(1))
+        assert len(self.lines()) == 3
+        writer.close()
+    
+    def test_flush_on_close(self):
+        """Test that close() writes what is buffered and is safe to call twice"""
+        writer = self.repository.ResultWriter(self.path, buffer_size=100, flush_interval=3600)
+        writer.write_many(self.result(i) for i in range(5))
+        assert len(self.lines()) == 0
+        writer.close()
+        writer.close()
+        assert len(self.lines()) == 6
+    
+    def test_append_results(self):
+        """Test that the bulk API saves every result in order and keeps the stats up to date"""
+        repo = self.repository.CSVRepository("", self.path)
+        results = [self.result(i) for i in range(1200)]
+        assert repo.append_results(iter(results)) == 1200
+        repo.append_result(self.result(1200))
+        assert repo.load_results() == results + [self.result(1200)]
+        assert repo.result_stats().count == 1201
+
+
+class TestWriteLocking:
+    """Test that lock_writes coordinates result writes through data.locking.file_lock"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.repository = package_module("data.repository")
+        self.locking = package_module("data.locking")
+        self.models = package_module("logic.models")
+        self.path = str(tmp_path / "results.csv")
+    
+    def result(self, i):
+        return self.models.Result(f"user{i}", i, 10, float(i), "2024-01-01T12:00:00Z")
+    
+    def test_flush_waits_for_the_lock(self):
+        """Test that a locked writer can't write while another holder has the lock"""
+        repo = self.repository.CSVRepository("", self.path, lock_writes=True)
+        saved = threading.Event()
+        
+        def save():
+            repo.append_result(self.result(1))
+            saved.set()
+        
+        with self.locking.file_lock(self.path):
+            thread = threading.Thread(target=save)
+            thread.start()
+            assert not saved.wait(0.3)
+            assert not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        thread.join(5)
+        assert saved.is_set()
+        assert repo.load_results() == [self.result(1)]
+    
+    def test_unlocked_writer_does_not_take_the_lock(self):
+        """Test that lock_writes=False (a single process) never touches the lock file"""
+        repo = self.repository.CSVRepository("", self.path)
+        repo.append_result(self.result(1))
+        assert not os.path.exists(self.path + ".lock")
+    
+    def test_concurrent_processes_keep_the_file_intact(self):
+        """Test that several writer processes produce one header and every row"""
+        result = package_module("benchmarks.concurrent_appends").run(writers=3, appends=40)
+        assert result["appends"] == 120
+        assert result["intact"]
+
+
+# COMPILED QUESTION BANK TESTS
+
+
+class TestCompiledBank:
+    """Test cases for compiling a questions CSV and loading it back through CompiledRepository"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.compiled = package_module("data.compiled_bank")
+        self.repository = package_module("data.repository")
+        self.models = package_module("logic.models")
+        self.compiled.clear_bank_cache()
+        self.csv_path = str(tmp_path / "questions.csv")
+        self.bank_path = str(tmp_path / "questions.qbank")
+        self.write_csv(3)
+        yield
+        self.compiled.clear_bank_cache()
+    
+    def write_csv(self, n):
+        lines = ["id,text,choices,correct_index,category,difficulty"]
+        lines += [f"q{i},Question {i} ☃?,A{i}||B{i}||C{i},{i % 3},Ethics,easy" for i in range(n)]
+        lines.append("bad,Only one choice,A,0,,")
+        with open(self.csv_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+    
+    def test_round_trip(self):
+        """Test that the compiled bank holds the same questions the CSV loads to"""
+        assert self.compiled.compile_questions(self.csv_path, self.bank_path) == 3
+        bank = self.compiled.CompiledRepository(self.bank_path, "").load_questions()
+        expected = self.repository.CSVRepository(self.csv_path, "")._read_questions()
+        assert list(bank) == expected
+        assert bank[-1] is bank[2]
+        assert bank.correct_index(1) == 1
+    
+    def test_version_1_bank(self):
+        """Test that a bank written before category and difficulty were stored still loads"""
+        c = self.compiled
+        questions = self.repository.CSVRepository(self.csv_path, "")._read_questions()
+        entries, strings = bytearray(), bytearray()
+        for q in questions:
+            entries += c.ENTRY.pack(len(strings), len(q.options), q.correct_index)
+            for text in (q.id, q.text, *q.options):
+                data = text.encode("utf-8")
+                strings += c.LENGTH.pack(len(data)) + data
+        with open(self.bank_path, "wb") as f:
+            f.write(c.HEADER.pack(c.MAGIC, 1, len(questions)) + entries + strings)
+        bank = c.CompiledRepository(self.bank_path, "").load_questions()
+        assert [(q.id, q.text, q.options, q.correct_index) for q in bank] == \
+            [(q.id, q.text, q.options, q.correct_index) for q in questions]
+        assert all(q.category == "" and q.difficulty == "" for q in bank)
+    
+    def test_bank_is_cached_until_the_file_changes(self):
+        """Test that quiz starts share one mapping and a recompile maps the new file"""
+        self.compiled.compile_questions(self.csv_path, self.bank_path)
+        first = self.compiled.CompiledRepository(self.bank_path, "").load_questions()
+        assert self.compiled.CompiledRepository(self.bank_path, "").load_questions() is first
+        self.write_csv(5)
+        self.compiled.compile_questions(self.csv_path, self.bank_path)
+        second = self.compiled.CompiledRepository(self.bank_path, "").load_questions()
+        assert second is not first and len(second) == 5
+        assert self.compiled.bank_cache_info() == {"hits": 1, "misses": 2, "entries": 1}
+        # Once nothing holds the old bank any more, its mapping is released
+        released = weakref.ref(first)
+        del first
+        gc.collect()
+        assert released() is None
+    
+    def test_recompile_does_not_break_a_running_quiz(self):
+        """Test that a quiz still reading the old bank keeps working after a recompile"""
+        self.compiled.compile_questions(self.csv_path, self.bank_path)
+        quiz = Quiz(self.compiled.CompiledRepository(self.bank_path, "").load_questions())
+        quiz.start()
+        self.write_csv(5)
+        self.compiled.compile_questions(self.csv_path, self.bank_path)
+        assert len(self.compiled.CompiledRepository(self.bank_path, "").load_questions()) == 5
+        for i in range(3):
+            quiz.submit_answer(quiz.get_current_question().correct_index)
+            quiz.next_question()
+        assert quiz.calculate_score() == 3
+        assert [q.id for q in quiz.questions] == ["q0", "q1", "q2"]
+    
+    def test_missing_or_invalid_bank(self):
+        """Test that a missing file or a file that isn't a bank loads as no questions"""
+        repo = self.compiled.CompiledRepository(self.bank_path, "")
+        assert repo.load_questions() == []
+        with open(self.bank_path, "wb") as f:
+            f.write(b"not a bank")
+        assert repo.load_questions() == []
+        assert self.compiled.bank_cache_info()["entries"] == 0
+
+
+# TAIL READER AND BULK IMPORT TESTS
+
+
+class TestResultsTailReader:
+    """Test cases for following the results CSV with ResultsTailReader"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.tail = package_module("data.tail")
+        self.repository = package_module("data.repository")
+        self.models = package_module("logic.models")
+        self.tmp_path = tmp_path
+        self.path = str(tmp_path / "results.csv")
+        self.repo = self.repository.CSVRepository("", self.path)
+    
+    def result(self, i):
+        return self.models.Result(f"user{i}", i, 10, float(i), "2024-01-01T12:00:00Z")
+    
+    def names(self, results):
+        return [r.user_name for r in results]
+    
+    def test_only_new_rows(self):
+        """Test that each poll returns just the rows appended since the last one"""
+        reader = self.tail.ResultsTailReader(self.path)
+        assert reader.poll() == []
+        self.repo.append_results(self.result(i) for i in range(3))
+        assert reader.poll() == [self.result(i) for i in range(3)]
+        assert reader.poll() == []
+        self.repo.append_result(self.result(3))
+        assert reader.poll() == [self.result(3)]
+    
+    def test_partial_trailing_row(self):
+        """Test that a row without its newline yet is returned once it is complete"""
+        self.repo.append_result(self.result(0))
+        reader = self.tail.ResultsTailReader(self.path)
+        assert self.names(reader.poll()) == ["user0"]
+        with open(self.path, "a", encoding="utf-8", newline="") as f:
+            f.write("user1,1,10,")
+        assert reader.poll() == []
+        with open(self.path, "a", encoding="utf-8", newline="") as f:
+            f.write("1.0,2024-01-01T12:00:00Z\r\n")
+        assert self.names(reader.poll()) == ["user1"]
+    
+    def test_truncation_starts_over(self):
+        """Test that a file cut back below the offset is read again from the start"""
+        self.repo.append_results(self.result(i) for i in range(5))
+        reader = self.tail.ResultsTailReader(self.path)
+        reader.poll()
+        with open(self.path, "r+b") as f:
+            f.truncate(0)
+        self.repo.append_result(self.result(9))
+        assert self.names(reader.poll()) == ["user9"]
+    
+    def test_rotation_starts_over(self):
+        """Test that a new file moved into place is read from its beginning, even if it is larger"""
+        self.repo.append_results(self.result(i) for i in range(2))
+        reader = self.tail.ResultsTailReader(self.path)
+        reader.poll()
+        os.replace(self.path, str(self.tmp_path / "results.old.csv"))
+        self.repository.CSVRepository("", self.path).append_results(self.result(i) for i in range(10, 15))
+        assert self.names(reader.poll()) == [f"user{i}" for i in range(10, 15)]
+    
+    def test_from_end(self):
+        """Test that from_end skips the existing rows and reports later ones"""
+        self.repo.append_results(self.result(i) for i in range(4))
+        reader = self.tail.ResultsTailReader(self.path, from_end=True)
+        assert reader.poll() == []
+        self.repo.append_result(self.result(4))
+        assert self.names(reader.poll()) == ["user4"]
+
+    def test_from_end_only_reads_the_tail(self, monkeypatch):
+        """Test that from_end looks back in chunks for the last newline, keeping a half-written row"""
+        monkeypatch.setattr(self.tail, "_SCAN_CHUNK", 5)
+        self.repo.append_results(self.result(i) for i in range(50))
+        with open(self.path, "a", encoding="utf-8", newline="") as f:
+            f.write("user50,50,10,")
+        reader = self.tail.ResultsTailReader(self.path, from_end=True)
+        assert reader.poll() == []
+        assert reader.offset == os.path.getsize(self.path) - len("user50,50,10,")
+        with open(self.path, "a", encoding="utf-8", newline="") as f:
+            f.write("50.0,2024-01-01T12:00:00Z\r\n")
+        assert self.names(reader.poll()) == ["user50"]
+
+    def test_quoted_newline_waits_for_the_whole_row(self):
+        """Test that a newline inside an unclosed quoted field doesn't end the row"""
+        self.repo.append_result(self.result(0))
+        reader = self.tail.ResultsTailReader(self.path)
+        reader.poll()
+        with open(self.path, "a", encoding="utf-8", newline="") as f:
+            f.write('"Ann\n')
+        assert reader.poll() == []
+        with open(self.path, "a", encoding="utf-8", newline="") as f:
+            f.write('Lee",1,10,1.0,2024-01-01T12:00:00Z\r\n')
+        assert self.names(reader.poll()) == ["Ann\nLee"]
+
+    def test_iter_new_advances_per_row(self):
+        """Test that iter_new() streams results and its offset follows each consumed row"""
+        self.repo.append_results(self.result(i) for i in range(3))
+        reader = self.tail.ResultsTailReader(self.path)
+        rows = reader.iter_new()
+        assert next(rows).user_name == "user0"
+        partial = reader.offset
+        assert 0 < partial < os.path.getsize(self.path)
+        rows.close()
+        assert self.names(self.tail.ResultsTailReader(self.path, offset=partial).poll()) == ["user1", "user2"]
+
+    def test_resume_from_offset(self):
+        """Test that a new reader resumes from a saved offset"""
+        self.repo.append_results(self.result(i) for i in range(2))
+        first = self.tail.ResultsTailReader(self.path)
+        first.poll()
+        self.repo.append_result(self.result(2))
+        assert self.names(self.tail.ResultsTailReader(self.path, offset=first.offset).poll()) == ["user2"]
+
+
+class TestBulkImport:
+    """Test cases for the parallel question importer"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.bulk = package_module("data.bulk_import")
+        self.repository = package_module("data.repository")
+        self.repository.clear_question_cache()
+        self.tmp_path = tmp_path
+        self.source = str(tmp_path / "source.csv")
+        self.out = str(tmp_path / "clean.csv")
+        self.report = str(tmp_path / "rejects.csv")
+        rows = []
+        for i in range(60):
+            # Long quoted texts with embedded newlines and quotes, so shard targets
+            # fall inside multi-line fields
+            text = f'Question {i}\nsays "hello"\n' + "x" * (i % 7) * 10
+            rows.append([f"q{i}", text, "A||B||C", str(i % 3), "Ethics", "easy"])
+        rows[5][1] = "  "
+        rows[17][2] = "Only one"
+        rows[23][3] = "first"
+        rows[41][3] = "7"
+        with open(self.source, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "text", "choices", "correct_index", "category", "difficulty"])
+            writer.writerows(rows)
+        yield
+        self.repository.clear_question_cache()
+    
+    def load(self, path):
+        return self.repository.CSVRepository(path, "").load_questions()
+    
+    def test_record_ends_skip_quoted_newlines(self, monkeypatch):
+        """Test that a target inside a multi-line field moves to the end of that record"""
+        monkeypatch.setattr(self.bulk, "_SCAN_CHUNK", 7)
+        with open(self.source, "rb") as f:
+            data = f.read()
+        _, data_start = self.bulk._read_header(self.source)
+        inside = data.index(b'says ""hello""', data_start)
+        (end,) = self.bulk._record_ends(self.source, data_start, [inside])
+        assert data[end:].startswith(b"q1,")
+    
+    def test_shards_parse_like_the_whole_file(self, monkeypatch):
+        """Test that every shard boundary is a record boundary"""
+        monkeypatch.setattr(self.bulk, "_SCAN_CHUNK", 13)
+        header, data_start = self.bulk._read_header(self.source)
+        bounds = self.bulk._shard_bounds(self.source, data_start, 25)
+        assert len(bounds) > 10
+        with open(self.source, "rb") as f:
+            data = f.read()
+        rows = []
+        for start, end in zip(bounds, bounds[1:]):
+            rows += list(csv.reader(io.StringIO(data[start:end].decode("utf-8"), newline="")))
+        with open(self.source, newline="", encoding="utf-8") as f:
+            assert rows == list(csv.reader(f))[1:]
+    
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_output_matches_load_questions(self, workers):
+        """Test that the clean bank holds exactly what load_questions() keeps from the source"""
+        summary = self.bulk.bulk_import(self.source, self.out, self.report, workers=workers)
+        assert (summary.rows, summary.accepted, summary.rejected) == (60, 56, 4)
+        assert (summary.shards > 1) == (workers > 1)
+        assert self.load(self.out) == self.load(self.source)
+    
+    def test_rejection_report(self):
+        """Test that each rejected row is reported with its data row number, id and reason"""
+        summary = self.bulk.bulk_import(self.source, self.out, self.report, workers=3)
+        with open(self.report, newline="", encoding="utf-8") as f:
+            report = list(csv.reader(f))
+        assert report == [
+            ["row", "id", "reason"],
+            ["6", "q5", "empty text"],
+            ["18", "q17", "fewer than 2 choices"],
+            ["24", "q23", "correct_index is not an integer"],
+            ["42", "q41", "correct_index out of range"],
+        ]
+        assert summary.reasons == {"empty text": 1, "fewer than 2 choices": 1,
+                                   "correct_index is not an integer": 1, "correct_index out of range": 1}
+
+
+# BINARY REPOSITORY TESTS
+
+
+class TestBinaryRepository:
+    """Test cases for the fixed-width, memory-mapped results backend"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.binary = package_module("data.binary_repository")
+        self.models = package_module("logic.models")
+        self.stats = package_module("logic.stats")
+        self.tmp_path = tmp_path
+        self.path = str(tmp_path / "results.bin")
+        self.repo = self.binary.BinaryRepository("", self.path)
+        self.results = [
+            self.models.Result("alice", 3, 4, 12.5, "2024-01-02T10:00:00Z"),
+            self.models.Result("bob", 4, 4, 9.0, "2024-01-01T10:00:00Z"),
+            self.models.Result(None, 1, 4, 30.25, "2024-01-03T10:00:00Z"),
+            self.models.Result("alice", 2, 4, 15.0, "2024-01-04T10:00:00Z"),
+        ]
+    
+    def test_append_and_load_round_trip(self):
+        """Test that single and batched appends read back unchanged, in order"""
+        assert self.repo.load_results() == []
+        self.repo.append_result(self.results[0])
+        self.repo.append_results(self.results[1:])
+        assert self.repo.load_results() == self.results
+        assert self.repo.count_results() == 4
+        assert list(self.repo.iter_results(offset=1, limit=2)) == self.results[1:3]
+    
+    def test_long_names_are_truncated_cleanly(self):
+        """Test that names longer than NAME_WIDTH bytes are cut on a character boundary"""
+        name = "é" * self.binary.NAME_WIDTH
+        self.repo.append_result(self.models.Result(name, 1, 1, 1.0, "2024-01-01T00:00:00Z"))
+        stored = self.repo.load_results()[0].user_name
+        assert name.startswith(stored)
+        assert len(stored.encode("utf-8")) <= self.binary.NAME_WIDTH
+        assert self.repo.results_for_user(name)[0].user_name == stored
+    
+    def test_results_for_user(self):
+        """Test that the user index returns every attempt by one user"""
+        self.repo.append_results(self.results)
+        assert self.repo.results_for_user("alice") == [self.results[0], self.results[3]]
+        assert self.repo.results_for_user("nobody") == []
+    
+    def test_results_between_is_inclusive_and_sorted(self):
+        """Test that the timestamp index answers inclusive ranges in time order"""
+        self.repo.append_results(self.results)
+        found = self.repo.results_between("2024-01-01T10:00:00Z", "2024-01-03T10:00:00Z")
+        assert found == [self.results[1], self.results[0], self.results[2]]
+        assert self.repo.results_between(start="2024-01-04") == [self.results[3]]
+        assert len(self.repo.results_between()) == 4
+    
+    def test_index_is_rebuilt_when_deleted(self):
+        """Test that queries still work after the .idx sidecar is removed"""
+        self.repo.append_results(self.results)
+        self.repo.results_for_user("alice")
+        os.remove(self.repo.index_path)
+        fresh = self.binary.BinaryRepository("", self.path)
+        assert fresh.results_for_user("alice") == [self.results[0], self.results[3]]
+        assert os.path.exists(fresh.index_path)
+    
+    def test_stale_index_is_rebuilt(self):
+        """Test that an index left over from a different file is not trusted"""
+        self.repo.append_results(self.results[:2])
+        self.repo.results_for_user("alice")
+        other = self.binary.BinaryRepository("", str(self.tmp_path / "other.bin"))
+        other.append_results(reversed(self.results))
+        os.replace(other.results_path, self.path)
+        fresh = self.binary.BinaryRepository("", self.path)
+        assert fresh.results_for_user("bob") == [self.results[1]]
+        assert fresh.results_for_user("alice") == [self.results[3], self.results[0]]
+        assert self.repo.results_between(end="2024-01-01T23:59:59Z") == [self.results[1]]
+    
+    def test_unordered_appends_merge_into_the_index(self):
+        """Test that batches of out-of-order timestamps and names are merged correctly"""
+        rng = random.Random(5)
+        saved = []
+        for _ in range(4):
+            batch = [self.models.Result(f"user{rng.randrange(6)}", 1, 4, 1.0,
+                                        f"2024-01-{rng.randrange(1, 29):02d}T{rng.randrange(24):02d}:00:00Z")
+                     for _ in range(150)]
+            self.repo.append_results(batch)
+            saved += batch
+            assert self.repo.results_for_user("user3") == [r for r in saved if r.user_name == "user3"]
+            expected = sorted((r for r in saved if "2024-01-05" <= r.timestamp <= "2024-01-20T12:00:00Z"),
+                              key=lambda r: r.timestamp)
+            assert self.repo.results_between("2024-01-05", "2024-01-20T12:00:00Z") == expected
+        fresh = self.binary.BinaryRepository("", self.path)
+        assert fresh.results_for_user("user0") == [r for r in saved if r.user_name == "user0"]
+    
+    def test_index_checkpoint_is_amortized(self):
+        """Test that a query after a single append doesn't rewrite the whole index"""
+        self.repo.append_results(self.results * 50)
+        self.repo.results_for_user("alice")
+        before = os.stat(self.repo.index_path).st_mtime_ns
+        alice = 100
+        for r in self.results:
+            self.repo.append_result(r)
+            alice += r.user_name == "alice"
+            assert len(self.repo.results_for_user("alice")) == alice
+        assert os.stat(self.repo.index_path).st_mtime_ns == before
+        # A new instance indexes the records the checkpoint doesn't cover
+        fresh = self.binary.BinaryRepository("", self.path)
+        assert len(fresh.results_for_user("alice")) == alice
+    
+    def test_unwritable_index_does_not_break_queries(self, monkeypatch):
+        """Test that queries still answer when the sidecar can't be written"""
+        def fail(*args):
+            raise PermissionError("read-only")
+        monkeypatch.setattr(self.binary.os, "replace", fail)
+        self.repo.append_results(self.results)
+        assert self.repo.results_for_user("alice") == [self.results[0], self.results[3]]
+        assert not os.path.exists(self.repo.index_path)
+    
+    def test_old_json_index_is_rebuilt(self):
+        """Test that a JSON index written by an earlier version is replaced"""
+        self.repo.append_results(self.results)
+        with open(self.repo.index_path, "w", encoding="utf-8") as f:
+            json.dump({"count": 4, "by_user": {}, "time_keys": [], "time_records": []}, f)
+        fresh = self.binary.BinaryRepository("", self.path)
+        assert fresh.results_for_user("bob") == [self.results[1]]
+    
+    def test_stats_match_recompute(self):
+        """Test that running statistics agree with the stored records"""
+        self.repo.append_results(self.results)
+        self.repo.append_result(self.results[1])
+        recomputed = self.stats.ResultStats.from_results(self.repo.load_results())
+        assert self.repo.result_stats().to_dict() == recomputed.to_dict()
+
+
+
+# SQLITE REPOSITORY TESTS
+
+
+class TestSQLiteRepository:
+    """Test cases for the SQLite backend on a temporary database"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.sqlite_repository = package_module("data.sqlite_repository")
+        self.models = package_module("logic.models")
+        self.tmp_path = tmp_path
+        self.db_path = str(tmp_path / "quiz.db")
+        self.repo = self.sqlite_repository.SQLiteRepository(self.db_path)
+        Result = self.models.Result
+        self.results = [
+            Result("alice", 3, 4, 12.5, "2024-01-02T10:00:00Z"),
+            Result("bob", 4, 4, 20.0, "2024-01-01T10:00:00Z"),
+            Result(None, 4, 4, 9.0, "2024-01-02T18:00:00Z"),
+            Result("alice", 1, 4, 15.0, "2024-01-01T09:00:00Z"),
+        ]
+        yield
+        self.repo.close()
+    
+    def test_schema_and_wal_mode(self):
+        """Test that every table and index is created and WAL is on"""
+        conn = self.repo._conn()
+        names = {name for (name,) in conn.execute("SELECT name FROM sqlite_master")}
+        assert {"questions", "results", "answers", "question_stats", "question_option_counts",
+                "idx_results_user", "idx_results_timestamp", "idx_results_leaderboard"} <= names
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    
+    def test_questions_round_trip(self):
+        """Test that replace_questions stores the bank in order with every field"""
+        Question = self.models.Question
+        bank = [Question("q1", "One?", ["A", "B"], 1, "Ethics", "easy"), Question("q2", "Two?", ["C", "D", "E"], 0)]
+        assert self.repo.replace_questions(bank) == 2
+        assert self.repo.load_questions() == bank
+        self.repo.replace_questions(bank[1:])
+        assert self.repo.load_questions() == bank[1:]
+    
+    def test_results_round_trip_and_paging(self):
+        """Test that results load in save order and pages are windows of it"""
+        self.repo.append_result(self.results[0])
+        self.repo.append_results(self.results[1:])
+        assert self.repo.load_results() == self.results
+        assert list(self.repo.iter_results(offset=1, limit=2)) == self.results[1:3]
+        assert self.repo.count_results() == 4
+    
+    def test_top_n(self):
+        """Test that the leaderboard orders by score, then by time"""
+        self.repo.append_results(self.results)
+        assert self.repo.top_n(2) == [self.results[2], self.results[1]]
+        assert len(self.repo.top_n()) == 4
+    
+    def test_results_for_user_and_between(self):
+        """Test the per-user and timestamp-range queries"""
+        self.repo.append_results(self.results)
+        assert self.repo.results_for_user("alice") == [self.results[3], self.results[0]]
+        assert self.repo.results_for_user(None) == [self.results[2]]
+        assert self.repo.results_between("2024-01-02", "2024-01-02T12:00:00Z") == [self.results[0]]
+        assert self.repo.results_between(end="2024-01-01T09:00:00Z") == [self.results[3]]
+    
+    def test_attempts_per_day(self):
+        """Test that attempts are counted per calendar day"""
+        self.repo.append_results(self.results)
+        assert self.repo.attempts_per_day() == {"2024-01-01": 2, "2024-01-02": 2}
+    
+    def test_answers_and_question_stats(self):
+        """Test that logged answers update the per-question counters"""
+        Answer = self.models.Answer
+        answers = [Answer("a", "t1", "q1", 0, True, 2.0, 7), Answer("b", "t2", "q1", None, False, 1.0)]
+        assert self.repo.append_answers(answers) == 2
+        assert list(self.repo.iter_answers()) == answers
+        q1 = self.repo.question_stats()["q1"]
+        assert (q1.attempts, q1.correct, q1.skipped, q1.option_counts) == (2, 1, 1, {0: 1})
+    
+    def test_import_csv(self):
+        """Test that CSV files are imported, skipping malformed rows like CSVRepository"""
+        questions = self.tmp_path / "questions.csv"
+        questions.write_text("id,text,choices,correct_index,category\n"
+                             "q1,One?,A||B,0,Ethics\nq2,,A||B,0,\nq3,Three?,A||B,1,\n", encoding="utf-8")
+        results = self.tmp_path / "results.csv"
+        results.write_text("user_name,score,total_questions,time_taken,timestamp\n"
+                           "ann,1,2,3.5,2024-01-01T00:00:00Z\nbad,x,2,1,2024-01-01T00:00:00Z\n", encoding="utf-8")
+        assert self.repo.import_csv(str(questions), str(results)) == (2, 1)
+        assert [q.id for q in self.repo.load_questions()] == ["q1", "q3"]
+        assert self.repo.load_questions()[0].category == "Ethics"
+        assert self.repo.load_results()[0].user_name == "ann"
+    
+    def test_connection_per_thread(self):
+        """Test that each thread gets its own pooled connection, reused within the thread"""
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(self.repo._conn()))
+        thread.start()
+        thread.join()
+        assert self.repo._conn() is self.repo._conn()
+        assert seen[0] is not self.repo._conn()
+        assert len(self.repo._connections) == 2
+        self.repo.close()
+        assert self.repo._connections == []
+        self.repo.append_result(self.results[0])  # reconnects after close
+        assert self.repo.count_results() == 1
+    
+    def test_old_schema_is_migrated(self):
+        """Test that a database created before the added columns gains them and keeps its data"""
+        self.repo.close()
+        old_path = str(self.tmp_path / "old.db")
+        conn = sqlite3.connect(old_path)
+        conn.executescript("""
+            CREATE TABLE questions (position INTEGER PRIMARY KEY, id TEXT NOT NULL, text TEXT NOT NULL,
+                                    choices TEXT NOT NULL, correct_index INTEGER NOT NULL);
+            CREATE TABLE answers (rowid INTEGER PRIMARY KEY, user_name TEXT NOT NULL, timestamp TEXT NOT NULL,
+                                  question_id TEXT NOT NULL, selected_index INTEGER, correct INTEGER NOT NULL,
+                                  dwell_time REAL NOT NULL);
+            INSERT INTO questions (id, text, choices, correct_index) VALUES ('q1', 'Old?', 'A||B', 1);
+            INSERT INTO answers (user_name, timestamp, question_id, selected_index, correct, dwell_time)
+                VALUES ('ann', 't', 'q1', 1, 1, 2.5);
+        """)
+        conn.commit()
+        conn.close()
+        
+        repo = self.sqlite_repository.SQLiteRepository(old_path)
+        try:
+            assert repo.load_questions() == [self.models.Question("q1", "Old?", ["A", "B"], 1)]
+            assert list(repo.iter_answers())[0].seed is None
+            repo.append_answers([self.models.Answer("bob", "t2", "q1", 0, False, 1.0, 42)])
+            assert list(repo.iter_answers())[1].seed == 42
+        finally:
+            repo.close()
+        # Opening an already-migrated database is a no-op
+        self.sqlite_repository.SQLiteRepository(old_path).close()
+
+
+
+# METRICS TESTS
+
+
+@pytest.fixture
+def collecting():
+    """Enable metrics for one test, starting from nothing"""
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+class TestMetrics:
+    """Test cases for the optional metrics layer"""
+    
+    def test_disabled_collects_nothing(self):
+        """Test that timed functions and counters are no-ops while disabled"""
+        metrics.reset()
+        
+        @metrics.timed("noop")
+        def noop():
+            return 42
+        
+        assert noop() == 42
+        metrics.count("c")
+        assert metrics.snapshot() == {"counters": {}, "timers": {}}
+    
+    def test_timers_and_counters(self, collecting):
+        """Test that calls are timed and counted once enabled"""
+        @metrics.timed("work")
+        def work():
+            return "done"
+        
+        work()
+        work()
+        with metrics.timer("block"):
+            pass
+        metrics.count("things", 3)
+        snap = metrics.snapshot()
+        assert snap["timers"]["work"]["count"] == 2
+        assert snap["timers"]["block"]["count"] == 1
+        assert snap["counters"] == {"things": 3}
+    
+    def test_session_is_instrumented(self, collecting):
+        """Test that a headless session records quiz and session metrics"""
+        questions = [Question(id="q1", text="Q?", options=["A", "B"], correct_index=0)]
+        run_scripted_session(QuizSession(MemoryRepository(questions), HeadlessFrontEnd()), "Ann", lambda q: 0)
+        snap = metrics.snapshot()
+        assert snap["counters"] == {"session.answers": 1, "session.completed": 1}
+        assert snap["timers"]["quiz.start"]["count"] == 1
+        assert snap["timers"]["quiz.finish"]["count"] == 1
+    
+    def test_prometheus_format(self, collecting):
+        """Test counter and summary names in the Prometheus text output"""
+        metrics.count("session.completed")
+        metrics.record("repo.load_questions", 0.25)
+        text = metrics.to_prometheus()
+        assert "quiz_session_completed_total 1" in text
+        assert "quiz_repo_load_questions_seconds_count 1" in text
+        assert "quiz_repo_load_questions_seconds_sum 0.250000000" in text
+    
+    def test_export_json(self, collecting, tmp_path):
+        """Test that export() writes JSON unless the file ends in .prom"""
+        metrics.count("c")
+        path = tmp_path / "metrics.json"
+        metrics.export(str(path))
+        assert json.loads(path.read_text())["counters"] == {"c": 1}
+    
+    def test_session_profiler_captures_once(self, tmp_path):
+        """Test that only the first start/stop pair is profiled"""
+        path = tmp_path / "session.prof"
+        profiler = metrics.SessionProfiler(str(path))
+        profiler.start()
+        sum(range(1000))
+        profiler.stop()
+        assert path.exists()
+        path.unlink()
+        profiler.start()
+        profiler.stop()
+        assert not path.exists()
+
+
+
+# BENCHMARK BASELINE TESTS
+
+
+class TestBenchmarkBaseline:
+    """Test cases for saving benchmark baselines and detecting regressions"""
+    
+    BASE = {"load_questions/1k": {"latency_s": 0.010, "throughput": 100_000.0, "peak_bytes": 1000}}
+    
+    def test_within_threshold_passes(self):
+        """Test that changes inside the threshold are not regressions"""
+        current = {"load_questions/1k": {"latency_s": 0.011, "throughput": 95_000.0, "peak_bytes": 1100}}
+        assert compare(self.BASE, current, threshold=0.2) == []
+    
+    def test_slower_and_larger_fail(self):
+        """Test that higher latency/memory and lower throughput are regressions"""
+        current = {"load_questions/1k": {"latency_s": 0.020, "throughput": 50_000.0, "peak_bytes": 2000}}
+        regressions = compare(self.BASE, current, threshold=0.2)
+        assert len(regressions) == 3
+        assert regressions[0].startswith("load_questions/1k latency_s")
+    
+    def test_improvements_and_new_cases_pass(self):
+        """Test that faster runs and cases missing from the baseline never fail"""
+        current = {
+            "load_questions/1k": {"latency_s": 0.001, "throughput": 1e6, "peak_bytes": 10},
+            "session/1k": {"latency_s": 99.0},
+        }
+        assert compare(self.BASE, current) == []
+    
+    def test_baseline_round_trip(self, tmp_path):
+        """Test that save_baseline() and load_baseline() keep the measurements"""
+        path = str(tmp_path / "baseline.json")
+        save_baseline(path, self.BASE, meta={"python": "3.x"})
+        assert load_baseline(path) == self.BASE
+
+
+
+# STARTUP IMPORT TESTS
+
+
+@pytest.fixture(scope="module")
+def times():
+    """Cumulative import times of main, measured once in a fresh interpreter"""
+    if not PACKAGE.name.isidentifier():
+        pytest.skip("package folder name is not importable")
+    pytest.importorskip("tkinter")
+    return profile_imports(f"{PACKAGE.name}.main", cwd=str(PACKAGE.parent))
+
+
+class TestStartupImports:
+    """Test that importing main stays cheap enough to show the window quickly"""
+    
+    def test_later_screens_and_data_layer_are_lazy(self, times):
+        """Test that only the welcome screen and metrics are imported before the window appears"""
+        pkg = PACKAGE.name
+        eager = {"gui.welcome_screen", "logic.metrics"}
+        for folder in ("gui", "logic", "data"):
+            for path in (PACKAGE / folder).glob("*.py"):
+                module = f"{folder}.{path.stem}"
+                assert (f"{pkg}.{module}" in times) == (module in eager), module
+        assert "tkinter.messagebox" not in times
+        assert "sqlite3" not in times and "mmap" not in times
+    
+    @pytest.mark.skipif(not os.environ.get("QUIZ_TIMING_TESTS"),
+                        reason="wall-clock check; set QUIZ_TIMING_TESTS=1 to run it on a quiet machine")
+    def test_import_time_budget(self, times):
+        """Test that importing main takes well under the 500 ms transition budget"""
+        assert times[f"{PACKAGE.name}.main"] < 250_000
+
+
+
 # INTEGRATION TESTS
 
 